@@ -8,13 +8,19 @@ from datetime import timedelta
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .component_api import ComponentApi
-from .const import DOMAIN, LOGGER
+from .const import DOMAIN, LOGGER, STORAGE_KEY_SNAPSHOT
+from .hass_util import StorageJson
+from .live_stats import async_setup_websocket
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 
 # ------------------------------------------------------------------
 # ------------------------------------------------------------------
@@ -30,6 +36,15 @@ class CommonData:
 type CommonConfigEntry = ConfigEntry[CommonData]
 
 
+# ------------------------------------------------------------------
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up Docker status, the websocket commands are shared by the entries."""
+
+    async_setup_websocket(hass)
+
+    return True
+
+
 # ------------------------------------------------------------------
 async def async_setup_entry(hass: HomeAssistant, entry: CommonConfigEntry) -> bool:
     """Set up Docker status from a config entry."""
@@ -51,8 +66,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: CommonConfigEntry) -> bo
 
     component_api.coordinator = coordinator
 
-    await coordinator.async_config_entry_first_refresh()
+    await component_api.async_init()
     entry.async_on_unload(entry.add_update_listener(config_update_listener))
+    entry.async_on_unload(component_api.stop_events_streams)
+    entry.async_on_unload(component_api.refresh_arbiter.cancel)
+    entry.async_on_unload(component_api.live_stats.async_stop)
 
     entry.runtime_data = CommonData(
         component_api=component_api,
@@ -61,6 +79,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: CommonConfigEntry) -> bo
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Engines are connected and collected in the background, so setup doesn't
+    # depend on the slowest or an unreachable engine.
+    entry.async_create_background_task(
+        hass, component_api.async_start(), f"{DOMAIN} start"
+    )
+
     return True
 
 
@@ -70,6 +94,14 @@ async def async_unload_entry(hass: HomeAssistant, entry: CommonConfigEntry) -> b
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
+# ------------------------------------------------------------------
+async def async_remove_entry(hass: HomeAssistant, entry: CommonConfigEntry) -> None:
+    """Remove persisted data when a config entry is removed."""
+    await StorageJson(
+        hass, f"{STORAGE_KEY_SNAPSHOT}.{entry.entry_id}"
+    ).async_remove_settings()
+
+
 # ------------------------------------------------------------------
 async def async_reload_entry(hass: HomeAssistant, entry: CommonConfigEntry) -> None:
     """Reload config entry."""
@@ -82,7 +114,9 @@ async def config_update_listener(
     hass: HomeAssistant,
     config_entry: CommonConfigEntry,
 ) -> None:
-    """Reload on config entry update."""
+    """Reload on config entry update.
+
+    The reloaded entry collects on its own start, so no update is asked for.
+    """
 
     await hass.config_entries.async_reload(config_entry.entry_id)
-    await config_entry.runtime_data.component_api.async_update()
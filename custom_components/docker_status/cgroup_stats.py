@@ -0,0 +1,213 @@
+"""Container CPU and memory read directly from the cgroup filesystem.
+
+Used for the local Docker engine, where reading the cgroup files is much
+cheaper than an api stats call per container. Both cgroup v1 and v2 layouts
+are supported. The reader is blocking and should be run in the executor.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import os
+from pathlib import Path
+import time
+
+CGROUP_ROOT = "/sys/fs/cgroup"
+
+# -- Cgroup directories of a container, relative to the root or controller
+CGROUP_V2_CONTAINER_DIRS: list[str] = [
+    "system.slice/docker-{id}.scope",
+    "docker/{id}",
+    "docker.slice/docker-{id}.scope",
+]
+CGROUP_V1_CONTAINER_DIRS: list[str] = [
+    "docker/{id}",
+    "system.slice/docker-{id}.scope",
+]
+CGROUP_V1_CPU_CONTROLLERS: list[str] = ["cpuacct", "cpu,cpuacct", "cpu"]
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass
+class CgroupPaths:
+    """Cgroup files of a container."""
+
+    cpu_usage: Path
+    memory_usage: Path
+    cpu_usage_in_usec: bool
+    memory_stat: Path | None = None
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass
+class CgroupSample:
+    """Cgroup counters read at a point in time."""
+
+    time_ns: int
+    cpu_usage_ns: int
+    memory_usage: int
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class CgroupStatsReader:
+    """Read container CPU and memory usage from the cgroup filesystem.
+
+    Container ids are mapped to their cgroup files once. Each read returns
+    the CPU % since the previous read, relative to the whole host, and the
+    current memory usage.
+    """
+
+    def __init__(
+        self,
+        root: str | Path = CGROUP_ROOT,
+        cpu_count: int | None = None,
+        clock: Callable[[], int] = time.monotonic_ns,
+    ) -> None:
+        """Init."""
+        self.root: Path = Path(root)
+        self.cpu_count: int = cpu_count or os.cpu_count() or 1
+        self.clock: Callable[[], int] = clock
+        self.version: int = 2 if (self.root / "cgroup.controllers").exists() else 1
+        self.paths: dict[str, CgroupPaths | None] = {}
+        self.samples: dict[str, CgroupSample] = {}
+
+    # ------------------------------------------------------------------
+    def is_available(self) -> bool:
+        """Is the cgroup filesystem available."""
+
+        return self.root.is_dir()
+
+    # ------------------------------------------------------------------
+    def find_paths(self, container_id: str) -> CgroupPaths | None:
+        """Find the cgroup files of a container."""
+
+        if self.version == 2:
+            for container_dir in CGROUP_V2_CONTAINER_DIRS:
+                path: Path = self.root / container_dir.format(id=container_id)
+
+                if (path / "cpu.stat").exists():
+                    return CgroupPaths(
+                        path / "cpu.stat",
+                        path / "memory.current",
+                        True,
+                        path / "memory.stat",
+                    )
+
+            return None
+
+        memory_path: Path | None = None
+
+        for container_dir in CGROUP_V1_CONTAINER_DIRS:
+            path = self.root / "memory" / container_dir.format(id=container_id)
+
+            if (path / "memory.usage_in_bytes").exists():
+                memory_path = path / "memory.usage_in_bytes"
+                break
+
+        if memory_path is None:
+            return None
+
+        for controller in CGROUP_V1_CPU_CONTROLLERS:
+            for container_dir in CGROUP_V1_CONTAINER_DIRS:
+                path = self.root / controller / container_dir.format(id=container_id)
+
+                if (path / "cpuacct.usage").exists():
+                    return CgroupPaths(
+                        path / "cpuacct.usage",
+                        memory_path,
+                        False,
+                        memory_path.parent / "memory.stat",
+                    )
+
+        return None
+
+    # ------------------------------------------------------------------
+    def read_sample(self, paths: CgroupPaths) -> CgroupSample:
+        """Read the counters of a container."""
+
+        if paths.cpu_usage_in_usec:
+            cpu_usage_ns: int = 0
+
+            for line in paths.cpu_usage.read_text(encoding="ascii").splitlines():
+                key, _, value = line.partition(" ")
+
+                if key == "usage_usec":
+                    cpu_usage_ns = int(value) * 1000
+                    break
+        else:
+            cpu_usage_ns = int(paths.cpu_usage.read_text(encoding="ascii"))
+
+        memory_usage_text: str = paths.memory_usage.read_text(encoding="ascii").strip()
+        memory_usage: int = 0 if memory_usage_text == "max" else int(memory_usage_text)
+
+        # Page cache is left out, as docker stats does
+        if paths.memory_stat is not None:
+            inactive_file_key: str = (
+                "inactive_file" if paths.cpu_usage_in_usec else "total_inactive_file"
+            )
+
+            for line in paths.memory_stat.read_text(encoding="ascii").splitlines():
+                key, _, value = line.partition(" ")
+
+                if key == inactive_file_key:
+                    if int(value) < memory_usage:
+                        memory_usage -= int(value)
+                    break
+
+        return CgroupSample(self.clock(), cpu_usage_ns, memory_usage)
+
+    # ------------------------------------------------------------------
+    def read(self, container_ids: list[str]) -> dict[str, tuple[float, int]]:
+        """Read CPU % and memory usage for containers.
+
+        Only containers with a previous sample are returned, so the CPU %
+        can be calculated. Containers not found in the cgroup filesystem are
+        left out as well and should be read via the api.
+        """
+
+        usage: dict[str, tuple[float, int]] = {}
+        samples: dict[str, CgroupSample] = {}
+
+        for container_id in container_ids:
+            if container_id not in self.paths:
+                self.paths[container_id] = self.find_paths(container_id)
+
+            paths: CgroupPaths | None = self.paths[container_id]
+
+            if paths is None:
+                continue
+
+            try:
+                sample: CgroupSample = self.read_sample(paths)
+            except (OSError, ValueError):
+                # Container is gone or restarted with a new cgroup
+                self.paths.pop(container_id, None)
+                continue
+
+            samples[container_id] = sample
+            previous: CgroupSample | None = self.samples.get(container_id)
+
+            if previous is None or sample.time_ns <= previous.time_ns:
+                continue
+
+            cpu_delta: int = max(sample.cpu_usage_ns - previous.cpu_usage_ns, 0)
+            time_delta: int = (sample.time_ns - previous.time_ns) * self.cpu_count
+
+            usage[container_id] = (
+                cpu_delta / time_delta * 100.0,
+                sample.memory_usage,
+            )
+
+        # Forget containers no longer running
+        self.samples = samples
+        self.paths = {
+            container_id: self.paths[container_id]
+            for container_id in container_ids
+            if container_id in self.paths
+        }
+
+        return usage
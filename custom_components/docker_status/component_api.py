@@ -1,40 +1,525 @@
 """Component api."""
 
-from dataclasses import dataclass
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
-from typing import Any
+from functools import partial
+import heapq
+from math import ceil
+import re
+import time
+from typing import TYPE_CHECKING, Any
 
-import docker
-from docker import errors
-from docker.models.containers import Container
-from docker.models.images import Image
-from docker.models.volumes import Volume
+import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_SCAN_INTERVAL
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.helpers import issue_registry as ir
+from homeassistant.const import CONF_SCAN_INTERVAL, CONF_UNIQUE_ID, Platform
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import (
+    config_validation as cv,
+    entity_registry as er,
+    issue_registry as ir,
+)
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
+from .cgroup_stats import CgroupStatsReader
 from .const import (
+    ATTR_DRY_RUN,
+    ATTR_ENGINES,
+    ATTR_LABEL,
+    ATTR_SECTIONS,
+    ATTR_TIERS,
+    ATTR_UNTIL,
+    CONF_CHECK_FOR_IMAGES_UPDATES,
+    CONF_CHECK_FOR_UPDATED_IMAGES_HOURS,
+    CONF_CONTAINER_SENSORS,
+    CONF_CONTAINER_SENSORS_EXCLUDE,
+    CONF_CONTAINER_SENSORS_INCLUDE,
+    CONF_CONTAINER_SENSORS_MAX,
+    CONF_CPU_NORMALIZATION,
     CONF_DOCKER_ENGINE_URL,
     CONF_DOCKER_ENV_SENSOR_NAME,
+    CONF_EXCLUDE_LABELS,
+    CONF_EXCLUDE_NAMES,
+    CONF_EXCLUDE_PROJECTS,
+    CONF_FULL_SWEEP_INTERVAL,
+    CONF_GROUP_LABEL,
+    CONF_GROUP_SENSORS,
+    CONF_INCLUDE_LABELS,
+    CONF_INCLUDE_NAMES,
+    CONF_INCLUDE_PROJECTS,
+    CONF_LOCAL_CGROUP_STATS,
+    CONF_MAX_PARALLEL_STATS,
+    CONF_PROFILE,
+    CONF_ROLLING_WINDOW,
+    CONF_SENSOR_GROUPS,
     CONF_SENSORS,
+    CONF_STATS_BUDGET,
+    CONF_TIMEOUT,
+    CONF_TOP_N,
+    CPU_NORMALIZATION_CORE,
+    CPU_NORMALIZATION_HOST,
+    DEFAULT_CHECK_FOR_UPDATED_IMAGES,
+    DEFAULT_CONTAINER_SENSORS_MAX,
+    DEFAULT_CPU_NORMALIZATION,
+    DEFAULT_GROUP_LABEL,
+    DEFAULT_PROFILE,
+    DEFAULT_ROLLING_WINDOW,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SENSOR_GROUPS,
+    DEFAULT_TOP_N,
+    DIAGNOSTIC_SENSORS,
+    DOCKER_SENSORS,
+    DOCKER_SENSORS_SUM,
     DOMAIN,
     DOMAIN_NAME,
+    ENDPOINT_CONTAINERS,
+    ENDPOINT_DISK_USAGE,
+    ENDPOINT_IMAGE_UPDATES,
+    ENDPOINT_IMAGES,
+    ENDPOINT_IMAGES_DANGLING,
+    ENDPOINT_INTERVALS,
+    ENDPOINT_STATS,
+    ENDPOINT_VOLUMES,
+    EVENT_CONTAINER_IMAGE_CHANGED,
+    EVENT_CONTAINER_REMOVED,
+    EVENT_CONTAINER_STARTED,
+    EVENT_CONTAINER_STOPPED,
+    EVENTS_ATTRIBUTE_WINDOWS,
+    EVENTS_BUCKET_SECONDS,
+    EVENTS_BUCKETS,
+    EVENTS_RECENT,
+    EVENTS_WINDOW,
     LOGGER,
+    MAX_PARALLEL_REGISTRY_REQUESTS,
+    MAX_ROLLING_WINDOW_SAMPLES,
+    MIN_STATS_SAMPLE,
+    OVERRUN_TARGET_RATIO,
+    PROFILE_OVERRIDES,
+    PROFILES,
+    PRUNE_BUILD_CACHE,
+    PRUNE_CONTAINERS,
+    PRUNE_IMAGES,
+    PRUNE_NETWORKS,
+    PRUNE_REFRESH_ENDPOINTS,
+    PRUNE_TYPES,
+    PRUNE_VOLUMES,
+    REFRESH_DEBOUNCE,
+    REFRESH_TIERS,
+    RESTART_LOOP_THRESHOLD,
+    RESTART_LOOP_WINDOW,
+    SAMPLE_RATIO_MAX,
+    SAMPLE_RATIO_MIN,
+    SENSOR_BUILD_CACHE_SIZE,
+    SENSOR_COLLECTION_OVERRUNS,
+    SENSOR_CONTAINER_CPU_PERCENT,
+    SENSOR_CONTAINER_MEMORY_USAGE,
     SENSOR_CONTAINERS_CPU_PERCENT,
+    SENSOR_CONTAINERS_CRASHED,
     SENSOR_CONTAINERS_MEMORY_USAGE,
+    SENSOR_CONTAINERS_OOM_KILLED,
+    SENSOR_CONTAINERS_RESTART_LOOP,
+    SENSOR_CONTAINERS_RESTARTING,
     SENSOR_CONTAINERS_RUNNING,
+    SENSOR_CONTAINERS_SIZE,
+    SENSOR_CONTAINERS_STARTING,
     SENSOR_CONTAINERS_STOPPED,
+    SENSOR_CONTAINERS_UNHEALTHY,
+    SENSOR_ENDPOINTS,
+    SENSOR_EVENTS,
+    SENSOR_GROUPS,
+    SENSOR_HEALTH,
     SENSOR_IMAGES,
     SENSOR_IMAGES_DANGLING,
+    SENSOR_IMAGES_RECLAIMABLE,
+    SENSOR_IMAGES_SIZE,
     SENSOR_IMAGES_UNUSED,
+    SENSOR_IMAGES_WITH_UPDATES,
+    SENSOR_IO,
+    SENSOR_ROLLING,
+    SENSOR_SUM_SOURCES,
+    SENSOR_TOP_CPU_PERCENT,
+    SENSOR_TOP_MEMORY_USAGE,
     SENSOR_VOLUMES,
+    SENSOR_VOLUMES_SIZE,
     SENSOR_VOLUMES_UNUSED,
+    SNAPSHOT_SAVE_DELAY,
+    SNAPSHOT_SECTIONS,
+    SNAPSHOT_VERSION,
+    STORAGE_KEY_SNAPSHOT,
     TRANSLATION_KEY_CONNECTION_ERROR,
 )
-from .hass_util import async_hass_add_executor_job
+from .container_filter import ContainerFilter, compile_patterns
+from .docker_import import docker_exception
+from .engine_events import EventCounter, EventsStream
+from .hass_util import StorageJson, async_hass_add_executor_job
+from .image_updates import RegistryDigestResolver, local_digests, parse_image_reference
+from .live_stats import LiveStatsHub
+from .prune import (
+    PRUNE_FILTERS,
+    PruneCandidate,
+    build_filters,
+    dry_run_result,
+    parse_docker_time,
+    parse_prune_result,
+    parse_until,
+)
+from .refresh_arbiter import RefreshArbiter, RefreshRequest
+from .restart_loop import RestartLoopDetector
+from .ring_buffer import RingBuffer
+
+if TYPE_CHECKING:
+    from docker import DockerClient
+    from docker.models.containers import Container
+    from docker.models.images import Image
+    from docker.models.volumes import Volume
+
+
+PRUNE_FILTER_SCHEMAS: dict[str, Any] = {
+    ATTR_LABEL: vol.All(cv.ensure_list, [cv.string]),
+    ATTR_UNTIL: cv.string,
+}
+PRUNE_SERVICE_SCHEMAS: dict[str, vol.Schema] = {
+    prune_type: vol.Schema(
+        {
+            vol.Optional(ATTR_ENGINES): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(ATTR_DRY_RUN, default=False): cv.boolean,
+            **{
+                vol.Optional(prune_filter): PRUNE_FILTER_SCHEMAS[prune_filter]
+                for prune_filter in PRUNE_FILTERS[prune_type]
+            },
+        }
+    )
+    for prune_type in PRUNE_TYPES
+}
+UPDATE_SERVICE_SCHEMA: vol.Schema = vol.Schema(
+    {
+        vol.Optional(ATTR_ENGINES): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_TIERS): vol.All(
+            cv.ensure_list, [vol.In(list(REFRESH_TIERS))]
+        ),
+    }
+)
+GET_SNAPSHOT_SERVICE_SCHEMA: vol.Schema = vol.Schema(
+    {
+        vol.Optional(ATTR_ENGINES): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_SECTIONS): vol.All(
+            cv.ensure_list, [vol.In(list(SNAPSHOT_SECTIONS))]
+        ),
+    }
+)
+
+
+# ------------------------------------------------------------------
+def sensor_types_for_groups(sensor_groups: list[str]) -> list[str]:
+    """Sensor types belonging to the selected sensor groups."""
+
+    sensor_types: set[str] = {
+        sensor_type
+        for sensor_group in sensor_groups
+        for sensor_type in SENSOR_GROUPS.get(sensor_group, [])
+    }
+
+    return [
+        sensor_type for sensor_type in DOCKER_SENSORS if sensor_type in sensor_types
+    ]
+
+
+# ------------------------------------------------------------------
+def convert_bytes_to(byte_count: float) -> tuple[float, str]:
+    """Konverterer bytes til MB eller GB baseret på størrelsen."""
+    units: list[str] = ["B", "KB", "MB", "GB"]
+    size: float = float(byte_count)
+
+    for unit in units:
+        if size < 1024:
+            return (size, unit)
+        size /= 1024
+    return (size, units[0])  # Bytes
+
+
+# ------------------------------------------------------------------
+def read_io_counters(stats: dict) -> tuple[int, int, int, int]:
+    """Network RX/TX and disk read/write byte counters from container stats."""
+
+    networks: dict = stats.get("networks") or {}
+    io_service_bytes: list[dict] = (stats.get("blkio_stats") or {}).get(
+        "io_service_bytes_recursive"
+    ) or []
+
+    return (
+        sum(network.get("rx_bytes", 0) for network in networks.values()),
+        sum(network.get("tx_bytes", 0) for network in networks.values()),
+        sum(
+            entry.get("value", 0)
+            for entry in io_service_bytes
+            if str(entry.get("op", "")).lower() == "read"
+        ),
+        sum(
+            entry.get("value", 0)
+            for entry in io_service_bytes
+            if str(entry.get("op", "")).lower() == "write"
+        ),
+    )
+
+
+# ------------------------------------------------------------------
+def sensor_types_for_engine(sensor_config: dict[str, Any]) -> list[str]:
+    """Sensor types of an engine, from its sensor groups and options."""
+
+    sensor_types: list[str] = sensor_types_for_groups(
+        sensor_config.get(CONF_SENSOR_GROUPS, DEFAULT_SENSOR_GROUPS)
+    )
+
+    if sensor_config.get(CONF_CHECK_FOR_IMAGES_UPDATES, False):
+        sensor_types.append(SENSOR_IMAGES_WITH_UPDATES)
+
+    return sensor_types + DIAGNOSTIC_SENSORS
+
+
+# ------------------------------------------------------------------
+def cpu_count_for_normalization(cpu_stats: dict, cpu_normalization: str) -> int:
+    """Number of cpus the CPU % is multiplied by for a normalization mode."""
+
+    if cpu_normalization == CPU_NORMALIZATION_HOST:
+        return 1
+
+    percpu_count: int = len(cpu_stats["cpu_usage"].get("percpu_usage") or [])
+    online_cpus: int = cpu_stats.get("online_cpus") or 0
+
+    # percpu_usage is missing with cgroup v2, online_cpus on old engines
+    if cpu_normalization == CPU_NORMALIZATION_CORE:
+        return percpu_count or online_cpus or 1
+
+    return online_cpus or percpu_count or 1
+
+
+# ------------------------------------------------------------------
+def disk_usage_sizes(disk_usage: dict) -> dict[str, int]:
+    """Disk usage sensor values in bytes, calculated the way docker system df does.
+
+    Layers shared between images are only counted once in the images size,
+    and the reclaimable size leaves out the unique size of images in use.
+    Sizes the engine hasn't calculated are reported as -1 and left out.
+    """
+
+    images: list[dict] = disk_usage.get("Images") or []
+    layers_size: int = disk_usage.get("LayersSize") or 0
+    images_used: int = sum(
+        image["Size"] - image["SharedSize"]
+        for image in images
+        if image.get("Containers", 0) > 0
+        and image.get("Size", -1) != -1
+        and image.get("SharedSize", -1) != -1
+    )
+
+    return {
+        SENSOR_IMAGES_SIZE: layers_size,
+        SENSOR_IMAGES_RECLAIMABLE: max(layers_size - images_used, 0),
+        SENSOR_VOLUMES_SIZE: sum(
+            max((volume.get("UsageData") or {}).get("Size", -1), 0)
+            for volume in disk_usage.get("Volumes") or []
+        ),
+        SENSOR_CONTAINERS_SIZE: sum(
+            container.get("SizeRw") or 0
+            for container in disk_usage.get("Containers") or []
+        ),
+        SENSOR_BUILD_CACHE_SIZE: sum(
+            build_cache.get("Size") or 0
+            for build_cache in disk_usage.get("BuildCache") or []
+            if not build_cache.get("Shared", False)
+        ),
+    }
+
+
+# ------------------------------------------------------------------
+def rolling_statistic(buffer: RingBuffer, statistic: str) -> float:
+    """Statistic over the samples in a ring buffer."""
+
+    if statistic == "max":
+        return buffer.max()
+
+    if statistic == "p95":
+        return buffer.percentile(95)
+
+    return buffer.mean()
+
+
+# ------------------------------------------------------------------
+def estimate_usage_totals(
+    fresh: dict[str, tuple[float, ...]],
+    previous: dict[str, tuple[float, ...]],
+    cached: dict[str, tuple[float, ...]],
+    missing: int,
+    width: int = 2,
+) -> tuple[float, ...]:
+    """Usage totals, like CPU % and memory, when only some containers are sampled.
+
+    The cached usage of unsampled containers is scaled by how much the usage
+    of the sampled containers changed since they were last sampled, a ratio
+    estimate. Containers never sampled count as the mean of the sampled.
+    """
+
+    totals: list[float] = []
+
+    for index in range(width):
+        fresh_total: float = sum(usage[index] for usage in fresh.values())
+        previous_total: float = sum(
+            previous[container_id][index]
+            for container_id in fresh
+            if container_id in previous
+        )
+        ratio: float = 1.0
+
+        if previous_total > 0:
+            ratio = min(
+                max(
+                    sum(
+                        usage[index]
+                        for container_id, usage in fresh.items()
+                        if container_id in previous
+                    )
+                    / previous_total,
+                    SAMPLE_RATIO_MIN,
+                ),
+                SAMPLE_RATIO_MAX,
+            )
+
+        totals.append(
+            fresh_total
+            + ratio * sum(usage[index] for usage in cached.values())
+            + (missing * fresh_total / len(fresh) if fresh else 0)
+        )
+
+    return tuple(totals)
+
+
+# ------------------------------------------------------------------
+def resolve_profile(sensor_config: dict[str, Any]) -> dict[str, int]:
+    """Collection profile for an engine, preset values with user overrides."""
+
+    profile: dict[str, int] = dict(
+        PROFILES.get(
+            sensor_config.get(CONF_PROFILE, DEFAULT_PROFILE), PROFILES[DEFAULT_PROFILE]
+        )
+    )
+
+    for key in PROFILE_OVERRIDES:
+        if sensor_config.get(key) is not None:
+            profile[key] = int(sensor_config[key])
+
+    return profile
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass
+class ContainerStats:
+    """Stats for a single container."""
+
+    container_id: str
+    cpu_percent: float = 0.0
+    memory_usage: int = 0
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass
+class ContainerState:
+    """State of a container as of the last listing."""
+
+    name: str
+    running: bool
+    image: str
+    image_id: str
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass
+class EngineContainer:
+    """A container of the whole engine, filters aside.
+
+    Images and volumes are in use, and containers are pruned, by the engine
+    regardless of the container filters, so these are kept for all.
+    """
+
+    container_id: str
+    image_id: str
+    volume_names: list[str]
+    status: str
+    created: float
+    labels: dict[str, str]
+
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_container(cls, container: Container) -> EngineContainer:
+        """From an inspected container."""
+
+        return cls(
+            container.id,
+            container.attrs.get("Image", ""),
+            [
+                mount.get("Name", "")
+                for mount in container.attrs.get("Mounts") or []
+                if mount.get("Type", "") == "volume"
+            ],
+            container.status,
+            parse_docker_time(container.attrs.get("Created")),
+            container.labels or {},
+        )
+
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_listing(cls, item: dict[str, Any]) -> EngineContainer:
+        """From an item of the container listing, which isn't inspected."""
+
+        return cls(
+            item.get("Id", ""),
+            item.get("ImageID", ""),
+            [
+                mount.get("Name", "")
+                for mount in item.get("Mounts") or []
+                if mount.get("Type", "") == "volume"
+            ],
+            item.get("State", ""),
+            float(item.get("Created") or 0),
+            item.get("Labels") or {},
+        )
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass
+class GroupStats:
+    """Containers and usage of a Compose project or label group."""
+
+    running: list[str] = field(default_factory=list)
+    stopped: list[str] = field(default_factory=list)
+    cpu_percent: float = 0.0
+    memory_usage: int = 0
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass
+class IoSample:
+    """Network and disk I/O counters of a container at a point in time."""
+
+    time: float
+    counters: tuple[int, int, int, int]
+    rates: tuple[float, ...] | None = None
 
 
 # ------------------------------------------------------------------
@@ -43,19 +528,199 @@ from .hass_util import async_hass_add_executor_job
 class DockerData:
     """Docker data."""
 
-    def __init__(self, sensor_name: str, engine_url: str) -> None:
+    def __init__(
+        self,
+        sensor_name: str,
+        engine_url: str,
+        unique_id: str = "",
+        sensor_groups: list[str] | None = None,
+        profile: dict[str, int] | None = None,
+        local_cgroup_stats: bool = False,
+        cpu_normalization: str = DEFAULT_CPU_NORMALIZATION,
+    ) -> None:
         """Docker data."""
         self.sensor_name: str = sensor_name
         self.engine_url: str = engine_url
+        self.unique_id: str = unique_id
+        self.sensor_types: list[str] = sensor_types_for_groups(
+            DEFAULT_SENSOR_GROUPS if sensor_groups is None else sensor_groups
+        )
+        self.profile: dict[str, int] = (
+            resolve_profile({}) if profile is None else profile
+        )
+        self.local_cgroup_stats: bool = local_cgroup_stats
+        self.cpu_normalization: str = cpu_normalization
+        self.container_sensors: bool = False
+        self.container_sensors_max: int = DEFAULT_CONTAINER_SENSORS_MAX
+        self.container_sensors_include: re.Pattern | None = None
+        self.container_sensors_exclude: re.Pattern | None = None
+        self.container_filter: ContainerFilter = ContainerFilter()
+        self.group_sensors: bool = False
+        self.group_label: str = DEFAULT_GROUP_LABEL
+        self.groups: dict[str, GroupStats] = {}
+        self.container_groups: dict[str, str] = {}
+        self.container_stats: dict[str, ContainerStats] = {}
+        self.container_usage: dict[str, tuple[float, int]] = {}
+        self.rolling: dict[str, RingBuffer] = {}
+        self.container_rolling: dict[str, dict[str, RingBuffer]] = {}
+        self.io_samples: dict[str, IoSample] = {}
+        self.cgroup_reader: CgroupStatsReader | None = None
+        self.live_cgroup_reader: CgroupStatsReader | None = None
+        self.live_usage: dict[str, tuple[float, int]] = {}
+        self.live_lock: asyncio.Lock = asyncio.Lock()
+        self.collection_plan: set[str] = set()
+        self.last_collected: dict[str, datetime] = {}
+        self.last_updated: datetime | None = None
+        self.stale: bool = False
         self.connection_error: bool = False
+        self.collection_error: bool = False
+        self.update_lock: asyncio.Lock = asyncio.Lock()
 
-        self.client: docker.DockerClient
+        self.client: DockerClient | None = None
         self.values: dict[str, int | float] = {}
         self.values_uom: dict[str, str] = {}
         self.containers_running: list[str | None] = []
         self.containers_stopped: list[str | None] = []
         self.images_unused: list[str | None] = []
+        self.images_with_updates: list[str] = []
+        self.prune_candidates: dict[str, dict[str, PruneCandidate]] = {}
+        self.container_image_ids: set[str] = set()
+        self.container_volume_names: set[str] = set()
         self.volumes_unused: list[str | None] = []
+        self.containers_unhealthy: list[str] = []
+        self.containers_starting: list[str] = []
+        self.containers_restarting: list[str] = []
+        self.containers_restart_loop: list[str] = []
+        self.restart_loop: RestartLoopDetector = RestartLoopDetector(
+            RESTART_LOOP_THRESHOLD, RESTART_LOOP_WINDOW
+        )
+        self.container_states: dict[str, ContainerState] | None = None
+        self.cycle_duration: float = 0.0
+        self.skipped_cycles: int = 0
+        self.collection_started: float | None = None
+        self.stats_sample_size: int | None = None
+        self.stats_cursor: int = 0
+        self.stats_container_count: int = 0
+        self.stats_sampled: int = 0
+        self.sampled_usage: dict[str, tuple[float, int]] = {}
+        self.events_stream: EventsStream | None = None
+        self.event_counters: dict[str, EventCounter] = {
+            sensor_type: EventCounter(EVENTS_BUCKET_SECONDS, EVENTS_BUCKETS)
+            for sensor_type in SENSOR_EVENTS
+        }
+        self.recent_events: dict[str, deque[dict[str, Any]]] = {
+            sensor_type: deque(maxlen=EVENTS_RECENT) for sensor_type in SENSOR_EVENTS
+        }
+
+    # ------------------------------------------------------------------
+    def to_snapshot(self) -> dict[str, Any]:
+        """Last known values as a json serializable dict."""
+
+        return {
+            "last_updated": None
+            if self.last_updated is None
+            else self.last_updated.isoformat(),
+            "values": self.values,
+            "values_uom": self.values_uom,
+            "containers_running": self.containers_running,
+            "containers_stopped": self.containers_stopped,
+            "images_unused": self.images_unused,
+            "images_with_updates": self.images_with_updates,
+            "disk_usage_collected": None
+            if ENDPOINT_DISK_USAGE not in self.last_collected
+            else self.last_collected[ENDPOINT_DISK_USAGE].isoformat(),
+            "prune_candidates": {
+                prune_type: {
+                    candidate_id: candidate.to_dict()
+                    for candidate_id, candidate in candidates.items()
+                }
+                for prune_type, candidates in self.prune_candidates.items()
+            },
+            "volumes_unused": self.volumes_unused,
+            "containers_unhealthy": self.containers_unhealthy,
+            "containers_starting": self.containers_starting,
+            "containers_restarting": self.containers_restarting,
+            "containers_restart_loop": self.containers_restart_loop,
+            "container_stats": {
+                name: {
+                    "container_id": stats.container_id,
+                    "cpu_percent": stats.cpu_percent,
+                    "memory_usage": stats.memory_usage,
+                }
+                for name, stats in self.container_stats.items()
+            },
+            "groups": {name: asdict(group) for name, group in self.groups.items()},
+        }
+
+    # ------------------------------------------------------------------
+    def restore_snapshot(self, snapshot: dict[str, Any]) -> None:
+        """Restore last known values, they are stale until collected again.
+
+        The typed parts are parsed first, so nothing is restored from a
+        snapshot that fails to parse.
+        """
+
+        last_updated: datetime | None = (
+            None
+            if snapshot.get("last_updated") is None
+            else datetime.fromisoformat(snapshot["last_updated"])
+        )
+        disk_usage_collected: datetime | None = (
+            None
+            if snapshot.get("disk_usage_collected") is None
+            else datetime.fromisoformat(snapshot["disk_usage_collected"])
+        )
+        prune_candidates: dict[str, dict[str, PruneCandidate]] = {
+            prune_type: {
+                candidate_id: PruneCandidate(**candidate)
+                for candidate_id, candidate in candidates.items()
+            }
+            for prune_type, candidates in snapshot.get("prune_candidates", {}).items()
+        }
+        container_stats: dict[str, ContainerStats] = {
+            name: ContainerStats(**stats)
+            for name, stats in snapshot.get("container_stats", {}).items()
+        }
+        groups: dict[str, GroupStats] = {
+            name: GroupStats(**group)
+            for name, group in snapshot.get("groups", {}).items()
+        }
+
+        self.last_updated = last_updated
+        self.values.update(snapshot.get("values", {}))
+        self.values_uom.update(snapshot.get("values_uom", {}))
+        self.containers_running = snapshot.get("containers_running", [])
+        self.containers_stopped = snapshot.get("containers_stopped", [])
+        self.images_unused = snapshot.get("images_unused", [])
+        self.images_with_updates = snapshot.get("images_with_updates", [])
+
+        # The disk usage query is expensive, so its interval spans restarts
+        if disk_usage_collected is not None:
+            self.last_collected[ENDPOINT_DISK_USAGE] = disk_usage_collected
+        self.prune_candidates = prune_candidates
+        self.volumes_unused = snapshot.get("volumes_unused", [])
+        self.containers_unhealthy = snapshot.get("containers_unhealthy", [])
+        self.containers_starting = snapshot.get("containers_starting", [])
+        self.containers_restarting = snapshot.get("containers_restarting", [])
+        self.containers_restart_loop = snapshot.get("containers_restart_loop", [])
+        self.container_stats = container_stats
+        self.groups = groups
+        self.stale = True
+
+    # ------------------------------------------------------------------
+    def is_container_sensor_selected(self, container_name: str) -> bool:
+        """Is container selected by the include/exclude patterns."""
+
+        if (
+            self.container_sensors_include is not None
+            and self.container_sensors_include.match(container_name) is None
+        ):
+            return False
+
+        return (
+            self.container_sensors_exclude is None
+            or self.container_sensors_exclude.match(container_name) is None
+        )
 
 
 # ------------------------------------------------------------------
@@ -69,32 +734,101 @@ class ComponentApi:
         self.hass = hass
         self.entry: ConfigEntry = entry
         self.coordinator: DataUpdateCoordinator
-        self.client: docker.DockerClient
-        self.first_time: bool = True
         self.env_sensors: dict[str, DockerData] = {}
+        self.top_consumers: dict[str, list[tuple[float, str, str]]] = {}
+        # Snapshots of another version are discarded, not migrated
+        self.snapshot_store: StorageJson = StorageJson(
+            hass,
+            f"{STORAGE_KEY_SNAPSHOT}.{entry.entry_id}",
+            SNAPSHOT_VERSION,
+            async_migrate_func=lambda *_: {},
+        )
+        self.registry_resolver: RegistryDigestResolver = RegistryDigestResolver(
+            async_get_clientsession(hass),
+            timedelta(
+                hours=int(
+                    entry.options.get(
+                        CONF_CHECK_FOR_UPDATED_IMAGES_HOURS,
+                        DEFAULT_CHECK_FOR_UPDATED_IMAGES,
+                    )
+                )
+            ).total_seconds(),
+            MAX_PARALLEL_REGISTRY_REQUESTS,
+        )
+        self.live_stats: LiveStatsHub = LiveStatsHub(self)
+        self.refresh_arbiter: RefreshArbiter = RefreshArbiter(
+            hass, self.async_refresh_requests, REFRESH_DEBOUNCE
+        )
 
         """Setup the actions for the docker integration."""
         hass.services.async_register(
             DOMAIN,
             "update",
             self.async_update_service,
+            schema=UPDATE_SERVICE_SCHEMA,
         )
 
         hass.services.async_register(
             DOMAIN,
-            "prune_images",
-            self.async_prune_images_service,
+            "get_snapshot",
+            self.async_get_snapshot_service,
+            schema=GET_SNAPSHOT_SERVICE_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
         )
 
+        for prune_type in PRUNE_TYPES:
+            hass.services.async_register(
+                DOMAIN,
+                f"prune_{prune_type}",
+                partial(self.async_prune_service, prune_type),
+                schema=PRUNE_SERVICE_SCHEMAS[prune_type],
+                supports_response=SupportsResponse.OPTIONAL,
+            )
+
     # ------------------------------------------------------------------
     async def async_init(self) -> None:
-        """Init."""
+        """Init, engines are connected by async_start."""
         config = dict(self.entry.options)
+        try:
+            snapshots: dict[str, Any] = (
+                await self.snapshot_store.async_read_settings() or {}
+            )
+        except (HomeAssistantError, ValueError) as err:
+            LOGGER.warning("Snapshot of last known values discarded, %s", err)
+            snapshots = {}
 
         for sensor in config[CONF_SENSORS]:
             tmp_data = DockerData(
                 sensor.get(CONF_DOCKER_ENV_SENSOR_NAME),
                 sensor.get(CONF_DOCKER_ENGINE_URL),
+                sensor.get(CONF_UNIQUE_ID, ""),
+                sensor.get(CONF_SENSOR_GROUPS, DEFAULT_SENSOR_GROUPS),
+                resolve_profile(sensor),
+                sensor.get(CONF_LOCAL_CGROUP_STATS, False),
+                sensor.get(CONF_CPU_NORMALIZATION, DEFAULT_CPU_NORMALIZATION),
+            )
+            tmp_data.sensor_types = sensor_types_for_engine(sensor)
+            tmp_data.container_sensors = sensor.get(CONF_CONTAINER_SENSORS, False)
+            tmp_data.container_sensors_max = int(
+                sensor.get(CONF_CONTAINER_SENSORS_MAX, DEFAULT_CONTAINER_SENSORS_MAX)
+            )
+            tmp_data.container_sensors_include = compile_patterns(
+                sensor.get(CONF_CONTAINER_SENSORS_INCLUDE)
+            )
+            tmp_data.container_sensors_exclude = compile_patterns(
+                sensor.get(CONF_CONTAINER_SENSORS_EXCLUDE)
+            )
+            tmp_data.group_sensors = sensor.get(CONF_GROUP_SENSORS, False)
+            tmp_data.group_label = (
+                sensor.get(CONF_GROUP_LABEL) or DEFAULT_GROUP_LABEL
+            ).strip()
+            tmp_data.container_filter = ContainerFilter.from_config(
+                sensor.get(CONF_INCLUDE_LABELS),
+                sensor.get(CONF_EXCLUDE_LABELS),
+                sensor.get(CONF_INCLUDE_NAMES),
+                sensor.get(CONF_EXCLUDE_NAMES),
+                sensor.get(CONF_INCLUDE_PROJECTS),
+                sensor.get(CONF_EXCLUDE_PROJECTS),
             )
 
             tmp_data.values[SENSOR_CONTAINERS_CPU_PERCENT] = 0.0
@@ -103,243 +837,1832 @@ class ComponentApi:
             tmp_data.values[SENSOR_CONTAINERS_MEMORY_USAGE] = 0.0
             tmp_data.values_uom[SENSOR_CONTAINERS_MEMORY_USAGE] = "B"
 
-            try:
-                tmp_data.client = await self.docker_client(tmp_data.engine_url)
+            if tmp_data.sensor_name in snapshots:
+                try:
+                    tmp_data.restore_snapshot(snapshots[tmp_data.sensor_name])
+                except (AttributeError, KeyError, TypeError, ValueError) as err:
+                    LOGGER.warning(
+                        "Snapshot of %s discarded, %s", tmp_data.sensor_name, err
+                    )
+
+            self.env_sensors[tmp_data.sensor_name] = tmp_data
+
+    # ------------------------------------------------------------------
+    async def async_start(self) -> None:
+        """Connect to the engines and do the first collection.
+
+        Run as a background task, so setup doesn't wait on the engines. Each
+        engine updates its entities as soon as it has answered.
+        """
 
-            except errors.DockerException:
-                LOGGER.error("Error creating docker client url %s", tmp_data.engine_url)
-                tmp_data.connection_error = True
+        entity_registry: er.EntityRegistry = er.async_get(self.hass)
+
+        async def async_start_engine(env_sensor: DockerData) -> None:
+            await self.async_update_engine_data(
+                env_sensor, entity_registry, track_overrun=False
+            )
+            self.coordinator.async_update_listeners()
+
+        await asyncio.gather(
+            *(
+                async_start_engine(env_sensor)
+                for env_sensor in self.env_sensors.values()
+            ),
+            return_exceptions=True,
+        )
+
+        self.coordinator.update_interval = self.get_update_interval()
+        self.save_snapshot()
+
+    # ------------------------------------------------------------------
+    async def async_connect_engine(self, env_sensor: DockerData) -> bool:
+        """Connect to engine, an issue is created the first time it fails."""
+
+        try:
+            env_sensor.client = await self.docker_client(
+                env_sensor.engine_url, env_sensor.profile[CONF_TIMEOUT]
+            )
+
+        except docker_exception():
+            if not env_sensor.connection_error:
+                LOGGER.error(
+                    "Error creating docker client url %s", env_sensor.engine_url
+                )
+                env_sensor.connection_error = True
                 self.create_issue(
                     TRANSLATION_KEY_CONNECTION_ERROR,
-                    {"url": tmp_data.engine_url},
+                    {"url": env_sensor.engine_url},
                 )
+            return False
 
-            self.env_sensors[tmp_data.sensor_name] = tmp_data
+        env_sensor.connection_error = False
 
-    # -------------------------------------------------------------------
-    async def async_update_service(self, call: ServiceCall) -> None:
-        """Update via service."""
+        if env_sensor.local_cgroup_stats and env_sensor.cgroup_reader is None:
+            env_sensor.cgroup_reader = await self.cgroup_reader(env_sensor.engine_url)
 
-        # await self.async_update_sensors_data()
-        await self.coordinator.async_request_refresh()
+            # Live stats are read at another rate, with samples of their own
+            if env_sensor.cgroup_reader is not None:
+                env_sensor.live_cgroup_reader = await self.hass.async_add_executor_job(
+                    CgroupStatsReader,
+                    env_sensor.cgroup_reader.root,
+                    env_sensor.cgroup_reader.cpu_count,
+                )
 
-    # -------------------------------------------------------------------
-    async def async_prune_images_service(self, call: ServiceCall) -> None:
-        """Prune via service."""
-        await self.prune_images()
-        await self.coordinator.async_request_refresh()
+        return True
 
-    # -------------------------------------------------------------------
-    async def async_update(self) -> None:
-        """Update."""
+    # ------------------------------------------------------------------
+    def start_events_stream(self, env_sensor: DockerData) -> None:
+        """Subscribe to the oom and die events of the selected containers.
 
-        if self.first_time:
-            await self.async_init()
-            self.first_time = False
-            await self.async_update_sensors_data(False)
-        else:
-            self.coordinator.update_interval = timedelta(
-                minutes=self.entry.options.get(CONF_SCAN_INTERVAL, 5)
-            )
-            await self.async_update_sensors_data()
+        The engine filters the events by type and by the label filters of
+        the engine, the rest of the container filter is applied here.
+        """
 
-    # ------------------------------------------------------------------
-    @async_hass_add_executor_job()
-    def list_containers(self, env_sensor: DockerData) -> Any:
-        """List containers."""
+        filters: dict[str, Any] = {"type": ["container"], "event": ["oom", "die"]}
 
-        return env_sensor.client.containers.list(True)
+        if "label" in env_sensor.container_filter.engine_filters:
+            filters["label"] = env_sensor.container_filter.engine_filters["label"]
+
+        env_sensor.events_stream = EventsStream(
+            env_sensor.client,
+            filters,
+            lambda event: self.hass.loop.call_soon_threadsafe(
+                self.handle_engine_event, env_sensor, event
+            ),
+            f"{DOMAIN} events {env_sensor.sensor_name}",
+        )
+        env_sensor.events_stream.start()
 
     # ------------------------------------------------------------------
-    async def async_update_sensors_data(
-        self,
-        get_job_info: bool = True,
-    ) -> None:
-        """Update data."""
+    @callback
+    def stop_events_streams(self) -> None:
+        """Stop the events streams of all engines."""
 
         for env_sensor in self.env_sensors.values():
-            if env_sensor.connection_error:
-                continue
+            if env_sensor.events_stream is not None:
+                env_sensor.events_stream.stop()
+                env_sensor.events_stream = None
+
+    # ------------------------------------------------------------------
+    @callback
+    def handle_engine_event(self, env_sensor: DockerData, event: dict) -> None:
+        """Count an oom or a die event with a non zero exit code."""
+
+        attributes: dict[str, str] = (event.get("Actor") or {}).get("Attributes") or {}
+        container_name: str = attributes.get("name", "")
 
-            containers: list[Container] = await self.list_containers(env_sensor)
+        if not env_sensor.container_filter.matches(container_name, attributes):
+            return
 
-            await self.async_update_container_data(env_sensor, containers, get_job_info)
+        if event.get("Action") == "oom":
+            sensor_type: str = SENSOR_CONTAINERS_OOM_KILLED
+        elif attributes.get("exitCode", "0") != "0":
+            sensor_type = SENSOR_CONTAINERS_CRASHED
+        else:
+            return
 
-            await self.async_update_image_data(env_sensor, containers)
+        timestamp: float = event.get("time") or time.time()
 
-            await self.async_update_volume_data(env_sensor, containers)
+        env_sensor.event_counters[sensor_type].add(timestamp)
+        env_sensor.recent_events[sensor_type].appendleft(
+            {
+                "Container": container_name,
+                "Exit code": attributes.get("exitCode"),
+                "Time": datetime.fromtimestamp(timestamp).isoformat(),
+            }
+        )
+        self.update_event_values(env_sensor)
+        self.coordinator.async_update_listeners()
 
     # ------------------------------------------------------------------
-    @async_hass_add_executor_job()
-    def prune_images(self) -> None:
-        """Prune images."""
+    def update_event_values(self, env_sensor: DockerData) -> None:
+        """Event counts over the window, they decay as time passes."""
 
-        for env_sensor in self.env_sensors.values():
-            env_sensor.client.images.prune({"dangling": False})
+        for sensor_type, counter in env_sensor.event_counters.items():
+            env_sensor.values[sensor_type] = counter.count(EVENTS_WINDOW)
 
     # ------------------------------------------------------------------
     @async_hass_add_executor_job()
-    def container_stats(self, container: Container) -> Any:
-        """Get stats for container."""
+    def cgroup_reader(self, base_url: str) -> CgroupStatsReader | None:
+        """Cgroup reader for a local engine, if the cgroup filesystem is there."""
 
-        return container.stats(decode=False, stream=False)
+        if not base_url.startswith("unix://"):
+            LOGGER.warning(
+                "Reading stats from cgroups is only supported for local engines, %s",
+                base_url,
+            )
+            return None
 
-    # ------------------------------------------------------------------
-    async def async_update_container_data(
-        self,
-        env_sensor: DockerData,
-        containers: list[Container],
-        get_job_info: bool = True,
-    ) -> None:
-        """Update container data."""
+        reader: CgroupStatsReader = CgroupStatsReader()
 
-        def convert_bytes_to(byte_count: int) -> tuple[float, str]:
-            """Konverterer bytes til MB eller GB baseret på størrelsen."""
-            units: list[str] = ["B", "KB", "MB", "GB"]
-            size: float = float(byte_count)
+        if not reader.is_available():
+            LOGGER.warning("Cgroup filesystem not available, stats are read via api")
+            return None
 
-            for unit in units:
-                if size < 1024:
-                    return (size, unit)
-                size /= 1024
-            return (size, units[0])  # Bytes
+        return reader
 
-        env_sensor.values[SENSOR_CONTAINERS_RUNNING] = 0
-        env_sensor.values[SENSOR_CONTAINERS_STOPPED] = 0
-        env_sensor.containers_running.clear()
-        env_sensor.containers_stopped.clear()
+    # -------------------------------------------------------------------
+    async def async_update_service(self, call: ServiceCall) -> None:
+        """Update via service.
 
-        cpu_percent = 0.0
-        memory_usage_bytes: int = 0
+        Without tiers the endpoints due are updated, otherwise the endpoints
+        of the tiers are refreshed. Calls are coalesced by the arbiter.
+        """
 
-        for container in containers:
-            if container.status != "running":
-                env_sensor.values[SENSOR_CONTAINERS_STOPPED] += 1
-                env_sensor.containers_stopped.append(container.name)
-                continue
+        env_sensors: list[DockerData] = self.get_target_engines(
+            call.data.get(ATTR_ENGINES)
+        )
+        tiers: list[str] | None = call.data.get(ATTR_TIERS)
 
-            env_sensor.values[SENSOR_CONTAINERS_RUNNING] += 1
-            env_sensor.containers_running.append(container.name)
+        await self.refresh_arbiter.async_request(
+            [env_sensor.sensor_name for env_sensor in env_sensors],
+            None
+            if not tiers
+            else {endpoint for tier in tiers for endpoint in REFRESH_TIERS[tier]},
+        )
 
-            if get_job_info:
-                stats = await self.container_stats(container)
-
-                cpu_delta = float(
-                    stats["cpu_stats"]["cpu_usage"]["total_usage"]
-                ) - float(stats["precpu_stats"]["cpu_usage"]["total_usage"])
-                system_cpu_delta = float(
-                    stats["cpu_stats"]["system_cpu_usage"]
-                ) - float(stats["precpu_stats"]["system_cpu_usage"])
-
-                if system_cpu_delta > 0.0 and cpu_delta > 0.0:
-                    cpu_percent += (
-                        (cpu_delta / system_cpu_delta)
-                        #      * float(len(stats["cpu_stats"]["cpu_usage"]["percpu_usage"]))
-                        * 100.0
-                    )
+    # -------------------------------------------------------------------
+    async def async_request_refresh(
+        self, engine_names: list[str] | None = None
+    ) -> None:
+        """Request a refresh of the endpoints due, of all engines if none given."""
+
+        await self.refresh_arbiter.async_request(
+            self.env_sensors if engine_names is None else engine_names
+        )
 
-                memory_usage_bytes += stats["memory_stats"]["usage"]
+    # -------------------------------------------------------------------
+    async def async_refresh_requests(self, requests: dict[str, RefreshRequest]) -> None:
+        """Run the refresh requests merged by the arbiter, engines concurrently."""
+
+        entity_registry: er.EntityRegistry = er.async_get(self.hass)
+
+        async def async_refresh_engine(
+            env_sensor: DockerData, request: RefreshRequest
+        ) -> None:
+            last_collected: dict[str, datetime] = dict(env_sensor.last_collected)
+
+            if request.due:
+                await self.async_update_engine_data(env_sensor, entity_registry)
+
+            # Endpoints just collected by the update aren't refreshed again
+            endpoints: set[str] = {
+                endpoint
+                for endpoint in request.endpoints
+                if env_sensor.last_collected.get(endpoint)
+                == last_collected.get(endpoint)
+            }
+
+            if endpoints:
+                await self.async_refresh_endpoints(env_sensor, endpoints)
+
+        await asyncio.gather(
+            *(
+                async_refresh_engine(self.env_sensors[engine_name], request)
+                for engine_name, request in requests.items()
+                if engine_name in self.env_sensors
+            )
+        )
+        self.coordinator.async_update_listeners()
+        self.save_snapshot()
 
-        if get_job_info:
-            env_sensor.values[SENSOR_CONTAINERS_CPU_PERCENT] = round(cpu_percent, 2)
-            env_sensor.values_uom[SENSOR_CONTAINERS_CPU_PERCENT] = "%"
+    # -------------------------------------------------------------------
+    async def async_prune_service(
+        self, prune_type: str, call: ServiceCall
+    ) -> ServiceResponse:
+        """Prune via service.
+
+        The target engines are pruned concurrently, each limited by the
+        timeout of its profile. Afterwards only the data the prune type
+        affects is refreshed on the pruned engines.
+        """
+
+        env_sensors: list[DockerData] = self.get_target_engines(
+            call.data.get(ATTR_ENGINES)
+        )
+        dry_run: bool = call.data[ATTR_DRY_RUN]
+        filters: dict[str, Any] = build_filters(prune_type, call.data)
+        until: float | None = None
 
-            memory_usage, uom = convert_bytes_to(memory_usage_bytes)
+        if ATTR_UNTIL in filters:
+            try:
+                until = parse_until(filters[ATTR_UNTIL])
+            except ValueError as err:
+                raise ServiceValidationError(
+                    f"Invalid until: {filters[ATTR_UNTIL]}"
+                ) from err
+
+        # Networks aren't collected, so there are no candidates to report
+        if dry_run and prune_type == PRUNE_NETWORKS:
+            raise ServiceValidationError("Dry run is not supported for networks")
+
+        if dry_run:
+            results: list[dict[str, Any]] = [
+                dry_run_result(
+                    env_sensor.prune_candidates.get(prune_type, {}),
+                    filters.get(ATTR_LABEL),
+                    until,
+                )
+                for env_sensor in env_sensors
+            ]
+        else:
+            results = await asyncio.gather(
+                *(
+                    self.async_prune_engine(env_sensor, prune_type, filters)
+                    for env_sensor in env_sensors
+                )
+            )
+            await self.refresh_arbiter.async_request(
+                [
+                    env_sensor.sensor_name
+                    for env_sensor, result in zip(env_sensors, results, strict=True)
+                    if "error" not in result
+                ],
+                set(PRUNE_REFRESH_ENDPOINTS[prune_type]),
+            )
 
-            env_sensor.values[SENSOR_CONTAINERS_MEMORY_USAGE] = round(memory_usage, 2)
-            env_sensor.values_uom[SENSOR_CONTAINERS_MEMORY_USAGE] = uom
+        return {
+            "dry_run": dry_run,
+            "reclaimed_bytes": sum(result["reclaimed_bytes"] for result in results),
+            "engines": {
+                env_sensor.sensor_name: result
+                for env_sensor, result in zip(env_sensors, results, strict=True)
+            },
+        }
 
-    # ------------------------------------------------------------------
-    @async_hass_add_executor_job()
-    def client_image_list(
-        self, env_sensor: DockerData, name=None, all=False, filters=None
-    ) -> Any:
-        """Client image list."""
+    # -------------------------------------------------------------------
+    async def async_get_snapshot_service(self, call: ServiceCall) -> ServiceResponse:
+        """Last collected data of the engines, without refreshing them."""
 
-        return env_sensor.client.images.list(name, all, filters)
+        sections: list[str] = call.data.get(ATTR_SECTIONS) or list(SNAPSHOT_SECTIONS)
+        engines: dict[str, Any] = {}
 
-    # ------------------------------------------------------------------
-    async def async_update_image_data(
-        self, env_sensor: DockerData, containers: list[Container]
-    ) -> None:
-        """Update image data."""
-        env_sensor.images_unused.clear()
-        images: list[Image] = await self.client_image_list(env_sensor)
+        for env_sensor in self.get_target_engines(call.data.get(ATTR_ENGINES)):
+            snapshot: dict[str, Any] = env_sensor.to_snapshot()
 
-        env_sensor.values[SENSOR_IMAGES] = len(images)
-        env_sensor.values[SENSOR_IMAGES_DANGLING] = len(
-            await self.client_image_list(env_sensor, None, False, {"dangling": True})
-        )
+            engines[env_sensor.sensor_name] = {
+                "available": self.is_engine_available(env_sensor.sensor_name),
+                "stale": env_sensor.stale,
+                "last_updated": snapshot["last_updated"],
+                **{
+                    key: snapshot[key]
+                    for section in sections
+                    for key in SNAPSHOT_SECTIONS[section]
+                },
+            }
 
-        tmp_count: int = 0
+        return {"engines": engines}
 
-        for image in images:
-            used: bool = False
+    # -------------------------------------------------------------------
+    def get_target_engines(self, engine_names: list[str] | None) -> list[DockerData]:
+        """Engines targeted by a service call, all engines if none are given."""
 
-            for container in containers:
-                if image.id == container.attrs.get("Image", ""):
-                    used = True
-                    tmp_count += 1
-                    break
+        if not engine_names:
+            return list(self.env_sensors.values())
 
-            if not used and len(image.tags) > 0:
-                env_sensor.images_unused.append(image.tags[0])
+        unknown: list[str] = [
+            engine_name
+            for engine_name in engine_names
+            if engine_name not in self.env_sensors
+        ]
 
-        env_sensor.values[SENSOR_IMAGES_UNUSED] = (
-            env_sensor.values[SENSOR_IMAGES] - tmp_count
-        )
+        if unknown:
+            raise ServiceValidationError(
+                f"Unknown docker environment: {', '.join(unknown)}"
+            )
 
-    # ------------------------------------------------------------------
-    @async_hass_add_executor_job()
-    def client_volumes_list(self, env_sensor: DockerData) -> Any:
-        """Client image list."""
+        return [self.env_sensors[engine_name] for engine_name in engine_names]
 
-        return env_sensor.client.volumes.list()
+    # -------------------------------------------------------------------
+    async def async_prune_engine(
+        self, env_sensor: DockerData, prune_type: str, filters: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Prune an engine, errors are reported in the result."""
+
+        if env_sensor.client is None:
+            return {"reclaimed_bytes": 0, "removed": [], "error": "Not connected"}
+
+        try:
+            async with asyncio.timeout(env_sensor.profile[CONF_TIMEOUT]):
+                result: dict = await self.prune(env_sensor, prune_type, filters)
+
+        except (TimeoutError, docker_exception()) as err:
+            LOGGER.warning(
+                "Error pruning %s on docker engine %s: %s",
+                prune_type,
+                env_sensor.engine_url,
+                err,
+            )
+            return {
+                "reclaimed_bytes": 0,
+                "removed": [],
+                "error": str(err) or "Timeout",
+            }
 
-    # ------------------------------------------------------------------
-    async def async_update_volume_data(
-        self, env_sensor: DockerData, containers: list[Container]
+        return parse_prune_result(prune_type, result)
+
+    # -------------------------------------------------------------------
+    async def async_refresh_endpoints(
+        self, env_sensor: DockerData, endpoints: set[str]
     ) -> None:
-        """Update image data."""
+        """Refresh only the given endpoints of an engine."""
 
-        env_sensor.volumes_unused.clear()
+        async with env_sensor.update_lock:
+            plan: set[str] = env_sensor.collection_plan & endpoints
 
-        volumes: list[Volume] = await self.client_volumes_list(env_sensor)
+            if len(plan) == 0 or env_sensor.client is None:
+                return
 
-        env_sensor.values[SENSOR_VOLUMES] = len(volumes)
+            try:
+                await self.async_collect_engine_data(env_sensor, plan)
 
-        tmp_count: int = 0
+            except (docker_exception(), OSError) as err:
+                LOGGER.debug(
+                    "Error refreshing data from docker engine %s: %s",
+                    env_sensor.engine_url,
+                    err,
+                )
+                return
 
-        for volume in volumes:
-            volume_is_used = False
-
-            for container in containers:
-                for mount in container.attrs["Mounts"]:
-                    if (
-                        mount.get("Type", "") == "volume"
-                        and mount.get("Name", "") == volume.name
-                    ):
-                        tmp_count += 1
-                        volume_is_used = True
-                        break
-
-                if volume_is_used:
-                    break
-            if not volume_is_used:
-                env_sensor.volumes_unused.append(volume.name)
+            now: datetime = datetime.now()
 
-        env_sensor.values[SENSOR_VOLUMES_UNUSED] = (
-            env_sensor.values[SENSOR_VOLUMES] - tmp_count
+            for endpoint in plan:
+                env_sensor.last_collected[endpoint] = now
+
+    # -------------------------------------------------------------------
+    async def async_collect_live_stats(self, engine_names: set[str]) -> None:
+        """Read container usage of engines for live stats subscribers.
+
+        Only the live usage is updated. The sensors, rolling windows, events
+        and stats sampling are left to the scheduled collection.
+        """
+
+        await asyncio.gather(
+            *(
+                self.async_read_live_usage(env_sensor)
+                for env_sensor in self.env_sensors.values()
+                if env_sensor.sensor_name in engine_names
+            )
         )
 
-    # ------------------------------------------------------------------
-    @async_hass_add_executor_job()
-    def docker_client(self, base_url: str) -> Any:
-        """Get docker client."""
+    # -------------------------------------------------------------------
+    async def async_read_live_usage(self, env_sensor: DockerData) -> None:
+        """Read CPU % and memory usage of the running containers of an engine.
+
+        The containers running at the last listing are read, containers
+        started since are picked up by the next scheduled collection.
+        """
+
+        if (
+            env_sensor.client is None
+            or env_sensor.container_states is None
+            or env_sensor.live_lock.locked()
+        ):
+            return
+
+        async with env_sensor.live_lock:
+            running: dict[str, str] = {
+                container_id: state.name
+                for container_id, state in env_sensor.container_states.items()
+                if state.running
+            }
+            usage: dict[str, tuple[float, int]] = {}
+            api_container_ids: list[str] = list(running)
+
+            if env_sensor.live_cgroup_reader is not None:
+                usage = await self.async_read_cgroup_usage(
+                    env_sensor, env_sensor.live_cgroup_reader, list(running)
+                )
 
-        return docker.DockerClient(base_url)
+                # Found in the cgroups, but read once only, CPU % comes next time
+                api_container_ids = [
+                    container_id
+                    for container_id in running
+                    if env_sensor.live_cgroup_reader.paths.get(container_id) is None
+                ]
 
-    # ------------------------------------------------------------------
+            semaphore = asyncio.Semaphore(env_sensor.profile[CONF_MAX_PARALLEL_STATS])
+
+            try:
+                for container_id, stats in zip(
+                    api_container_ids,
+                    await asyncio.gather(
+                        *(
+                            self.async_container_stats(
+                                env_sensor,
+                                env_sensor.client.containers.prepare_model(
+                                    {"Id": container_id, "Name": running[container_id]}
+                                ),
+                                semaphore,
+                            )
+                            for container_id in api_container_ids
+                        )
+                    ),
+                    strict=True,
+                ):
+                    if stats is not None:
+                        usage[container_id] = self.calculate_usage(
+                            stats, env_sensor.cpu_normalization
+                        )
+
+            except (docker_exception(), OSError) as err:
+                LOGGER.debug(
+                    "Error reading live stats from docker engine %s: %s",
+                    env_sensor.engine_url,
+                    err,
+                )
+                return
+
+            env_sensor.live_usage = {
+                name: usage[container_id]
+                for container_id, name in running.items()
+                if container_id in usage
+            }
+
+    # -------------------------------------------------------------------
+    async def async_read_cgroup_usage(
+        self,
+        env_sensor: DockerData,
+        reader: CgroupStatsReader,
+        container_ids: list[str],
+    ) -> dict[str, tuple[float, int]]:
+        """Read CPU % and memory usage of containers from the local cgroups."""
+
+        usage: dict[str, tuple[float, int]] = await self.hass.async_add_executor_job(
+            reader.read, container_ids
+        )
+
+        # The cgroup reader is relative to the whole host
+        if env_sensor.cpu_normalization != CPU_NORMALIZATION_HOST:
+            usage = {
+                container_id: (cpu_percent * reader.cpu_count, memory_usage)
+                for container_id, (cpu_percent, memory_usage) in usage.items()
+            }
+
+        return usage
+
+    # -------------------------------------------------------------------
+    async def async_update(self) -> None:
+        """Update."""
+
+        self.coordinator.update_interval = self.get_update_interval()
+        await self.async_update_sensors_data()
+        self.save_snapshot()
+
+    # ------------------------------------------------------------------
+    @callback
+    def save_snapshot(self) -> None:
+        """Persist last known values for each engine.
+
+        The write is delayed, and the saves within the delay are merged, so
+        storage isn't written on every collection.
+        """
+
+        self.snapshot_store.delay_write_settings(
+            lambda: {
+                env_sensor.sensor_name: env_sensor.to_snapshot()
+                for env_sensor in self.env_sensors.values()
+                if env_sensor.last_updated is not None
+            },
+            SNAPSHOT_SAVE_DELAY,
+        )
+
+    # ------------------------------------------------------------------
+    def get_update_interval(self) -> timedelta:
+        """Coordinator interval, the shortest interval of any engine profile."""
+
+        minutes: int = self.get_scan_interval()
+
+        for env_sensor in self.env_sensors.values():
+            for endpoint in env_sensor.collection_plan:
+                minutes = min(minutes, self.get_endpoint_interval(env_sensor, endpoint))
+
+        return timedelta(minutes=minutes)
+
+    # ------------------------------------------------------------------
+    def get_scan_interval(self) -> int:
+        """Scan interval in minutes."""
+
+        return int(self.entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL))
+
+    # ------------------------------------------------------------------
+    def get_endpoint_interval(self, env_sensor: DockerData, endpoint: str) -> int:
+        """Collection interval in minutes for an endpoint, 0 means scan interval."""
+
+        interval: int = env_sensor.profile[ENDPOINT_INTERVALS[endpoint]]
+
+        return interval if interval > 0 else self.get_scan_interval()
+
+    # ------------------------------------------------------------------
+    def get_cycle_interval(self, env_sensor: DockerData, plan: set[str]) -> float:
+        """Seconds a collection of the endpoints has, their shortest interval."""
+
+        return 60 * max(
+            min(
+                (self.get_endpoint_interval(env_sensor, endpoint) for endpoint in plan),
+                default=self.get_scan_interval(),
+            ),
+            1,
+        )
+
+    # ------------------------------------------------------------------
+    @async_hass_add_executor_job()
+    def list_containers(self, env_sensor: DockerData) -> Any:
+        """List the selected containers.
+
+        The engine filters limit which containers are listed and inspected,
+        the rest of the filters are applied to the result.
+        """
+
+        containers: list[Container] = env_sensor.client.containers.list(
+            True, filters=env_sensor.container_filter.engine_filters
+        )
+
+        if env_sensor.container_filter.is_empty():
+            return containers
+
+        return [
+            container
+            for container in containers
+            if env_sensor.container_filter.matches(container.name, container.labels)
+        ]
+
+    # ------------------------------------------------------------------
+    async def async_update_sensors_data(self) -> None:
+        """Update data, the engines are updated concurrently."""
+
+        entity_registry: er.EntityRegistry = er.async_get(self.hass)
+
+        # An engine still busy with the last collection or a refresh is skipped,
+        # rather than stacking another collection behind it. Only a collection
+        # running past its interval counts as a skipped cycle.
+        now: float = time.monotonic()
+
+        for env_sensor in self.env_sensors.values():
+            if not env_sensor.update_lock.locked():
+                continue
+
+            if (
+                env_sensor.collection_started is not None
+                and now - env_sensor.collection_started
+                >= self.get_cycle_interval(env_sensor, env_sensor.collection_plan)
+            ):
+                env_sensor.skipped_cycles += 1
+
+            LOGGER.debug(
+                "Docker engine %s is still collecting, cycle skipped",
+                env_sensor.engine_url,
+            )
+
+        await asyncio.gather(
+            *(
+                self.async_update_engine_data(env_sensor, entity_registry)
+                for env_sensor in self.env_sensors.values()
+                if not env_sensor.update_lock.locked()
+            )
+        )
+
+    # ------------------------------------------------------------------
+    async def async_update_engine_data(
+        self,
+        env_sensor: DockerData,
+        entity_registry: er.EntityRegistry,
+        track_overrun: bool = True,
+    ) -> None:
+        """Update data for engine, isolated from the other engines.
+
+        An unexpected error is logged and only makes this engine unavailable,
+        the entities of the other engines keep updating. The first collection
+        at start isn't tracked for skipped cycles.
+        """
+
+        async with env_sensor.update_lock:
+            if track_overrun:
+                env_sensor.collection_started = time.monotonic()
+
+            try:
+                await self.async_collect_engine(env_sensor, entity_registry)
+
+            except Exception:
+                if not env_sensor.collection_error:
+                    LOGGER.exception(
+                        "Unexpected error collecting data from docker engine %s",
+                        env_sensor.engine_url,
+                    )
+                env_sensor.collection_error = True
+
+            finally:
+                env_sensor.collection_started = None
+
+    # ------------------------------------------------------------------
+    async def async_collect_engine(
+        self,
+        env_sensor: DockerData,
+        entity_registry: er.EntityRegistry,
+    ) -> None:
+        """Collect data for engine, (re)connecting to it if needed."""
+
+        if env_sensor.client is None and not await self.async_connect_engine(
+            env_sensor
+        ):
+            return
+
+        if any(sensor_type in SENSOR_EVENTS for sensor_type in env_sensor.sensor_types):
+            if env_sensor.events_stream is None:
+                self.start_events_stream(env_sensor)
+
+            self.update_event_values(env_sensor)
+
+        env_sensor.collection_plan = self.build_collection_plan(
+            env_sensor, entity_registry
+        )
+        plan: set[str] = self.get_due_endpoints(env_sensor)
+
+        if len(plan) == 0:
+            return
+
+        # Containers are listed whenever anything is due, image and volume
+        # usage are classified against them.
+        if ENDPOINT_CONTAINERS in env_sensor.collection_plan:
+            plan.add(ENDPOINT_CONTAINERS)
+
+        started: float = time.monotonic()
+
+        try:
+            await self.async_collect_engine_data(env_sensor, plan)
+
+        except (docker_exception(), OSError) as err:
+            if not env_sensor.collection_error:
+                LOGGER.warning(
+                    "Error collecting data from docker engine %s: %s",
+                    env_sensor.engine_url,
+                    err,
+                )
+            env_sensor.collection_error = True
+            return
+
+        env_sensor.collection_error = False
+        now: datetime = datetime.now()
+
+        for endpoint in plan:
+            env_sensor.last_collected[endpoint] = now
+
+        env_sensor.last_updated = now
+        env_sensor.stale = False
+        self.update_cycle_duration(env_sensor, plan, time.monotonic() - started)
+
+        if ENDPOINT_STATS in plan:
+            self.update_top_consumers()
+
+    # ------------------------------------------------------------------
+    def update_cycle_duration(
+        self, env_sensor: DockerData, plan: set[str], duration: float
+    ) -> None:
+        """Count overruns and size the stats sample to fit the interval.
+
+        A collection overruns when it takes longer than the shortest interval
+        of the endpoints collected. The number of containers with stats
+        collected per cycle is then lowered, and raised again while the
+        collections are well within the interval.
+        """
+
+        env_sensor.cycle_duration = duration
+        interval: float = self.get_cycle_interval(env_sensor, plan)
+
+        if duration > interval:
+            env_sensor.values[SENSOR_COLLECTION_OVERRUNS] = (
+                env_sensor.values.get(SENSOR_COLLECTION_OVERRUNS, 0) + 1
+            )
+
+            if ENDPOINT_STATS not in plan or env_sensor.stats_sampled == 0:
+                return
+
+            sample_size: int = max(
+                int(
+                    env_sensor.stats_sampled
+                    * OVERRUN_TARGET_RATIO
+                    * interval
+                    / duration
+                ),
+                MIN_STATS_SAMPLE,
+            )
+
+            if sample_size < env_sensor.stats_container_count:
+                LOGGER.info(
+                    "Collecting from docker engine %s took %.0f seconds, stats are "
+                    "collected for %s of %s containers per cycle",
+                    env_sensor.engine_url,
+                    duration,
+                    sample_size,
+                    env_sensor.stats_container_count,
+                )
+                env_sensor.stats_sample_size = sample_size
+
+        elif (
+            env_sensor.stats_sample_size is not None
+            and duration < interval * OVERRUN_TARGET_RATIO / 2
+        ):
+            sample_size = env_sensor.stats_sample_size * 3 // 2 + 1
+            env_sensor.stats_sample_size = (
+                None if sample_size >= env_sensor.stats_container_count else sample_size
+            )
+
+    # ------------------------------------------------------------------
+    def select_stats_sample(
+        self, env_sensor: DockerData, containers: list[Container]
+    ) -> list[Container]:
+        """Containers to collect stats for this cycle, in round robin.
+
+        The slice is the stats budget of the profile, raised as needed for
+        the round robin to cover all containers within the full sweep
+        interval. The sweep is spread over its cycles, so the cached usage
+        doesn't drift without a burst of stats calls in a single cycle. The
+        sample size lowered by overruns caps both, the back-off wins over the
+        sweep.
+        """
+
+        env_sensor.stats_container_count = len(containers)
+        sample_size: int = len(containers)
+        budget: int = env_sensor.profile.get(CONF_STATS_BUDGET, 0)
+        full_sweep_interval: int = env_sensor.profile.get(CONF_FULL_SWEEP_INTERVAL, 0)
+
+        if budget > 0:
+            sample_size = budget
+
+            if full_sweep_interval > 0:
+                sweep_cycles: int = max(
+                    full_sweep_interval
+                    // self.get_endpoint_interval(env_sensor, ENDPOINT_STATS),
+                    1,
+                )
+                sample_size = max(sample_size, ceil(len(containers) / sweep_cycles))
+
+        if env_sensor.stats_sample_size is not None:
+            sample_size = min(sample_size, env_sensor.stats_sample_size)
+
+        if sample_size >= len(containers):
+            env_sensor.stats_sampled = len(containers)
+            return containers
+
+        ordered: list[Container] = sorted(
+            containers, key=lambda container: container.id
+        )
+        start: int = env_sensor.stats_cursor % len(ordered)
+        env_sensor.stats_cursor = start + sample_size
+        env_sensor.stats_sampled = sample_size
+
+        return (ordered + ordered)[start : env_sensor.stats_cursor]
+
+    # ------------------------------------------------------------------
+    async def async_collect_engine_data(
+        self, env_sensor: DockerData, plan: set[str]
+    ) -> None:
+        """Collect the planned endpoints of an engine."""
+
+        containers: list[Container] = []
+
+        if ENDPOINT_CONTAINERS in plan:
+            containers = await self.list_containers(env_sensor)
+
+            # With a filter the excluded containers are listed too, without
+            # inspecting them, as their images and volumes are in use
+            self.update_engine_containers(
+                env_sensor,
+                [EngineContainer.from_container(container) for container in containers]
+                if env_sensor.container_filter.is_empty()
+                else [
+                    EngineContainer.from_listing(item)
+                    for item in await self.list_engine_containers(env_sensor)
+                ],
+            )
+
+            running: list[Container] = self.update_container_data(
+                env_sensor, containers
+            )
+
+            if ENDPOINT_STATS in plan:
+                await self.async_update_usage_data(env_sensor, containers, running)
+
+        images: list[Image] | None = None
+
+        if ENDPOINT_IMAGES in plan or ENDPOINT_IMAGES_DANGLING in plan:
+            images = await self.async_update_image_data(env_sensor, plan)
+
+        if ENDPOINT_IMAGE_UPDATES in plan:
+            await self.async_update_image_updates_data(env_sensor, containers, images)
+
+        if ENDPOINT_VOLUMES in plan:
+            await self.async_update_volume_data(env_sensor)
+
+        if ENDPOINT_DISK_USAGE in plan:
+            await self.async_update_disk_usage_data(env_sensor)
+
+    # ------------------------------------------------------------------
+    def get_due_endpoints(self, env_sensor: DockerData) -> set[str]:
+        """Endpoints of the collection plan due according to the engine profile."""
+
+        now: datetime = datetime.now()
+        due: set[str] = set()
+
+        for endpoint in env_sensor.collection_plan:
+            interval: int = self.get_endpoint_interval(env_sensor, endpoint)
+            last_collected: datetime | None = env_sensor.last_collected.get(endpoint)
+
+            # Allow a little slack, so a scan scheduled slightly early isn't skipped
+            if last_collected is None or now - last_collected >= timedelta(
+                minutes=interval
+            ) - timedelta(seconds=10):
+                due.add(endpoint)
+
+        return due
+
+    # ------------------------------------------------------------------
+    def build_collection_plan(
+        self, env_sensor: DockerData, entity_registry: er.EntityRegistry
+    ) -> set[str]:
+        """Build the set of endpoints the enabled sensors of an engine need.
+
+        Sensor groups not selected for the engine have no entities, and
+        entities disabled in the entity registry are not consumed, so their
+        endpoints are never called. A summary sensor keeps its sensor type
+        collected on every engine as long as it is enabled itself.
+        """
+
+        use_sum_sensors: bool = len(self.env_sensors) > 1
+        plan: set[str] = set()
+
+        for sensor_type in env_sensor.sensor_types:
+            sum_sensor_types: list[str] = [
+                sum_sensor_type
+                for sum_sensor_type in DOCKER_SENSORS_SUM
+                if sensor_type
+                in (sum_sensor_type, SENSOR_SUM_SOURCES.get(sum_sensor_type))
+            ]
+
+            if self.is_entity_enabled(
+                entity_registry, env_sensor.unique_id + sensor_type
+            ) or (
+                use_sum_sensors
+                and any(
+                    self.is_entity_enabled(
+                        entity_registry,
+                        self.entry.options.get(CONF_UNIQUE_ID, "") + sum_sensor_type,
+                    )
+                    for sum_sensor_type in sum_sensor_types
+                )
+            ):
+                plan.update(SENSOR_ENDPOINTS[sensor_type])
+
+        # Per container and group sensors are filled from the same stats pass
+        if env_sensor.container_sensors or env_sensor.group_sensors:
+            plan.update((ENDPOINT_CONTAINERS, ENDPOINT_STATS))
+
+        return plan
+
+    # ------------------------------------------------------------------
+    def is_entity_enabled(
+        self, entity_registry: er.EntityRegistry, unique_id: str
+    ) -> bool:
+        """Is entity enabled, entities not registered yet counts as enabled."""
+
+        entity_id: str | None = entity_registry.async_get_entity_id(
+            Platform.SENSOR, DOMAIN, unique_id
+        )
+
+        if entity_id is None:
+            return True
+
+        entity_entry: er.RegistryEntry | None = entity_registry.async_get(entity_id)
+
+        return entity_entry is None or not entity_entry.disabled
+
+    # ------------------------------------------------------------------
+    @async_hass_add_executor_job()
+    def prune(
+        self, env_sensor: DockerData, prune_type: str, filters: dict[str, Any]
+    ) -> dict:
+        """Prune objects of a type."""
+
+        client: DockerClient = env_sensor.client
+
+        if prune_type == PRUNE_IMAGES:
+            return client.images.prune(filters)
+
+        if prune_type == PRUNE_CONTAINERS:
+            return client.containers.prune(filters)
+
+        if prune_type == PRUNE_VOLUMES:
+            return client.volumes.prune(filters)
+
+        if prune_type == PRUNE_NETWORKS:
+            return client.networks.prune(filters)
+
+        if prune_type == PRUNE_BUILD_CACHE:
+            return client.images.prune_builds(filters=filters or None)
+
+        return {}
+
+    # ------------------------------------------------------------------
+    @async_hass_add_executor_job()
+    def container_stats(self, container: Container) -> Any:
+        """Get stats for container."""
+
+        return container.stats(decode=False, stream=False)
+
+    # ------------------------------------------------------------------
+    async def async_container_stats(
+        self,
+        env_sensor: DockerData,
+        container: Container,
+        semaphore: asyncio.Semaphore,
+    ) -> dict | None:
+        """Get stats for container, limited by the engine profile."""
+
+        async with semaphore:
+            try:
+                async with asyncio.timeout(env_sensor.profile[CONF_TIMEOUT]):
+                    return await self.container_stats(container)
+
+            except (TimeoutError, docker_exception()) as err:
+                LOGGER.debug(
+                    "Error getting stats for container %s: %s", container.name, err
+                )
+                return None
+
+    # ------------------------------------------------------------------
+    @async_hass_add_executor_job()
+    def list_engine_containers(self, env_sensor: DockerData) -> Any:
+        """List all containers of the engine, not inspected."""
+
+        return env_sensor.client.api.containers(all=True)
+
+    # ------------------------------------------------------------------
+    def update_engine_containers(
+        self, env_sensor: DockerData, containers: list[EngineContainer]
+    ) -> None:
+        """Images and volumes in use and prunable containers of the engine."""
+
+        env_sensor.container_image_ids = {
+            container.image_id for container in containers
+        }
+        env_sensor.container_volume_names = {
+            volume_name
+            for container in containers
+            for volume_name in container.volume_names
+        }
+        env_sensor.prune_candidates[PRUNE_CONTAINERS] = {
+            container.container_id: PruneCandidate(
+                0, container.created, container.labels
+            )
+            for container in containers
+            if container.status in ("created", "exited", "dead")
+        }
+
+    # ------------------------------------------------------------------
+    def update_container_data(
+        self,
+        env_sensor: DockerData,
+        containers: list[Container],
+    ) -> list[Container]:
+        """Update container data, returns the running containers."""
+
+        env_sensor.values[SENSOR_CONTAINERS_RUNNING] = 0
+        env_sensor.values[SENSOR_CONTAINERS_STOPPED] = 0
+        env_sensor.containers_running.clear()
+        env_sensor.containers_stopped.clear()
+
+        self.fire_container_events(env_sensor, containers)
+
+        if env_sensor.group_sensors:
+            self.update_group_index(env_sensor, containers)
+
+        if any(sensor_type in SENSOR_HEALTH for sensor_type in env_sensor.sensor_types):
+            self.update_health_data(env_sensor, containers)
+
+        running: list[Container] = []
+
+        for container in containers:
+            if container.status != "running":
+                env_sensor.values[SENSOR_CONTAINERS_STOPPED] += 1
+                env_sensor.containers_stopped.append(container.name)
+                continue
+
+            env_sensor.values[SENSOR_CONTAINERS_RUNNING] += 1
+            env_sensor.containers_running.append(container.name)
+            running.append(container)
+
+        return running
+
+    # ------------------------------------------------------------------
+    async def async_update_usage_data(
+        self,
+        env_sensor: DockerData,
+        containers: list[Container],
+        running: list[Container],
+    ) -> None:
+        """Update cpu, memory and I/O usage of the running containers."""
+
+        # Cpu % and memory usage by container id. Containers found in the
+        # local cgroup filesystem don't need an api stats call.
+        usage: dict[str, tuple[float, int]] = {}
+        io_counters: dict[str, tuple[int, int, int, int]] = {}
+        get_io: bool = any(
+            sensor_type in SENSOR_IO for sensor_type in env_sensor.sensor_types
+        )
+
+        # The I/O counters are only in the api stats, so the cgroup reader
+        # is bypassed when the throughput sensors are selected
+        if env_sensor.cgroup_reader is not None and not get_io:
+            usage = await self.async_read_cgroup_usage(
+                env_sensor,
+                env_sensor.cgroup_reader,
+                [container.id for container in running],
+            )
+
+        api_containers: list[Container] = [
+            container for container in running if container.id not in usage
+        ]
+        sampled: list[Container] = self.select_stats_sample(env_sensor, api_containers)
+        api_usage: dict[str, tuple[float, int]] = {}
+        semaphore = asyncio.Semaphore(env_sensor.profile[CONF_MAX_PARALLEL_STATS])
+
+        for container, stats in zip(
+            sampled,
+            await asyncio.gather(
+                *(
+                    self.async_container_stats(env_sensor, container, semaphore)
+                    for container in sampled
+                )
+            ),
+            strict=True,
+        ):
+            if stats is not None:
+                api_usage[container.id] = self.calculate_usage(
+                    stats, env_sensor.cpu_normalization
+                )
+
+                if get_io:
+                    io_counters[container.id] = read_io_counters(stats)
+
+        # Containers not sampled this cycle keep the usage last sampled, the
+        # totals are estimated from how the sampled containers changed. The
+        # containers read from the cgroups are read every cycle.
+        previous_usage: dict[str, tuple[float, int]] = env_sensor.sampled_usage
+        cached: dict[str, tuple[float, int]] = {
+            container.id: previous_usage[container.id]
+            for container in api_containers
+            if container.id not in api_usage and container.id in previous_usage
+        }
+        api_cpu_percent, api_memory_usage = estimate_usage_totals(
+            api_usage,
+            previous_usage,
+            cached,
+            sum(
+                1
+                for container in api_containers
+                if container.id not in api_usage and container.id not in cached
+            ),
+        )
+        cpu_percent: float = api_cpu_percent + sum(
+            container_cpu for container_cpu, _ in usage.values()
+        )
+        memory_usage_bytes: int = int(api_memory_usage) + sum(
+            container_memory for _, container_memory in usage.values()
+        )
+        env_sensor.sampled_usage = api_usage | cached
+        usage.update(api_usage)
+        usage.update(cached)
+
+        env_sensor.values[SENSOR_CONTAINERS_CPU_PERCENT] = round(cpu_percent, 2)
+        env_sensor.values_uom[SENSOR_CONTAINERS_CPU_PERCENT] = "%"
+
+        memory_usage, uom = convert_bytes_to(memory_usage_bytes)
+
+        env_sensor.values[SENSOR_CONTAINERS_MEMORY_USAGE] = round(memory_usage, 2)
+        env_sensor.values_uom[SENSOR_CONTAINERS_MEMORY_USAGE] = uom
+
+        self.update_rolling_statistics(env_sensor, cpu_percent, memory_usage_bytes)
+
+        if get_io:
+            self.update_io_rates(env_sensor, running, io_counters)
+
+        env_sensor.container_usage = {
+            container.name: usage[container.id]
+            for container in running
+            if container.id in usage
+        }
+
+        if env_sensor.container_sensors:
+            self.update_container_stats(env_sensor, containers, usage)
+
+        if env_sensor.group_sensors:
+            self.update_group_usage(env_sensor, usage)
+
+    # ------------------------------------------------------------------
+    def fire_container_events(
+        self, env_sensor: DockerData, containers: list[Container]
+    ) -> None:
+        """Fire events for the containers changed since the last listing.
+
+        The listings are compared by container id. A container recreated
+        with another image, like by compose pull and up, is found by name
+        among the removed containers. Nothing is fired for the first listing.
+        """
+
+        previous_states: dict[str, ContainerState] | None = env_sensor.container_states
+        env_sensor.container_states = {
+            container.id: ContainerState(
+                container.name,
+                container.status == "running",
+                (container.attrs.get("Config") or {}).get("Image", ""),
+                container.attrs.get("Image", ""),
+            )
+            for container in containers
+        }
+
+        if previous_states is None:
+            return
+
+        removed: dict[str, tuple[str, ContainerState]] = {
+            state.name: (container_id, state)
+            for container_id, state in previous_states.items()
+            if container_id not in env_sensor.container_states
+        }
+
+        for container_id, state in env_sensor.container_states.items():
+            previous: ContainerState | None = previous_states.get(container_id)
+
+            if previous is None and state.name in removed:
+                previous_id, previous = removed[state.name]
+
+                if previous.image_id != state.image_id:
+                    self.fire_container_event(
+                        env_sensor,
+                        EVENT_CONTAINER_IMAGE_CHANGED,
+                        container_id,
+                        state,
+                        previous_container_id=previous_id,
+                        previous_image=previous.image,
+                        previous_image_id=previous.image_id,
+                    )
+
+            if state.running and (previous is None or not previous.running):
+                self.fire_container_event(
+                    env_sensor, EVENT_CONTAINER_STARTED, container_id, state
+                )
+            elif not state.running and previous is not None and previous.running:
+                self.fire_container_event(
+                    env_sensor, EVENT_CONTAINER_STOPPED, container_id, state
+                )
+
+        for container_id, state in removed.values():
+            self.fire_container_event(
+                env_sensor, EVENT_CONTAINER_REMOVED, container_id, state
+            )
+
+    # ------------------------------------------------------------------
+    def fire_container_event(
+        self,
+        env_sensor: DockerData,
+        event_type: str,
+        container_id: str,
+        state: ContainerState,
+        **extra: str,
+    ) -> None:
+        """Fire a container event with the container and what changed."""
+
+        self.hass.bus.async_fire(
+            event_type,
+            {
+                "engine": env_sensor.sensor_name,
+                "container_id": container_id,
+                "container_name": state.name,
+                "image": state.image,
+                "image_id": state.image_id,
+                **extra,
+            },
+        )
+
+    # ------------------------------------------------------------------
+    def update_health_data(
+        self, env_sensor: DockerData, containers: list[Container]
+    ) -> None:
+        """Update health and restart loop data from the container listing.
+
+        The listing already holds the state and restart count of each
+        container, so nothing more is asked from the engine.
+        """
+
+        env_sensor.containers_unhealthy = []
+        env_sensor.containers_starting = []
+        env_sensor.containers_restarting = []
+
+        for container in containers:
+            health: str | None = (
+                (container.attrs.get("State") or {}).get("Health") or {}
+            ).get("Status")
+
+            if health == "unhealthy":
+                env_sensor.containers_unhealthy.append(container.name)
+            elif health == "starting":
+                env_sensor.containers_starting.append(container.name)
+
+            if container.status == "restarting":
+                env_sensor.containers_restarting.append(container.name)
+
+        looping: set[str] = env_sensor.restart_loop.update(
+            {
+                container.id: container.attrs.get("RestartCount") or 0
+                for container in containers
+            }
+        )
+        env_sensor.containers_restart_loop = [
+            container.name for container in containers if container.id in looping
+        ]
+
+        env_sensor.values[SENSOR_CONTAINERS_UNHEALTHY] = len(
+            env_sensor.containers_unhealthy
+        )
+        env_sensor.values[SENSOR_CONTAINERS_STARTING] = len(
+            env_sensor.containers_starting
+        )
+        env_sensor.values[SENSOR_CONTAINERS_RESTARTING] = len(
+            env_sensor.containers_restarting
+        )
+        env_sensor.values[SENSOR_CONTAINERS_RESTART_LOOP] = len(
+            env_sensor.containers_restart_loop
+        )
+
+    # ------------------------------------------------------------------
+    def update_group_index(
+        self, env_sensor: DockerData, containers: list[Container]
+    ) -> None:
+        """Index the containers by the value of the group label.
+
+        Built from the container listing, so no query is made per group.
+        Usage is kept from the previous index until stats are collected.
+        """
+
+        previous_groups: dict[str, GroupStats] = env_sensor.groups
+        env_sensor.groups = {}
+        env_sensor.container_groups = {}
+
+        for container in containers:
+            group_name: str | None = (container.labels or {}).get(
+                env_sensor.group_label
+            )
+
+            if not group_name:
+                continue
+
+            if group_name not in env_sensor.groups:
+                previous: GroupStats | None = previous_groups.get(group_name)
+                env_sensor.groups[group_name] = GroupStats(
+                    cpu_percent=0.0 if previous is None else previous.cpu_percent,
+                    memory_usage=0 if previous is None else previous.memory_usage,
+                )
+
+            group: GroupStats = env_sensor.groups[group_name]
+
+            if container.status == "running":
+                group.running.append(container.name)
+            else:
+                group.stopped.append(container.name)
+
+            env_sensor.container_groups[container.id] = group_name
+
+    # ------------------------------------------------------------------
+    def update_group_usage(
+        self, env_sensor: DockerData, usage: dict[str, tuple[float, int]]
+    ) -> None:
+        """Sum the CPU % and memory usage of the containers in each group."""
+
+        for group in env_sensor.groups.values():
+            group.cpu_percent = 0.0
+            group.memory_usage = 0
+
+        for container_id, (cpu_percent, memory_usage) in usage.items():
+            group_name: str | None = env_sensor.container_groups.get(container_id)
+
+            if group_name is not None:
+                env_sensor.groups[group_name].cpu_percent += cpu_percent
+                env_sensor.groups[group_name].memory_usage += memory_usage
+
+    # ------------------------------------------------------------------
+    def get_rolling_window_size(self, env_sensor: DockerData) -> int:
+        """Number of stats samples in the rolling window of an engine."""
+
+        return min(
+            ceil(
+                int(self.entry.options.get(CONF_ROLLING_WINDOW, DEFAULT_ROLLING_WINDOW))
+                / self.get_endpoint_interval(env_sensor, ENDPOINT_STATS)
+            ),
+            MAX_ROLLING_WINDOW_SAMPLES,
+        )
+
+    # ------------------------------------------------------------------
+    def update_rolling_statistics(
+        self, env_sensor: DockerData, cpu_percent: float, memory_usage_bytes: int
+    ) -> None:
+        """Add engine samples to the rolling windows and update the sensors."""
+
+        if not any(
+            sensor_type in SENSOR_ROLLING for sensor_type in env_sensor.sensor_types
+        ):
+            return
+
+        for sensor_type, value in (
+            (SENSOR_CONTAINERS_CPU_PERCENT, cpu_percent),
+            (SENSOR_CONTAINERS_MEMORY_USAGE, memory_usage_bytes),
+        ):
+            if sensor_type not in env_sensor.rolling:
+                env_sensor.rolling[sensor_type] = RingBuffer(
+                    self.get_rolling_window_size(env_sensor)
+                )
+
+            env_sensor.rolling[sensor_type].append(value)
+
+        for sensor_type, (source_type, statistic) in SENSOR_ROLLING.items():
+            value = rolling_statistic(env_sensor.rolling[source_type], statistic)
+            uom: str = "%"
+
+            if source_type == SENSOR_CONTAINERS_MEMORY_USAGE:
+                value, uom = convert_bytes_to(value)
+
+            env_sensor.values[sensor_type] = round(value, 2)
+            env_sensor.values_uom[sensor_type] = uom
+
+    # ------------------------------------------------------------------
+    def update_io_rates(
+        self,
+        env_sensor: DockerData,
+        running: list[Container],
+        io_counters: dict[str, tuple[int, int, int, int]],
+    ) -> None:
+        """Calculate network and disk throughput from the previous samples.
+
+        Rates are per container, from its previous sample. A counter lower
+        than in the previous sample means the container was restarted, and
+        that counter is skipped until the next sample. Containers not sampled
+        this cycle keep their last rates, and the totals are estimated like
+        the CPU % and memory usage totals.
+        """
+
+        now: float = time.monotonic()
+        fresh: dict[str, tuple[float, ...]] = {}
+
+        for container_id, counters in io_counters.items():
+            previous: IoSample | None = env_sensor.io_samples.get(container_id)
+
+            if previous is None or now <= previous.time:
+                continue
+
+            elapsed: float = now - previous.time
+            fresh[container_id] = tuple(
+                (current - last) / elapsed if current >= last else 0.0
+                for current, last in zip(counters, previous.counters, strict=True)
+            )
+
+        previous_rates: dict[str, tuple[float, ...]] = {
+            container_id: sample.rates
+            for container_id, sample in env_sensor.io_samples.items()
+            if sample.rates is not None
+        }
+        cached: dict[str, tuple[float, ...]] = {
+            container.id: previous_rates[container.id]
+            for container in running
+            if container.id not in io_counters and container.id in previous_rates
+        }
+        rates: tuple[float, ...] = estimate_usage_totals(
+            fresh,
+            previous_rates,
+            cached,
+            sum(
+                1
+                for container in running
+                if container.id not in fresh and container.id not in cached
+            ),
+            len(SENSOR_IO),
+        )
+
+        # Keep the last sample of running containers not sampled or whose
+        # stats call failed
+        env_sensor.io_samples = {
+            container.id: IoSample(
+                now, io_counters[container.id], fresh.get(container.id)
+            )
+            if container.id in io_counters
+            else env_sensor.io_samples[container.id]
+            for container in running
+            if container.id in io_counters or container.id in env_sensor.io_samples
+        }
+
+        for sensor_type, rate in zip(SENSOR_IO, rates, strict=True):
+            value, uom = convert_bytes_to(rate)
+            env_sensor.values[sensor_type] = round(value, 2)
+            env_sensor.values_uom[sensor_type] = f"{uom}/s"
+
+    # ------------------------------------------------------------------
+    def calculate_usage(self, stats: dict, cpu_normalization: str) -> tuple[float, int]:
+        """Calculate cpu % and memory usage from container stats.
+
+        Same formulas as docker stats, with the CPU % normalized by the
+        selected mode and the page cache left out of the memory usage.
+        """
+
+        cpu_stats: dict = stats["cpu_stats"]
+        precpu_stats: dict = stats.get("precpu_stats") or {}
+
+        cpu_percent: float = 0.0
+        cpu_delta = float(cpu_stats["cpu_usage"]["total_usage"]) - float(
+            (precpu_stats.get("cpu_usage") or {}).get("total_usage", 0)
+        )
+        system_cpu_delta = float(cpu_stats.get("system_cpu_usage", 0)) - float(
+            precpu_stats.get("system_cpu_usage", 0)
+        )
+
+        if system_cpu_delta > 0.0 and cpu_delta > 0.0:
+            cpu_percent = (
+                (cpu_delta / system_cpu_delta)
+                * cpu_count_for_normalization(cpu_stats, cpu_normalization)
+                * 100.0
+            )
+
+        memory_stats: dict = stats["memory_stats"]
+        memory_usage: int = memory_stats.get("usage", 0)
+        memory_stat: dict = memory_stats.get("stats") or {}
+
+        # total_inactive_file with cgroup v1, inactive_file with cgroup v2
+        inactive_file: int = memory_stat.get(
+            "total_inactive_file", memory_stat.get("inactive_file", 0)
+        )
+
+        if inactive_file < memory_usage:
+            memory_usage -= inactive_file
+
+        return (cpu_percent, memory_usage)
+
+    # ------------------------------------------------------------------
+    def update_container_stats(
+        self,
+        env_sensor: DockerData,
+        containers: list[Container],
+        usage: dict[str, tuple[float, int]],
+    ) -> None:
+        """Keep the stats of the selected containers for per container sensors.
+
+        Stopped containers keeps their sensors with zero values, sensors are
+        only removed when the container is gone. Containers are selected by
+        the include/exclude patterns and capped by name order.
+        """
+
+        selected: list[Container] = sorted(
+            (
+                container
+                for container in containers
+                if env_sensor.is_container_sensor_selected(container.name)
+            ),
+            key=lambda container: container.name,
+        )[: env_sensor.container_sensors_max]
+
+        previous_stats: dict[str, ContainerStats] = env_sensor.container_stats
+        env_sensor.container_stats = {}
+
+        for container in selected:
+            if container.id in usage:
+                cpu_percent, memory_usage = usage[container.id]
+                env_sensor.container_stats[container.name] = ContainerStats(
+                    container.id, round(cpu_percent, 2), memory_usage
+                )
+            elif (
+                container.status == "running"
+                and container.name in previous_stats
+                and previous_stats[container.name].container_id == container.id
+            ):
+                # Stats call failed, keep the last known values
+                env_sensor.container_stats[container.name] = previous_stats[
+                    container.name
+                ]
+            else:
+                env_sensor.container_stats[container.name] = ContainerStats(
+                    container.id
+                )
+
+        # Rolling windows per container, bounded by the container sensors cap
+        if not any(
+            sensor_type in SENSOR_ROLLING for sensor_type in env_sensor.sensor_types
+        ):
+            return
+
+        window_size: int = self.get_rolling_window_size(env_sensor)
+
+        env_sensor.container_rolling = {
+            name: env_sensor.container_rolling.get(name)
+            or {
+                SENSOR_CONTAINER_CPU_PERCENT: RingBuffer(window_size),
+                SENSOR_CONTAINER_MEMORY_USAGE: RingBuffer(window_size),
+            }
+            for name in env_sensor.container_stats
+        }
+
+        for name, stats in env_sensor.container_stats.items():
+            env_sensor.container_rolling[name][SENSOR_CONTAINER_CPU_PERCENT].append(
+                stats.cpu_percent
+            )
+            env_sensor.container_rolling[name][SENSOR_CONTAINER_MEMORY_USAGE].append(
+                stats.memory_usage
+            )
+
+    # ------------------------------------------------------------------
+    @async_hass_add_executor_job()
+    def client_image_list(
+        self, env_sensor: DockerData, name=None, all=False, filters=None
+    ) -> Any:
+        """Client image list."""
+
+        return env_sensor.client.images.list(name, all, filters)
+
+    # ------------------------------------------------------------------
+    async def async_update_image_data(
+        self,
+        env_sensor: DockerData,
+        plan: set[str],
+    ) -> list[Image] | None:
+        """Update image data, returns the images if they were listed.
+
+        Images are classified as used against the containers of the last
+        container listing.
+        """
+
+        if ENDPOINT_IMAGES_DANGLING in plan:
+            env_sensor.values[SENSOR_IMAGES_DANGLING] = len(
+                await self.client_image_list(
+                    env_sensor, None, False, {"dangling": True}
+                )
+            )
+
+        if ENDPOINT_IMAGES not in plan:
+            return None
+
+        env_sensor.images_unused.clear()
+        images: list[Image] = await self.client_image_list(env_sensor)
+        candidates: dict[str, PruneCandidate] = {}
+
+        env_sensor.values[SENSOR_IMAGES] = len(images)
+
+        tmp_count: int = 0
+
+        for image in images:
+            if image.id in env_sensor.container_image_ids:
+                tmp_count += 1
+                continue
+
+            # Layers shared between images are counted for each image, so
+            # the reclaimed bytes of a dry run are an upper bound
+            candidates[image.id] = PruneCandidate(
+                image.attrs.get("Size", 0),
+                parse_docker_time(image.attrs.get("Created")),
+                image.labels,
+            )
+
+            if len(image.tags) > 0:
+                env_sensor.images_unused.append(image.tags[0])
+
+        env_sensor.values[SENSOR_IMAGES_UNUSED] = (
+            env_sensor.values[SENSOR_IMAGES] - tmp_count
+        )
+        env_sensor.prune_candidates[PRUNE_IMAGES] = candidates
+
+        return images
+
+    # ------------------------------------------------------------------
+    async def async_update_image_updates_data(
+        self,
+        env_sensor: DockerData,
+        containers: list[Container],
+        images: list[Image] | None,
+    ) -> None:
+        """Check the images of running containers for updates in the registry.
+
+        Images built locally or pinned to a digest have nothing to compare
+        against and are skipped.
+        """
+
+        if images is None:
+            images = await self.client_image_list(env_sensor)
+
+        repo_digests: dict[str, list[str]] = {
+            image.id: image.attrs.get("RepoDigests") or [] for image in images
+        }
+        checks: dict[str, tuple[tuple[str, str, str], set[str]]] = {}
+
+        for container in containers:
+            if container.status != "running":
+                continue
+
+            reference: str = container.attrs.get("Config", {}).get("Image", "")
+            image_reference: tuple[str, str, str] | None = parse_image_reference(
+                reference
+            )
+
+            if image_reference is None or reference in checks:
+                continue
+
+            digests: set[str] = local_digests(
+                repo_digests.get(container.attrs.get("Image", ""), []),
+                image_reference[0],
+                image_reference[1],
+            )
+
+            if digests:
+                checks[reference] = (image_reference, digests)
+
+        registry_digests: list[str | None] = await asyncio.gather(
+            *(
+                self.registry_resolver.async_get_digest(*image_reference)
+                for image_reference, _ in checks.values()
+            )
+        )
+
+        env_sensor.images_with_updates = sorted(
+            reference
+            for (reference, (_, digests)), registry_digest in zip(
+                checks.items(), registry_digests, strict=True
+            )
+            if registry_digest is not None and registry_digest not in digests
+        )
+        env_sensor.values[SENSOR_IMAGES_WITH_UPDATES] = len(
+            env_sensor.images_with_updates
+        )
+
+    # ------------------------------------------------------------------
+    @async_hass_add_executor_job()
+    def client_volumes_list(self, env_sensor: DockerData) -> Any:
+        """Client image list."""
+
+        return env_sensor.client.volumes.list()
+
+    # ------------------------------------------------------------------
+    async def async_update_volume_data(self, env_sensor: DockerData) -> None:
+        """Update volume data.
+
+        Volumes are classified as used against the containers of the last
+        container listing.
+        """
+
+        env_sensor.volumes_unused.clear()
+
+        volumes: list[Volume] = await self.client_volumes_list(env_sensor)
+        candidates: dict[str, PruneCandidate] = {}
+
+        env_sensor.values[SENSOR_VOLUMES] = len(volumes)
+
+        tmp_count: int = 0
+
+        for volume in volumes:
+            if volume.name in env_sensor.container_volume_names:
+                tmp_count += 1
+                continue
+
+            env_sensor.volumes_unused.append(volume.name)
+            labels: dict[str, str] = volume.attrs.get("Labels") or {}
+
+            # A volume prune only removes anonymous volumes
+            if "com.docker.volume.anonymous" in labels:
+                candidates[volume.name] = PruneCandidate(
+                    0, parse_docker_time(volume.attrs.get("CreatedAt")), labels
+                )
+
+        env_sensor.values[SENSOR_VOLUMES_UNUSED] = (
+            env_sensor.values[SENSOR_VOLUMES] - tmp_count
+        )
+        env_sensor.prune_candidates[PRUNE_VOLUMES] = candidates
+
+    # ------------------------------------------------------------------
+    @async_hass_add_executor_job()
+    def client_df(self, env_sensor: DockerData) -> Any:
+        """Client disk usage."""
+
+        return env_sensor.client.df()
+
+    # ------------------------------------------------------------------
+    async def async_update_disk_usage_data(self, env_sensor: DockerData) -> None:
+        """Update disk usage data.
+
+        Sizes of the prune candidates are filled in from the same query, so
+        dry runs can report the space a prune would reclaim.
+        """
+
+        disk_usage: dict = await self.client_df(env_sensor)
+
+        for sensor_type, size in disk_usage_sizes(disk_usage).items():
+            value, uom = convert_bytes_to(size)
+            env_sensor.values[sensor_type] = round(value, 2)
+            env_sensor.values_uom[sensor_type] = uom
+
+        candidates: dict[str, PruneCandidate]
+
+        for prune_type, items, item_id, get_size in (
+            (
+                PRUNE_CONTAINERS,
+                disk_usage.get("Containers"),
+                "Id",
+                lambda item: item.get("SizeRw") or 0,
+            ),
+            (
+                PRUNE_VOLUMES,
+                disk_usage.get("Volumes"),
+                "Name",
+                lambda item: max((item.get("UsageData") or {}).get("Size", -1), 0),
+            ),
+        ):
+            candidates = env_sensor.prune_candidates.get(prune_type, {})
+
+            for item in items or []:
+                if item.get(item_id) in candidates:
+                    candidates[item[item_id]].size = get_size(item)
+
+        env_sensor.prune_candidates[PRUNE_BUILD_CACHE] = {
+            build_cache["ID"]: PruneCandidate(
+                build_cache.get("Size") or 0,
+                parse_docker_time(
+                    build_cache.get("LastUsedAt") or build_cache.get("CreatedAt")
+                ),
+            )
+            for build_cache in disk_usage.get("BuildCache") or []
+            if not build_cache.get("InUse", False)
+            and not build_cache.get("Shared", False)
+        }
+
+    # ------------------------------------------------------------------
+    @async_hass_add_executor_job()
+    def docker_client(self, base_url: str, timeout: int) -> Any:
+        """Get docker client, docker is imported here in the executor."""
+        import docker  # noqa: PLC0415
+
+        return docker.DockerClient(base_url, timeout=timeout)
+
+    # ------------------------------------------------------------------
+    def is_engine_available(self, env_sensor_name: str) -> bool:
+        """Is engine available, it has answered or has a restored snapshot."""
+
+        env_sensor: DockerData = self.env_sensors[env_sensor_name]
+
+        if env_sensor.connection_error or env_sensor.collection_error:
+            return False
+
+        return env_sensor.last_updated is not None
+
+    # ------------------------------------------------------------------
+    def is_any_engine_available(self) -> bool:
+        """Is any engine available."""
+
+        return any(
+            self.is_engine_available(env_sensor_name)
+            for env_sensor_name in self.env_sensors
+        )
+
+    # ------------------------------------------------------------------
     def get_value(self, env_sensor_name: str, sensor_type: str) -> int | float:
         """Get value."""
         return self.env_sensors[env_sensor_name].values.get(sensor_type, 0)
@@ -349,10 +2672,159 @@ class ComponentApi:
         """Get value unit of measurement."""
         return self.env_sensors[env_sensor_name].values_uom.get(sensor_type, None)
 
+    # ------------------------------------------------------------------
+    def get_container_names(self, env_sensor_name: str) -> list[str]:
+        """Names of containers with per container sensors."""
+
+        env_sensor: DockerData = self.env_sensors[env_sensor_name]
+
+        if not env_sensor.container_sensors:
+            return []
+
+        return list(env_sensor.container_stats)
+
+    # ------------------------------------------------------------------
+    def get_group_names(self, env_sensor_name: str) -> list[str]:
+        """Names of groups with per group sensors."""
+
+        env_sensor: DockerData = self.env_sensors[env_sensor_name]
+
+        if not env_sensor.group_sensors:
+            return []
+
+        return list(env_sensor.groups)
+
+    # ------------------------------------------------------------------
+    def get_group_value(
+        self, env_sensor_name: str, group_name: str, sensor_type: str
+    ) -> tuple[int | float | None, str | None]:
+        """Get value and unit of measurement for a per group sensor."""
+
+        group: GroupStats | None = self.env_sensors[env_sensor_name].groups.get(
+            group_name
+        )
+
+        if group is None:
+            return (None, None)
+
+        if sensor_type == SENSOR_CONTAINERS_RUNNING:
+            return (len(group.running), None)
+
+        if sensor_type == SENSOR_CONTAINERS_STOPPED:
+            return (len(group.stopped), None)
+
+        if sensor_type == SENSOR_CONTAINERS_CPU_PERCENT:
+            return (round(group.cpu_percent, 2), "%")
+
+        memory_usage, uom = convert_bytes_to(group.memory_usage)
+        return (round(memory_usage, 2), uom)
+
+    # ------------------------------------------------------------------
+    def get_group_extra_state_attributes(
+        self, env_sensor_name: str, group_name: str, sensor_type: str
+    ) -> dict:
+        """Get attributes for a per group sensor."""
+
+        group: GroupStats | None = self.env_sensors[env_sensor_name].groups.get(
+            group_name
+        )
+
+        if group is None:
+            return {}
+
+        if sensor_type == SENSOR_CONTAINERS_RUNNING:
+            return {"Running": group.running}
+
+        if sensor_type == SENSOR_CONTAINERS_STOPPED:
+            return {"Stopped": group.stopped}
+
+        return {}
+
+    # ------------------------------------------------------------------
+    def get_container_value(
+        self, env_sensor_name: str, container_name: str, sensor_type: str
+    ) -> tuple[float | None, str | None]:
+        """Get value and unit of measurement for a per container sensor."""
+
+        stats: ContainerStats | None = self.env_sensors[
+            env_sensor_name
+        ].container_stats.get(container_name)
+
+        if stats is None:
+            return (None, None)
+
+        if sensor_type == SENSOR_CONTAINER_CPU_PERCENT:
+            return (stats.cpu_percent, "%")
+
+        memory_usage, uom = convert_bytes_to(stats.memory_usage)
+        return (round(memory_usage, 2), uom)
+
+    # ------------------------------------------------------------------
+    def update_top_consumers(self) -> None:
+        """Rank the containers of all engines by CPU % and memory usage.
+
+        The containers are streamed through a heap of top N size, so the
+        full list of containers is never sorted.
+        """
+
+        top_n: int = int(self.entry.options.get(CONF_TOP_N, DEFAULT_TOP_N))
+
+        for sensor_type, usage_index in (
+            (SENSOR_TOP_CPU_PERCENT, 0),
+            (SENSOR_TOP_MEMORY_USAGE, 1),
+        ):
+            self.top_consumers[sensor_type] = heapq.nlargest(
+                top_n,
+                (
+                    (container_usage[usage_index], env_sensor.sensor_name, name)
+                    for env_sensor in self.env_sensors.values()
+                    for name, container_usage in env_sensor.container_usage.items()
+                ),
+            )
+
+    # ------------------------------------------------------------------
+    def get_container_extra_state_attributes(
+        self, env_sensor_name: str, container_name: str, sensor_type: str
+    ) -> dict:
+        """Get rolling window attributes for a per container sensor."""
+
+        buffer: RingBuffer | None = (
+            self.env_sensors[env_sensor_name]
+            .container_rolling.get(container_name, {})
+            .get(sensor_type)
+        )
+
+        if buffer is None:
+            return {}
+
+        attributes: dict = {}
+
+        for statistic in ("mean", "max", "p95"):
+            value: float = rolling_statistic(buffer, statistic)
+
+            if sensor_type == SENSOR_CONTAINER_MEMORY_USAGE:
+                memory_usage, uom = convert_bytes_to(value)
+                attributes[statistic.capitalize()] = f"{round(memory_usage, 2)} {uom}"
+            else:
+                attributes[statistic.capitalize()] = round(value, 2)
+
+        return attributes
+
     # ------------------------------------------------------------------
     def get_value_sum(self, sensor_type: str) -> int | float:
         """Get value sum."""
 
+        if sensor_type in SENSOR_SUM_SOURCES:
+            top_consumers = self.top_consumers.get(sensor_type, [])
+
+            if len(top_consumers) == 0:
+                return 0
+
+            if sensor_type == SENSOR_TOP_MEMORY_USAGE:
+                return round(convert_bytes_to(top_consumers[0][0])[0], 2)
+
+            return round(top_consumers[0][0], 2)
+
         tmp_sum: int | float = 0
 
         for sensor in self.env_sensors.values():
@@ -364,6 +2836,14 @@ class ComponentApi:
     def get_value_sum_uom(self, sensor_type: str) -> str | None:
         """Get value sum."""
 
+        if sensor_type == SENSOR_TOP_CPU_PERCENT:
+            return "%"
+
+        if sensor_type == SENSOR_TOP_MEMORY_USAGE:
+            top_consumers = self.top_consumers.get(sensor_type, [])
+
+            return convert_bytes_to(top_consumers[0][0] if top_consumers else 0)[1]
+
         for sensor in self.env_sensors.values():
             if sensor.values.get(sensor_type, None) is not None:
                 return sensor.values_uom.get(sensor_type, None)
@@ -376,16 +2856,78 @@ class ComponentApi:
     ) -> dict:
         """Get attributes."""
 
+        env_sensor: DockerData = self.env_sensors[env_sensor_name]
+        attributes: dict = {}
+
         if sensor_type == SENSOR_CONTAINERS_RUNNING:
-            return {"Running": self.env_sensors[env_sensor_name].containers_running}
-        elif sensor_type == SENSOR_CONTAINERS_STOPPED:  # noqa: RET505
-            return {"Stopped": self.env_sensors[env_sensor_name].containers_stopped}
+            attributes["Running"] = env_sensor.containers_running
+        elif sensor_type == SENSOR_CONTAINERS_STOPPED:
+            attributes["Stopped"] = env_sensor.containers_stopped
         elif sensor_type == SENSOR_IMAGES_UNUSED:
-            return {"Unused": self.env_sensors[env_sensor_name].images_unused}
+            attributes["Unused"] = env_sensor.images_unused
+        elif sensor_type == SENSOR_IMAGES_WITH_UPDATES:
+            attributes["Updates"] = env_sensor.images_with_updates
         elif sensor_type == SENSOR_VOLUMES_UNUSED:
-            return {"Unused": self.env_sensors[env_sensor_name].volumes_unused}
+            attributes["Unused"] = env_sensor.volumes_unused
+        elif sensor_type == SENSOR_CONTAINERS_UNHEALTHY:
+            attributes["Unhealthy"] = env_sensor.containers_unhealthy
+        elif sensor_type == SENSOR_CONTAINERS_STARTING:
+            attributes["Starting"] = env_sensor.containers_starting
+        elif sensor_type == SENSOR_CONTAINERS_RESTARTING:
+            attributes["Restarting"] = env_sensor.containers_restarting
+        elif sensor_type == SENSOR_CONTAINERS_RESTART_LOOP:
+            attributes["Restart loop"] = env_sensor.containers_restart_loop
+        elif sensor_type == SENSOR_COLLECTION_OVERRUNS:
+            attributes["Last cycle duration"] = round(env_sensor.cycle_duration, 2)
+            attributes["Skipped cycles"] = env_sensor.skipped_cycles
+            attributes["Stats sampled"] = (
+                "All"
+                if env_sensor.stats_sampled >= env_sensor.stats_container_count
+                else f"{env_sensor.stats_sampled}/{env_sensor.stats_container_count}"
+            )
+        elif sensor_type in SENSOR_EVENTS:
+            for name, window in EVENTS_ATTRIBUTE_WINDOWS.items():
+                attributes[name] = env_sensor.event_counters[sensor_type].count(window)
+
+            attributes["Recent"] = list(env_sensor.recent_events[sensor_type])
+
+        if env_sensor.stale:
+            attributes["Stale"] = True
+            attributes["Last updated"] = (
+                None
+                if env_sensor.last_updated is None
+                else env_sensor.last_updated.isoformat()
+            )
 
-        return {}
+        return attributes
+
+    # ------------------------------------------------------------------
+    def get_sum_extra_state_attributes(self, sensor_type: str) -> dict:
+        """Get attributes for sum sensor."""
+
+        if sensor_type not in SENSOR_SUM_SOURCES:
+            return {}
+
+        top: list[dict[str, Any]] = []
+
+        for value, env_sensor_name, container_name in self.top_consumers.get(
+            sensor_type, []
+        ):
+            if sensor_type == SENSOR_TOP_MEMORY_USAGE:
+                memory_usage, uom = convert_bytes_to(value)
+                value_str = f"{round(memory_usage, 2)} {uom}"
+            else:
+                value_str = f"{round(value, 2)} %"
+
+            top.append(
+                {
+                    "Container": container_name,
+                    "Environment": env_sensor_name,
+                    "Value": value_str,
+                }
+            )
+
+        return {"Top": top}
 
     # ------------------------------------------------------------------
     def create_issue(
@@ -6,8 +6,6 @@ from collections.abc import Mapping
 from typing import Any, cast
 import uuid
 
-import docker
-from docker import errors
 import voluptuous as vol
 
 # from homeassistant.components.sensor import DOMAIN as CONF_SENSORS
@@ -25,20 +23,64 @@ from homeassistant.helpers.selector import (
     NumberSelector,
     NumberSelectorConfig,
     NumberSelectorMode,
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
     TextSelector,
+    TextSelectorConfig,
 )
 from homeassistant.util.uuid import random_uuid_hex
 
 from .const import (
+    CONF_CHECK_FOR_IMAGES_UPDATES,
+    CONF_CHECK_FOR_UPDATED_IMAGES_HOURS,
+    CONF_CONTAINER_SENSORS,
+    CONF_CONTAINER_SENSORS_EXCLUDE,
+    CONF_CONTAINER_SENSORS_INCLUDE,
+    CONF_CONTAINER_SENSORS_MAX,
+    CONF_CONTAINERS_INTERVAL,
+    CONF_CPU_NORMALIZATION,
+    CONF_DISK_USAGE_INTERVAL,
     CONF_DOCKER_BASE_NAME,
     CONF_DOCKER_BASE_NAME_USE_IN_SENSOR_NAME,
     CONF_DOCKER_ENGINE_URL,
     CONF_DOCKER_ENV_SENSOR_NAME,
+    CONF_EXCLUDE_LABELS,
+    CONF_EXCLUDE_NAMES,
+    CONF_EXCLUDE_PROJECTS,
+    CONF_FULL_SWEEP_INTERVAL,
+    CONF_GROUP_LABEL,
+    CONF_GROUP_SENSORS,
+    CONF_IMAGES_INTERVAL,
+    CONF_INCLUDE_LABELS,
+    CONF_INCLUDE_NAMES,
+    CONF_INCLUDE_PROJECTS,
     CONF_INDEX,
+    CONF_LOCAL_CGROUP_STATS,
+    CONF_MAX_PARALLEL_STATS,
+    CONF_PROFILE,
+    CONF_ROLLING_WINDOW,
+    CONF_SENSOR_GROUPS,
     CONF_SENSORS,
+    CONF_STATS_BUDGET,
+    CONF_STATS_INTERVAL,
+    CONF_TIMEOUT,
+    CONF_TOP_N,
+    CONF_VOLUMES_INTERVAL,
+    CPU_NORMALIZATIONS,
+    DEFAULT_CHECK_FOR_UPDATED_IMAGES,
+    DEFAULT_CONTAINER_SENSORS_MAX,
+    DEFAULT_CPU_NORMALIZATION,
+    DEFAULT_GROUP_LABEL,
+    DEFAULT_PROFILE,
+    DEFAULT_ROLLING_WINDOW,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SENSOR_GROUPS,
+    DEFAULT_TOP_N,
     DOMAIN,
     LOGGER,
+    PROFILES,
+    SENSOR_GROUPS,
 )
 from .hass_util import async_hass_add_executor_job
 
@@ -64,7 +106,10 @@ async def validate_docker_base_edit(
 # ------------------------------------------------------------------
 @async_hass_add_executor_job()
 def validate_docker_url(base_url: str) -> None:
-    """Validate base url input."""
+    """Validate base url input, docker is imported here in the executor."""
+    import docker  # noqa: PLC0415
+    from docker import errors  # noqa: PLC0415
+
     try:
         client: docker.DockerClient = docker.DockerClient(base_url)
         client.close()
@@ -152,6 +197,13 @@ async def validate_docker_sensor_edit(
     # Standard behavior is to merge the result with the options.
     # In this case, we want to add a sub-item so we update the options directly.
     idx: int = handler.flow_state["_idx"]
+
+    # Optional fields left empty are removed, profile overrides then falls
+    # back to the profile preset
+    for key in DOCKER_SENSOR_SETUP:
+        if isinstance(key, vol.Optional) and key.schema not in user_input:
+            handler.options[CONF_SENSORS][idx].pop(key.schema, None)
+
     handler.options[CONF_SENSORS][idx].update(user_input)
     return {}
 
@@ -219,10 +271,123 @@ DOCKER_BASE_SETUP = {
             min=5, step=1, mode=NumberSelectorMode.BOX, unit_of_measurement="Minutes"
         )
     ),
+    vol.Required(
+        CONF_CHECK_FOR_UPDATED_IMAGES_HOURS,
+        default=DEFAULT_CHECK_FOR_UPDATED_IMAGES,
+    ): NumberSelector(
+        NumberSelectorConfig(
+            min=1, step=1, mode=NumberSelectorMode.BOX, unit_of_measurement="Hours"
+        )
+    ),
+    vol.Required(
+        CONF_TOP_N,
+        default=DEFAULT_TOP_N,
+    ): NumberSelector(
+        NumberSelectorConfig(min=1, max=50, step=1, mode=NumberSelectorMode.BOX)
+    ),
+    vol.Required(
+        CONF_ROLLING_WINDOW,
+        default=DEFAULT_ROLLING_WINDOW,
+    ): NumberSelector(
+        NumberSelectorConfig(
+            min=5, step=1, mode=NumberSelectorMode.BOX, unit_of_measurement="Minutes"
+        )
+    ),
 }
 
 DOCKER_SENSOR_SETUP = {
     vol.Required(CONF_DOCKER_ENGINE_URL): TextSelector(),
+    vol.Required(CONF_CHECK_FOR_IMAGES_UPDATES, default=False): BooleanSelector(),
+    vol.Required(
+        CONF_SENSOR_GROUPS,
+        default=DEFAULT_SENSOR_GROUPS,
+    ): SelectSelector(
+        SelectSelectorConfig(
+            options=list(SENSOR_GROUPS),
+            multiple=True,
+            mode=SelectSelectorMode.LIST,
+            translation_key=CONF_SENSOR_GROUPS,
+        )
+    ),
+    vol.Required(
+        CONF_PROFILE,
+        default=DEFAULT_PROFILE,
+    ): SelectSelector(
+        SelectSelectorConfig(
+            options=list(PROFILES),
+            mode=SelectSelectorMode.DROPDOWN,
+            translation_key=CONF_PROFILE,
+        )
+    ),
+    **{
+        vol.Optional(interval): NumberSelector(
+            NumberSelectorConfig(
+                min=0,
+                step=1,
+                mode=NumberSelectorMode.BOX,
+                unit_of_measurement="Minutes",
+            )
+        )
+        for interval in (
+            CONF_CONTAINERS_INTERVAL,
+            CONF_STATS_INTERVAL,
+            CONF_IMAGES_INTERVAL,
+            CONF_VOLUMES_INTERVAL,
+            CONF_DISK_USAGE_INTERVAL,
+        )
+    },
+    vol.Optional(CONF_MAX_PARALLEL_STATS): NumberSelector(
+        NumberSelectorConfig(min=1, max=64, step=1, mode=NumberSelectorMode.BOX)
+    ),
+    vol.Optional(CONF_STATS_BUDGET): NumberSelector(
+        NumberSelectorConfig(min=0, step=1, mode=NumberSelectorMode.BOX)
+    ),
+    vol.Optional(CONF_FULL_SWEEP_INTERVAL): NumberSelector(
+        NumberSelectorConfig(
+            min=0, step=1, mode=NumberSelectorMode.BOX, unit_of_measurement="Minutes"
+        )
+    ),
+    vol.Optional(CONF_TIMEOUT): NumberSelector(
+        NumberSelectorConfig(
+            min=1, step=1, mode=NumberSelectorMode.BOX, unit_of_measurement="Seconds"
+        )
+    ),
+    vol.Required(CONF_LOCAL_CGROUP_STATS, default=False): BooleanSelector(),
+    vol.Required(
+        CONF_CPU_NORMALIZATION,
+        default=DEFAULT_CPU_NORMALIZATION,
+    ): SelectSelector(
+        SelectSelectorConfig(
+            options=CPU_NORMALIZATIONS,
+            mode=SelectSelectorMode.DROPDOWN,
+            translation_key=CONF_CPU_NORMALIZATION,
+        )
+    ),
+    vol.Required(CONF_CONTAINER_SENSORS, default=False): BooleanSelector(),
+    vol.Required(
+        CONF_CONTAINER_SENSORS_MAX, default=DEFAULT_CONTAINER_SENSORS_MAX
+    ): NumberSelector(
+        NumberSelectorConfig(min=1, max=500, step=1, mode=NumberSelectorMode.BOX)
+    ),
+    vol.Optional(CONF_CONTAINER_SENSORS_INCLUDE): TextSelector(
+        TextSelectorConfig(multiple=True)
+    ),
+    vol.Optional(CONF_CONTAINER_SENSORS_EXCLUDE): TextSelector(
+        TextSelectorConfig(multiple=True)
+    ),
+    vol.Required(CONF_GROUP_SENSORS, default=False): BooleanSelector(),
+    vol.Required(CONF_GROUP_LABEL, default=DEFAULT_GROUP_LABEL): TextSelector(),
+    **{
+        vol.Optional(container_filter): TextSelector(TextSelectorConfig(multiple=True))
+        for container_filter in (
+            CONF_INCLUDE_PROJECTS,
+            CONF_EXCLUDE_PROJECTS,
+            CONF_INCLUDE_LABELS,
+            CONF_EXCLUDE_LABELS,
+            CONF_INCLUDE_NAMES,
+            CONF_EXCLUDE_NAMES,
+        )
+    },
 }
 
 
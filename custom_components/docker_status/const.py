@@ -9,9 +9,56 @@ LOGGER: Logger = getLogger(__name__)
 DOMAIN = "docker_status"
 
 DOMAIN_NAME = "Docker status"
+STORAGE_KEY_SNAPSHOT = f"{DOMAIN}.snapshot"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 600
 DEFAULT_SCAN_INTERVAL = 5
 DEFAULT_CHECK_FOR_UPDATED_IMAGES = 6
 
+# -- Events fired on the event bus when containers change between listings
+EVENT_CONTAINER_STARTED = f"{DOMAIN}_container_started"
+EVENT_CONTAINER_STOPPED = f"{DOMAIN}_container_stopped"
+EVENT_CONTAINER_REMOVED = f"{DOMAIN}_container_removed"
+EVENT_CONTAINER_IMAGE_CHANGED = f"{DOMAIN}_container_image_changed"
+
+ATTR_ENGINES = "engines"
+ATTR_DRY_RUN = "dry_run"
+ATTR_LABEL = "label"
+ATTR_UNTIL = "until"
+ATTR_SECTIONS = "sections"
+ATTR_TIERS = "tiers"
+
+# -- Prune types, each has a prune_<type> action
+PRUNE_IMAGES = "images"
+PRUNE_CONTAINERS = "containers"
+PRUNE_VOLUMES = "volumes"
+PRUNE_NETWORKS = "networks"
+PRUNE_BUILD_CACHE = "build_cache"
+PRUNE_TYPES = [
+    PRUNE_IMAGES,
+    PRUNE_CONTAINERS,
+    PRUNE_VOLUMES,
+    PRUNE_NETWORKS,
+    PRUNE_BUILD_CACHE,
+]
+
+# -- Sections of the get_snapshot action and the snapshot keys in each
+SNAPSHOT_SECTIONS: dict[str, list[str]] = {
+    "values": ["values", "values_uom"],
+    "containers": ["containers_running", "containers_stopped"],
+    "health": [
+        "containers_unhealthy",
+        "containers_starting",
+        "containers_restarting",
+        "containers_restart_loop",
+    ],
+    "images": ["images_unused", "images_with_updates"],
+    "volumes": ["volumes_unused"],
+    "container_stats": ["container_stats"],
+    "groups": ["groups"],
+    "prune_candidates": ["prune_candidates"],
+}
+
 TRANSLATION_KEY = DOMAIN
 TRANSLATION_KEY_CONNECTION_ERROR = "connection_error"
 
@@ -21,6 +68,87 @@ CONF_DOCKER_ENGINE_URL = "docker_engine_url"
 CONF_DOCKER_ENV_SENSOR_NAME = "docker_env_sensor_name"
 CONF_INDEX = "index"
 CONF_SENSORS = "sensors"
+CONF_SENSOR_GROUPS = "sensor_groups"
+CONF_PROFILE = "profile"
+CONF_CONTAINERS_INTERVAL = "containers_interval"
+CONF_STATS_INTERVAL = "stats_interval"
+CONF_IMAGES_INTERVAL = "images_interval"
+CONF_VOLUMES_INTERVAL = "volumes_interval"
+CONF_DISK_USAGE_INTERVAL = "disk_usage_interval"
+CONF_MAX_PARALLEL_STATS = "max_parallel_stats"
+CONF_STATS_BUDGET = "stats_budget"
+CONF_FULL_SWEEP_INTERVAL = "full_sweep_interval"
+CONF_TIMEOUT = "timeout"
+CONF_LOCAL_CGROUP_STATS = "local_cgroup_stats"
+CONF_CPU_NORMALIZATION = "cpu_normalization"
+CONF_CHECK_FOR_IMAGES_UPDATES = "check_for_images_updates"
+CONF_CONTAINER_SENSORS = "container_sensors"
+CONF_CONTAINER_SENSORS_MAX = "container_sensors_max"
+CONF_CONTAINER_SENSORS_INCLUDE = "container_sensors_include"
+CONF_CONTAINER_SENSORS_EXCLUDE = "container_sensors_exclude"
+CONF_GROUP_SENSORS = "group_sensors"
+CONF_GROUP_LABEL = "group_label"
+CONF_INCLUDE_LABELS = "include_labels"
+CONF_EXCLUDE_LABELS = "exclude_labels"
+CONF_INCLUDE_NAMES = "include_names"
+CONF_EXCLUDE_NAMES = "exclude_names"
+CONF_INCLUDE_PROJECTS = "include_projects"
+CONF_EXCLUDE_PROJECTS = "exclude_projects"
+
+CONF_TOP_N = "top_n"
+CONF_CHECK_FOR_UPDATED_IMAGES_HOURS = "check_for_updated_images_hours"
+CONF_ROLLING_WINDOW = "rolling_window"
+
+# -- CPU % normalization. Host is relative to the whole machine, core and
+# docker are 100 % per core, with the core count as docker stats finds it.
+CPU_NORMALIZATION_HOST = "host"
+CPU_NORMALIZATION_CORE = "core"
+CPU_NORMALIZATION_DOCKER = "docker"
+CPU_NORMALIZATIONS = [
+    CPU_NORMALIZATION_HOST,
+    CPU_NORMALIZATION_CORE,
+    CPU_NORMALIZATION_DOCKER,
+]
+DEFAULT_CPU_NORMALIZATION = CPU_NORMALIZATION_HOST
+
+DEFAULT_CONTAINER_SENSORS_MAX = 25
+DEFAULT_GROUP_LABEL = "com.docker.compose.project"
+DEFAULT_TOP_N = 5
+MAX_PARALLEL_REGISTRY_REQUESTS = 4
+DEFAULT_ROLLING_WINDOW = 60
+MAX_ROLLING_WINDOW_SAMPLES = 1440
+
+# -- A container restarted this many times within the window is in a loop
+RESTART_LOOP_THRESHOLD = 3
+RESTART_LOOP_WINDOW = 600
+
+# -- Engine events are counted in one minute buckets. The sensors count the
+# -- last hour, the longer windows are attributes and size the buckets kept.
+EVENTS_WINDOW = 3600
+EVENTS_ATTRIBUTE_WINDOWS: dict[str, int] = {
+    "Last 6 hours": 21600,
+    "Last 24 hours": 86400,
+}
+EVENTS_BUCKET_SECONDS = 60
+EVENTS_BUCKETS = (
+    max(EVENTS_WINDOW, *EVENTS_ATTRIBUTE_WINDOWS.values()) // EVENTS_BUCKET_SECONDS
+)
+EVENTS_RECENT = 10
+
+# -- A collection overruns when it takes longer than the interval. The stats
+# -- sample is then sized to take this part of the interval.
+OVERRUN_TARGET_RATIO = 0.5
+MIN_STATS_SAMPLE = 5
+
+# -- Limits of the change applied to the cached usage of unsampled containers
+SAMPLE_RATIO_MIN = 0.5
+SAMPLE_RATIO_MAX = 2.0
+
+# -- Seconds between live stats messages to websocket subscribers
+DEFAULT_LIVE_STATS_INTERVAL = 5
+MIN_LIVE_STATS_INTERVAL = 1
+MAX_LIVE_STATS_INTERVAL = 300
+MAX_LIVE_STATS_PENDING = 16
 
 SENSOR_CONTAINERS_RUNNING = "Containers running"
 SENSOR_CONTAINERS_STOPPED = "Containers stopped"
@@ -29,9 +157,50 @@ SENSOR_CONTAINERS_MEMORY_USAGE = "Containers mem. usage"
 SENSOR_IMAGES = "Images"
 SENSOR_IMAGES_UNUSED = "Images unused"
 SENSOR_IMAGES_DANGLING = "Images dangling"
+SENSOR_IMAGES_WITH_UPDATES = "Images with updates"
 SENSOR_VOLUMES = "Volumes"
 SENSOR_VOLUMES_UNUSED = "Volumes unused"
+SENSOR_CONTAINERS_CPU_PERCENT_MEAN = "Containers CPU % mean"
+SENSOR_CONTAINERS_CPU_PERCENT_MAX = "Containers CPU % max"
+SENSOR_CONTAINERS_CPU_PERCENT_P95 = "Containers CPU % p95"
+SENSOR_CONTAINERS_MEMORY_USAGE_MEAN = "Containers mem. usage mean"
+SENSOR_CONTAINERS_MEMORY_USAGE_MAX = "Containers mem. usage max"
+SENSOR_CONTAINERS_MEMORY_USAGE_P95 = "Containers mem. usage p95"
+SENSOR_CONTAINERS_NETWORK_RX = "Containers network RX"
+SENSOR_CONTAINERS_NETWORK_TX = "Containers network TX"
+SENSOR_CONTAINERS_DISK_READ = "Containers disk read"
+SENSOR_CONTAINERS_DISK_WRITE = "Containers disk write"
+SENSOR_IMAGES_SIZE = "Images size"
+SENSOR_IMAGES_RECLAIMABLE = "Images reclaimable"
+SENSOR_VOLUMES_SIZE = "Volumes size"
+SENSOR_CONTAINERS_SIZE = "Containers writable size"
+SENSOR_BUILD_CACHE_SIZE = "Build cache size"
+SENSOR_CONTAINERS_UNHEALTHY = "Containers unhealthy"
+SENSOR_CONTAINERS_STARTING = "Containers starting"
+SENSOR_CONTAINERS_RESTARTING = "Containers restarting"
+SENSOR_CONTAINERS_RESTART_LOOP = "Containers in restart loop"
+SENSOR_CONTAINERS_OOM_KILLED = "Containers OOM killed"
+SENSOR_CONTAINERS_CRASHED = "Containers crashed"
+SENSOR_COLLECTION_OVERRUNS = "Collection overruns"
+SENSOR_TOP_CPU_PERCENT = "Top containers CPU %"
+SENSOR_TOP_MEMORY_USAGE = "Top containers mem. usage"
+
+# -- Per container sensors
+SENSOR_CONTAINER_CPU_PERCENT = "CPU %"
+SENSOR_CONTAINER_MEMORY_USAGE = "Mem. usage"
 
+CONTAINER_SENSORS = [
+    SENSOR_CONTAINER_CPU_PERCENT,
+    SENSOR_CONTAINER_MEMORY_USAGE,
+]
+
+# -- Per group sensors, containers grouped by Compose project or a label
+GROUP_SENSORS = [
+    SENSOR_CONTAINERS_RUNNING,
+    SENSOR_CONTAINERS_STOPPED,
+    SENSOR_CONTAINERS_CPU_PERCENT,
+    SENSOR_CONTAINERS_MEMORY_USAGE,
+]
 
 DOCKER_SENSORS = [
     SENSOR_CONTAINERS_RUNNING,
@@ -41,10 +210,247 @@ DOCKER_SENSORS = [
     SENSOR_IMAGES,
     SENSOR_IMAGES_UNUSED,
     SENSOR_IMAGES_DANGLING,
+    SENSOR_IMAGES_WITH_UPDATES,
     SENSOR_VOLUMES,
     SENSOR_VOLUMES_UNUSED,
+    SENSOR_CONTAINERS_CPU_PERCENT_MEAN,
+    SENSOR_CONTAINERS_CPU_PERCENT_MAX,
+    SENSOR_CONTAINERS_CPU_PERCENT_P95,
+    SENSOR_CONTAINERS_MEMORY_USAGE_MEAN,
+    SENSOR_CONTAINERS_MEMORY_USAGE_MAX,
+    SENSOR_CONTAINERS_MEMORY_USAGE_P95,
+    SENSOR_CONTAINERS_NETWORK_RX,
+    SENSOR_CONTAINERS_NETWORK_TX,
+    SENSOR_CONTAINERS_DISK_READ,
+    SENSOR_CONTAINERS_DISK_WRITE,
+    SENSOR_IMAGES_SIZE,
+    SENSOR_IMAGES_RECLAIMABLE,
+    SENSOR_VOLUMES_SIZE,
+    SENSOR_CONTAINERS_SIZE,
+    SENSOR_BUILD_CACHE_SIZE,
+    SENSOR_CONTAINERS_UNHEALTHY,
+    SENSOR_CONTAINERS_STARTING,
+    SENSOR_CONTAINERS_RESTARTING,
+    SENSOR_CONTAINERS_RESTART_LOOP,
+    SENSOR_CONTAINERS_OOM_KILLED,
+    SENSOR_CONTAINERS_CRASHED,
+    SENSOR_COLLECTION_OVERRUNS,
 ]
 
+# -- Diagnostic sensors, created for every engine
+DIAGNOSTIC_SENSORS: list[str] = [SENSOR_COLLECTION_OVERRUNS]
+
+# -- Health sensors, all from the container listing
+SENSOR_HEALTH: list[str] = [
+    SENSOR_CONTAINERS_UNHEALTHY,
+    SENSOR_CONTAINERS_STARTING,
+    SENSOR_CONTAINERS_RESTARTING,
+    SENSOR_CONTAINERS_RESTART_LOOP,
+]
+
+# -- Event sensors, fed by the engine events stream
+SENSOR_EVENTS: list[str] = [
+    SENSOR_CONTAINERS_OOM_KILLED,
+    SENSOR_CONTAINERS_CRASHED,
+]
+
+# -- Disk usage sensors, all from one disk usage query
+SENSOR_DISK_USAGE: list[str] = [
+    SENSOR_IMAGES_SIZE,
+    SENSOR_IMAGES_RECLAIMABLE,
+    SENSOR_VOLUMES_SIZE,
+    SENSOR_CONTAINERS_SIZE,
+    SENSOR_BUILD_CACHE_SIZE,
+]
+
+# -- Throughput sensors, in the order of the counters read from the stats
+SENSOR_IO: list[str] = [
+    SENSOR_CONTAINERS_NETWORK_RX,
+    SENSOR_CONTAINERS_NETWORK_TX,
+    SENSOR_CONTAINERS_DISK_READ,
+    SENSOR_CONTAINERS_DISK_WRITE,
+]
+
+SENSOR_GROUP_CONTAINERS = "containers"
+SENSOR_GROUP_CPU_MEMORY = "cpu_memory"
+SENSOR_GROUP_IMAGES = "images"
+SENSOR_GROUP_VOLUMES = "volumes"
+SENSOR_GROUP_ROLLING = "rolling"
+SENSOR_GROUP_IO = "io"
+SENSOR_GROUP_DISK_USAGE = "disk_usage"
+SENSOR_GROUP_HEALTH = "health"
+SENSOR_GROUP_EVENTS = "events"
+
+SENSOR_GROUPS: dict[str, list[str]] = {
+    SENSOR_GROUP_CONTAINERS: [
+        SENSOR_CONTAINERS_RUNNING,
+        SENSOR_CONTAINERS_STOPPED,
+    ],
+    SENSOR_GROUP_CPU_MEMORY: [
+        SENSOR_CONTAINERS_CPU_PERCENT,
+        SENSOR_CONTAINERS_MEMORY_USAGE,
+    ],
+    SENSOR_GROUP_IMAGES: [
+        SENSOR_IMAGES,
+        SENSOR_IMAGES_UNUSED,
+        SENSOR_IMAGES_DANGLING,
+    ],
+    SENSOR_GROUP_VOLUMES: [
+        SENSOR_VOLUMES,
+        SENSOR_VOLUMES_UNUSED,
+    ],
+    SENSOR_GROUP_ROLLING: [
+        SENSOR_CONTAINERS_CPU_PERCENT_MEAN,
+        SENSOR_CONTAINERS_CPU_PERCENT_MAX,
+        SENSOR_CONTAINERS_CPU_PERCENT_P95,
+        SENSOR_CONTAINERS_MEMORY_USAGE_MEAN,
+        SENSOR_CONTAINERS_MEMORY_USAGE_MAX,
+        SENSOR_CONTAINERS_MEMORY_USAGE_P95,
+    ],
+    SENSOR_GROUP_IO: SENSOR_IO,
+    SENSOR_GROUP_DISK_USAGE: SENSOR_DISK_USAGE,
+    SENSOR_GROUP_HEALTH: SENSOR_HEALTH,
+    SENSOR_GROUP_EVENTS: SENSOR_EVENTS,
+}
+
+DEFAULT_SENSOR_GROUPS = [
+    SENSOR_GROUP_CONTAINERS,
+    SENSOR_GROUP_CPU_MEMORY,
+    SENSOR_GROUP_IMAGES,
+    SENSOR_GROUP_VOLUMES,
+]
+
+# -- Docker engine endpoints a sensor type depends on
+ENDPOINT_CONTAINERS = "containers"
+ENDPOINT_STATS = "stats"
+ENDPOINT_IMAGES = "images"
+ENDPOINT_IMAGES_DANGLING = "images_dangling"
+ENDPOINT_IMAGE_UPDATES = "image_updates"
+ENDPOINT_VOLUMES = "volumes"
+ENDPOINT_DISK_USAGE = "disk_usage"
+
+SENSOR_ENDPOINTS: dict[str, list[str]] = {
+    SENSOR_CONTAINERS_RUNNING: [ENDPOINT_CONTAINERS],
+    SENSOR_CONTAINERS_STOPPED: [ENDPOINT_CONTAINERS],
+    SENSOR_CONTAINERS_CPU_PERCENT: [ENDPOINT_CONTAINERS, ENDPOINT_STATS],
+    SENSOR_CONTAINERS_MEMORY_USAGE: [ENDPOINT_CONTAINERS, ENDPOINT_STATS],
+    SENSOR_IMAGES: [ENDPOINT_IMAGES],
+    SENSOR_IMAGES_UNUSED: [ENDPOINT_CONTAINERS, ENDPOINT_IMAGES],
+    SENSOR_IMAGES_DANGLING: [ENDPOINT_IMAGES_DANGLING],
+    SENSOR_IMAGES_WITH_UPDATES: [ENDPOINT_CONTAINERS, ENDPOINT_IMAGE_UPDATES],
+    SENSOR_VOLUMES: [ENDPOINT_VOLUMES],
+    SENSOR_VOLUMES_UNUSED: [ENDPOINT_CONTAINERS, ENDPOINT_VOLUMES],
+    SENSOR_CONTAINERS_CPU_PERCENT_MEAN: [ENDPOINT_CONTAINERS, ENDPOINT_STATS],
+    SENSOR_CONTAINERS_CPU_PERCENT_MAX: [ENDPOINT_CONTAINERS, ENDPOINT_STATS],
+    SENSOR_CONTAINERS_CPU_PERCENT_P95: [ENDPOINT_CONTAINERS, ENDPOINT_STATS],
+    SENSOR_CONTAINERS_MEMORY_USAGE_MEAN: [ENDPOINT_CONTAINERS, ENDPOINT_STATS],
+    SENSOR_CONTAINERS_MEMORY_USAGE_MAX: [ENDPOINT_CONTAINERS, ENDPOINT_STATS],
+    SENSOR_CONTAINERS_MEMORY_USAGE_P95: [ENDPOINT_CONTAINERS, ENDPOINT_STATS],
+    SENSOR_CONTAINERS_NETWORK_RX: [ENDPOINT_CONTAINERS, ENDPOINT_STATS],
+    SENSOR_CONTAINERS_NETWORK_TX: [ENDPOINT_CONTAINERS, ENDPOINT_STATS],
+    SENSOR_CONTAINERS_DISK_READ: [ENDPOINT_CONTAINERS, ENDPOINT_STATS],
+    SENSOR_CONTAINERS_DISK_WRITE: [ENDPOINT_CONTAINERS, ENDPOINT_STATS],
+    SENSOR_IMAGES_SIZE: [ENDPOINT_DISK_USAGE],
+    SENSOR_IMAGES_RECLAIMABLE: [ENDPOINT_DISK_USAGE],
+    SENSOR_VOLUMES_SIZE: [ENDPOINT_DISK_USAGE],
+    SENSOR_CONTAINERS_SIZE: [ENDPOINT_DISK_USAGE],
+    SENSOR_BUILD_CACHE_SIZE: [ENDPOINT_DISK_USAGE],
+    SENSOR_CONTAINERS_UNHEALTHY: [ENDPOINT_CONTAINERS],
+    SENSOR_CONTAINERS_STARTING: [ENDPOINT_CONTAINERS],
+    SENSOR_CONTAINERS_RESTARTING: [ENDPOINT_CONTAINERS],
+    SENSOR_CONTAINERS_RESTART_LOOP: [ENDPOINT_CONTAINERS],
+    SENSOR_CONTAINERS_OOM_KILLED: [],
+    SENSOR_CONTAINERS_CRASHED: [],
+    SENSOR_COLLECTION_OVERRUNS: [],
+}
+
+# -- Rolling window sensors, the source sensor type and statistic
+SENSOR_ROLLING: dict[str, tuple[str, str]] = {
+    SENSOR_CONTAINERS_CPU_PERCENT_MEAN: (SENSOR_CONTAINERS_CPU_PERCENT, "mean"),
+    SENSOR_CONTAINERS_CPU_PERCENT_MAX: (SENSOR_CONTAINERS_CPU_PERCENT, "max"),
+    SENSOR_CONTAINERS_CPU_PERCENT_P95: (SENSOR_CONTAINERS_CPU_PERCENT, "p95"),
+    SENSOR_CONTAINERS_MEMORY_USAGE_MEAN: (SENSOR_CONTAINERS_MEMORY_USAGE, "mean"),
+    SENSOR_CONTAINERS_MEMORY_USAGE_MAX: (SENSOR_CONTAINERS_MEMORY_USAGE, "max"),
+    SENSOR_CONTAINERS_MEMORY_USAGE_P95: (SENSOR_CONTAINERS_MEMORY_USAGE, "p95"),
+}
+
+# -- Collection profiles. Intervals are in minutes, 0 means every scan.
+PROFILE_LIGHT = "light"
+PROFILE_STANDARD = "standard"
+PROFILE_AGGRESSIVE = "aggressive"
+DEFAULT_PROFILE = PROFILE_STANDARD
+
+PROFILES: dict[str, dict[str, int]] = {
+    PROFILE_LIGHT: {
+        CONF_CONTAINERS_INTERVAL: 15,
+        CONF_STATS_INTERVAL: 30,
+        CONF_IMAGES_INTERVAL: 60,
+        CONF_VOLUMES_INTERVAL: 60,
+        CONF_DISK_USAGE_INTERVAL: 360,
+        CONF_MAX_PARALLEL_STATS: 1,
+        CONF_STATS_BUDGET: 0,
+        CONF_FULL_SWEEP_INTERVAL: 60,
+        CONF_TIMEOUT: 60,
+    },
+    PROFILE_STANDARD: {
+        CONF_CONTAINERS_INTERVAL: 0,
+        CONF_STATS_INTERVAL: 0,
+        CONF_IMAGES_INTERVAL: 0,
+        CONF_VOLUMES_INTERVAL: 0,
+        CONF_DISK_USAGE_INTERVAL: 60,
+        CONF_MAX_PARALLEL_STATS: 4,
+        CONF_STATS_BUDGET: 0,
+        CONF_FULL_SWEEP_INTERVAL: 60,
+        CONF_TIMEOUT: 30,
+    },
+    PROFILE_AGGRESSIVE: {
+        CONF_CONTAINERS_INTERVAL: 1,
+        CONF_STATS_INTERVAL: 1,
+        CONF_IMAGES_INTERVAL: 0,
+        CONF_VOLUMES_INTERVAL: 0,
+        CONF_DISK_USAGE_INTERVAL: 30,
+        CONF_MAX_PARALLEL_STATS: 16,
+        CONF_STATS_BUDGET: 0,
+        CONF_FULL_SWEEP_INTERVAL: 60,
+        CONF_TIMEOUT: 15,
+    },
+}
+
+PROFILE_OVERRIDES = [
+    CONF_CONTAINERS_INTERVAL,
+    CONF_STATS_INTERVAL,
+    CONF_IMAGES_INTERVAL,
+    CONF_VOLUMES_INTERVAL,
+    CONF_DISK_USAGE_INTERVAL,
+    CONF_MAX_PARALLEL_STATS,
+    CONF_STATS_BUDGET,
+    CONF_FULL_SWEEP_INTERVAL,
+    CONF_TIMEOUT,
+]
+
+# -- Tiers the update action can refresh and the endpoints of each
+REFRESH_TIERS: dict[str, list[str]] = {
+    "containers": [ENDPOINT_CONTAINERS],
+    "stats": [ENDPOINT_CONTAINERS, ENDPOINT_STATS],
+    "images": [ENDPOINT_IMAGES, ENDPOINT_IMAGES_DANGLING],
+    "image_updates": [ENDPOINT_CONTAINERS, ENDPOINT_IMAGE_UPDATES],
+    "volumes": [ENDPOINT_VOLUMES],
+    "disk_usage": [ENDPOINT_DISK_USAGE],
+}
+
+# -- Seconds refresh requests are collected before they're run
+REFRESH_DEBOUNCE = 1.0
+
+ENDPOINT_INTERVALS: dict[str, str] = {
+    ENDPOINT_CONTAINERS: CONF_CONTAINERS_INTERVAL,
+    ENDPOINT_STATS: CONF_STATS_INTERVAL,
+    ENDPOINT_IMAGES: CONF_IMAGES_INTERVAL,
+    ENDPOINT_IMAGES_DANGLING: CONF_IMAGES_INTERVAL,
+    ENDPOINT_IMAGE_UPDATES: CONF_IMAGES_INTERVAL,
+    ENDPOINT_VOLUMES: CONF_VOLUMES_INTERVAL,
+    ENDPOINT_DISK_USAGE: CONF_DISK_USAGE_INTERVAL,
+}
+
 DOCKER_SENSORS_SUM = [
     SENSOR_CONTAINERS_RUNNING,
     SENSOR_CONTAINERS_STOPPED,
@@ -53,4 +459,30 @@ DOCKER_SENSORS_SUM = [
     SENSOR_IMAGES_DANGLING,
     SENSOR_VOLUMES,
     SENSOR_VOLUMES_UNUSED,
+    SENSOR_CONTAINERS_UNHEALTHY,
+    SENSOR_CONTAINERS_RESTART_LOOP,
+    SENSOR_CONTAINERS_OOM_KILLED,
+    SENSOR_CONTAINERS_CRASHED,
+    SENSOR_TOP_CPU_PERCENT,
+    SENSOR_TOP_MEMORY_USAGE,
 ]
+
+# -- Endpoints refreshed after a prune, pruned containers free images and volumes
+PRUNE_REFRESH_ENDPOINTS: dict[str, list[str]] = {
+    PRUNE_IMAGES: [ENDPOINT_IMAGES, ENDPOINT_IMAGES_DANGLING, ENDPOINT_DISK_USAGE],
+    PRUNE_CONTAINERS: [
+        ENDPOINT_CONTAINERS,
+        ENDPOINT_IMAGES,
+        ENDPOINT_VOLUMES,
+        ENDPOINT_DISK_USAGE,
+    ],
+    PRUNE_VOLUMES: [ENDPOINT_VOLUMES, ENDPOINT_DISK_USAGE],
+    PRUNE_NETWORKS: [],
+    PRUNE_BUILD_CACHE: [ENDPOINT_DISK_USAGE],
+}
+
+# -- Summary sensors computed from the containers behind an engine sensor type
+SENSOR_SUM_SOURCES: dict[str, str] = {
+    SENSOR_TOP_CPU_PERCENT: SENSOR_CONTAINERS_CPU_PERCENT,
+    SENSOR_TOP_MEMORY_USAGE: SENSOR_CONTAINERS_MEMORY_USAGE,
+}
@@ -0,0 +1,192 @@
+"""Container selection by labels, names and Compose project.
+
+As much as possible is pushed down to the filters of the container listing,
+so the engine only returns, and inspects, the selected containers. The rest
+is matched client side with matchers compiled once per engine.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from fnmatch import translate
+import re
+
+COMPOSE_PROJECT_LABEL = "com.docker.compose.project"
+
+
+# ------------------------------------------------------------------
+def compile_patterns(patterns: list[str] | None) -> re.Pattern | None:
+    """Compile shell style patterns into one case insensitive matcher."""
+
+    if not patterns:
+        return None
+
+    return re.compile(
+        "|".join(translate(pattern.strip()) for pattern in patterns),
+        re.IGNORECASE,
+    )
+
+
+# ------------------------------------------------------------------
+def parse_labels(labels: list[str] | None) -> list[tuple[str, str | None]]:
+    """Labels as key or key=value into key and value pairs."""
+
+    parsed: list[tuple[str, str | None]] = []
+
+    for label in labels or []:
+        key, separator, value = label.strip().partition("=")
+
+        if key:
+            parsed.append((key, value if separator else None))
+
+    return parsed
+
+
+# ------------------------------------------------------------------
+def pattern_to_engine_regex(pattern: str) -> str | None:
+    """Engine name filter for a shell style pattern.
+
+    The engine matches the name filter as a regular expression against the
+    name with a leading slash, case insensitive like the client side matcher.
+    Patterns with character classes are left to the client side matcher.
+    """
+
+    if "[" in pattern:
+        return None
+
+    return (
+        "(?i)^/?"
+        + "".join(
+            ".*" if char == "*" else "." if char == "?" else re.escape(char)
+            for char in pattern.strip()
+        )
+        + "$"
+    )
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass
+class ContainerFilter:
+    """Include and exclude filters for the containers of an engine.
+
+    Included labels must all match, included names and projects match if
+    any of them does. Excludes remove containers matching any of them.
+    """
+
+    include_labels: list[tuple[str, str | None]] = field(default_factory=list)
+    exclude_labels: list[tuple[str, str | None]] = field(default_factory=list)
+    include_names: list[str] = field(default_factory=list)
+    exclude_names: list[str] = field(default_factory=list)
+    include_projects: set[str] = field(default_factory=set)
+    exclude_projects: set[str] = field(default_factory=set)
+
+    def __post_init__(self) -> None:
+        """Compile the matchers and the engine filters."""
+        self.include_names_matcher: re.Pattern | None = compile_patterns(
+            self.include_names
+        )
+        self.exclude_names_matcher: re.Pattern | None = compile_patterns(
+            self.exclude_names
+        )
+        self.engine_filters: dict[str, list[str]] = self.build_engine_filters()
+
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_config(
+        cls,
+        include_labels: list[str] | None = None,
+        exclude_labels: list[str] | None = None,
+        include_names: list[str] | None = None,
+        exclude_names: list[str] | None = None,
+        include_projects: list[str] | None = None,
+        exclude_projects: list[str] | None = None,
+    ) -> ContainerFilter:
+        """Container filter from the engine options."""
+
+        return cls(
+            parse_labels(include_labels),
+            parse_labels(exclude_labels),
+            [name.strip() for name in include_names or [] if name.strip()],
+            [name.strip() for name in exclude_names or [] if name.strip()],
+            {project.strip() for project in include_projects or [] if project.strip()},
+            {project.strip() for project in exclude_projects or [] if project.strip()},
+        )
+
+    # ------------------------------------------------------------------
+    def is_empty(self) -> bool:
+        """Are all containers selected."""
+
+        return not (
+            self.include_labels
+            or self.exclude_labels
+            or self.include_names
+            or self.exclude_names
+            or self.include_projects
+            or self.exclude_projects
+        )
+
+    # ------------------------------------------------------------------
+    def build_engine_filters(self) -> dict[str, list[str]]:
+        """Filters the engine can apply to the container listing.
+
+        Label filters are and'ed by the engine, so a single included project
+        can be pushed down as a label, but several can't. Name filters are
+        or'ed, like the included name patterns.
+        """
+
+        filters: dict[str, list[str]] = {}
+        labels: list[str] = [
+            key if value is None else f"{key}={value}"
+            for key, value in self.include_labels
+        ]
+
+        if len(self.include_projects) == 1:
+            labels.append(
+                f"{COMPOSE_PROJECT_LABEL}={next(iter(self.include_projects))}"
+            )
+
+        if labels:
+            filters["label"] = labels
+
+        names: list[str | None] = [
+            pattern_to_engine_regex(pattern) for pattern in self.include_names
+        ]
+
+        if names and None not in names:
+            filters["name"] = names
+
+        return filters
+
+    # ------------------------------------------------------------------
+    def matches(self, name: str, labels: dict[str, str] | None) -> bool:
+        """Is a container selected, all filters are checked client side."""
+
+        labels = labels or {}
+
+        for key, value in self.include_labels:
+            if key not in labels or (value is not None and labels[key] != value):
+                return False
+
+        for key, value in self.exclude_labels:
+            if key in labels and (value is None or labels[key] == value):
+                return False
+
+        project: str | None = labels.get(COMPOSE_PROJECT_LABEL)
+
+        if self.include_projects and project not in self.include_projects:
+            return False
+
+        if project is not None and project in self.exclude_projects:
+            return False
+
+        if (
+            self.include_names_matcher is not None
+            and self.include_names_matcher.match(name) is None
+        ):
+            return False
+
+        return (
+            self.exclude_names_matcher is None
+            or self.exclude_names_matcher.match(name) is None
+        )
@@ -0,0 +1,16 @@
+"""Lazy import of the docker package.
+
+docker (and paramiko for ssh engines) is imported on first use, normally from
+an executor job creating the docker client, so loading the integration doesn't
+pay for it.
+"""
+
+from __future__ import annotations
+
+
+# ------------------------------------------------------------------
+def docker_exception() -> type[Exception]:
+    """Docker base exception class."""
+    from docker.errors import DockerException  # noqa: PLC0415
+
+    return DockerException
@@ -0,0 +1,140 @@
+"""Counters fed by the events stream of a Docker engine.
+
+Short lived crashes happen between refreshes, so polling the container
+listing can't see them. The engine events stream reports them as they
+happen, filtered by the engine to the event types counted.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable
+import threading
+import time
+from typing import Any
+
+from .const import LOGGER
+from .docker_import import docker_exception
+
+EVENTS_RETRY_INTERVAL = 30
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class EventCounter:
+    """Event counts in fixed size time buckets.
+
+    The buckets are reused in a ring, so memory is bounded by the longest
+    window counted, no matter how many events there are.
+    """
+
+    __slots__ = ("bucket_seconds", "counts", "size", "slots")
+
+    def __init__(self, bucket_seconds: int, size: int) -> None:
+        """Init."""
+        self.bucket_seconds: int = max(bucket_seconds, 1)
+        self.size: int = max(size, 1)
+        self.counts: array = array("L", bytes(array("L").itemsize * self.size))
+        self.slots: array = array("q", [-1] * self.size)
+
+    # ------------------------------------------------------------------
+    def add(self, timestamp: float) -> None:
+        """Count an event at a timestamp."""
+
+        bucket: int = int(timestamp // self.bucket_seconds)
+        index: int = bucket % self.size
+
+        if self.slots[index] != bucket:
+            self.slots[index] = bucket
+            self.counts[index] = 0
+
+        self.counts[index] += 1
+
+    # ------------------------------------------------------------------
+    def count(self, window: float, now: float | None = None) -> int:
+        """Events within the window, up to the window the buckets cover."""
+
+        bucket: int = int((time.time() if now is None else now) // self.bucket_seconds)
+        buckets: int = min(int(window // self.bucket_seconds), self.size)
+
+        return sum(
+            count
+            for slot, count in zip(self.slots, self.counts, strict=True)
+            if 0 <= bucket - slot < buckets
+        )
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class EventsStream:
+    """Events stream of an engine, read in a thread of its own.
+
+    The stream blocks until the engine sends an event, so it can't be read
+    in the executor. It's reopened if the engine goes away, asking for the
+    events since the last one received, so none are lost or counted twice.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        filters: dict[str, Any],
+        callback: Callable[[dict[str, Any]], None],
+        name: str,
+    ) -> None:
+        """Init."""
+        self.client: Any = client
+        self.filters: dict[str, Any] = filters
+        self.callback: Callable[[dict[str, Any]], None] = callback
+        self.stop_event: threading.Event = threading.Event()
+        self.stream: Any = None
+        self.since: int | None = None
+        self.last_time_nano: int = 0
+        self.thread: threading.Thread = threading.Thread(
+            target=self.run, name=name, daemon=True
+        )
+
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        """Start reading the stream."""
+
+        self.thread.start()
+
+    # ------------------------------------------------------------------
+    def stop(self) -> None:
+        """Stop reading, closing the stream wakes up the thread."""
+
+        self.stop_event.set()
+
+        if self.stream is not None:
+            try:
+                self.stream.close()
+            except OSError:
+                pass
+
+    # ------------------------------------------------------------------
+    def run(self) -> None:
+        """Read events until stopped."""
+
+        while not self.stop_event.is_set():
+            try:
+                self.stream = self.client.events(
+                    since=self.since, filters=self.filters, decode=True
+                )
+
+                for event in self.stream:
+                    time_nano: int = event.get("timeNano", 0)
+
+                    # Reopened streams repeat the events of the last second
+                    if time_nano and time_nano <= self.last_time_nano:
+                        continue
+
+                    self.last_time_nano = time_nano
+                    self.since = event.get("time", self.since)
+                    self.callback(event)
+
+            except (docker_exception(), OSError) as err:
+                if not self.stop_event.is_set():
+                    LOGGER.debug("Events stream error, %s", err)
+
+            self.stream = None
+            self.stop_event.wait(EVENTS_RETRY_INTERVAL)
@@ -8,8 +8,14 @@ External imports:
     storage_json: jsonpickle
     timer_trigger: None
     translate: aiofiles, orjson
+
+The storage_json, timer_trigger and translate modules are imported on first
+use, so the external imports are only paid for by integrations using them.
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .config_update import (
     check_supress_config_update_listener,
     set_supress_config_update_listener,
@@ -29,9 +35,33 @@ from .hass_util import (
     object_to_state_attr_dict,
 )
 from .json_ext import DictToObject, JsonExt
-from .storage_json import StorageJson, StoreMigrate
-from .timer_trigger import TimerTrigger, TimerTriggerErrorEnum
-from .translate import NumberSelectorConfigTranslate, Translate
+
+if TYPE_CHECKING:
+    from .storage_json import StorageJson, StoreMigrate
+    from .timer_trigger import TimerTrigger, TimerTriggerErrorEnum
+    from .translate import NumberSelectorConfigTranslate, Translate
+
+_LAZY_IMPORTS: dict[str, str] = {
+    "StorageJson": ".storage_json",
+    "StoreMigrate": ".storage_json",
+    "TimerTrigger": ".timer_trigger",
+    "TimerTriggerErrorEnum": ".timer_trigger",
+    "NumberSelectorConfigTranslate": ".translate",
+    "Translate": ".translate",
+}
+
+
+# ------------------------------------------------------------------
+def __getattr__(name: str) -> Any:
+    """Import lazy loaded attributes on first use."""
+
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "ArgumentException",
@@ -1,14 +1,13 @@
 """Json storage.
 
-External imports: jsonpickle
+External imports: jsonpickle, imported on first use. Storing a plain dict with
+the StorageJson base class doesn't need it.
 """
 
 from collections.abc import Callable
 import inspect
 from typing import Any
 
-import jsonpickle
-
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.storage import Store
 
@@ -86,7 +85,6 @@ class StorageJson:
 
         if type(data) is dict:
             if self.DICT_KEY___ in data:
-                jsonpickle.set_encoder_options("json", ensure_ascii=False)
                 tmp_obj = self.decode_data(data[self.DICT_KEY___])
                 del data[self.DICT_KEY___]
 
@@ -105,14 +103,15 @@ class StorageJson:
     # ------------------------------------------------------------------
     def decode_data(self, data: Any):
         """Decode data."""
+        import jsonpickle  # noqa: PLC0415
+
+        jsonpickle.set_encoder_options("json", ensure_ascii=False)
         return jsonpickle.decode(data)
 
     # ------------------------------------------------------------------
     async def async_write_settings(self, extra_data: dict = {}) -> None:
         """Write settings."""
 
-        jsonpickle.set_encoder_options("json", ensure_ascii=False)
-
         if self.base_class___:
             await self.store___.async_save(extra_data)
 
@@ -121,9 +120,22 @@ class StorageJson:
                 {self.DICT_KEY___: self.encode_data(self), **extra_data}
             )
 
+    # ------------------------------------------------------------------
+    def delay_write_settings(self, data_func: Callable[[], dict], delay: float) -> None:
+        """Write settings after a delay, writes within the delay are merged.
+
+        Only for the StorageJson base class, pending data is written when
+        Home Assistant stops.
+        """
+
+        self.store___.async_delay_save(data_func, delay)
+
     # ------------------------------------------------------------------
     def encode_data(self, data: Any):
         """Encode data."""
+        import jsonpickle  # noqa: PLC0415
+
+        jsonpickle.set_encoder_options("json", ensure_ascii=False)
         return jsonpickle.encode(data, unpicklable=True)
 
     # ------------------------------------------------------------------
@@ -0,0 +1,305 @@
+"""Image update check against the registry manifest digest.
+
+The local repo digests of an image are compared with the digest the registry
+returns for the tag. Only HEAD requests are used, so manifests are never
+downloaded, and Docker Hub doesn't count them against the pull rate limit.
+Digests are cached per registry, repository and tag, and refreshed with a
+conditional request when the cache entry has expired.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+import re
+import time
+
+from aiohttp import ClientError, ClientSession, ClientTimeout
+
+from .const import LOGGER
+
+DOCKER_HUB_REGISTRY = "docker.io"
+DOCKER_HUB_REGISTRY_ALIASES = ["index.docker.io", "registry-1.docker.io"]
+DOCKER_HUB_REGISTRY_HOST = "registry-1.docker.io"
+
+# -- Registries reached over plain http, as the Docker engine does by default
+INSECURE_REGISTRY_HOSTS = ["localhost", "127.0.0.1", "[::1]"]
+
+MANIFEST_ACCEPT = ", ".join(
+    [
+        "application/vnd.oci.image.index.v1+json",
+        "application/vnd.docker.distribution.manifest.list.v2+json",
+        "application/vnd.oci.image.manifest.v1+json",
+        "application/vnd.docker.distribution.manifest.v2+json",
+    ]
+)
+
+CHALLENGE_PARAM = re.compile(r'(\w+)="([^"]*)"')
+
+
+# ------------------------------------------------------------------
+def split_repository(name: str) -> tuple[str, str]:
+    """Split an image name without tag or digest into registry and repository."""
+
+    registry: str = DOCKER_HUB_REGISTRY
+    repository: str = name
+    first, separator, rest = name.partition("/")
+
+    if separator and ("." in first or ":" in first or first == "localhost"):
+        registry, repository = first, rest
+
+    if registry in DOCKER_HUB_REGISTRY_ALIASES:
+        registry = DOCKER_HUB_REGISTRY
+
+    if registry == DOCKER_HUB_REGISTRY and "/" not in repository:
+        repository = f"library/{repository}"
+
+    return registry, repository
+
+
+# ------------------------------------------------------------------
+def parse_image_reference(reference: str) -> tuple[str, str, str] | None:
+    """Registry, repository and tag of an image reference.
+
+    References pinned to a digest can't be updated and return None.
+    """
+
+    name, _, digest = reference.partition("@")
+
+    if digest:
+        return None
+
+    tag: str = "latest"
+    colon: int = name.rfind(":")
+
+    if colon > name.rfind("/"):
+        name, tag = name[:colon], name[colon + 1 :]
+
+    return (*split_repository(name), tag)
+
+
+# ------------------------------------------------------------------
+def local_digests(repo_digests: list[str], registry: str, repository: str) -> set[str]:
+    """Digests from the RepoDigests of an image matching a repository."""
+
+    digests: set[str] = set()
+
+    for repo_digest in repo_digests:
+        name, _, digest = repo_digest.partition("@")
+
+        if digest and split_repository(name) == (registry, repository):
+            digests.add(digest)
+
+    return digests
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass
+class CachedDigest:
+    """Registry digest of a tag and when it was checked."""
+
+    digest: str | None
+    etag: str | None
+    checked: float
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class RegistryDigestResolver:
+    """Resolve the manifest digest of image tags from their registries.
+
+    Requests are limited per registry, lookups of the same tag are done once,
+    and failed lookups are cached as well, so an unreachable registry isn't
+    asked again until the cache entry expires.
+    """
+
+    def __init__(
+        self,
+        session: ClientSession,
+        ttl: float,
+        max_parallel: int = 4,
+        timeout: float = 30,
+        schemes: dict[str, str] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Init."""
+        self.session: ClientSession = session
+        self.ttl: float = ttl
+        self.max_parallel: int = max_parallel
+        self.timeout: ClientTimeout = ClientTimeout(total=timeout)
+        self.schemes: dict[str, str] = schemes or {}
+        self.clock: Callable[[], float] = clock
+        self.cache: dict[tuple[str, str, str], CachedDigest] = {}
+        self.tokens: dict[tuple[str, str], tuple[str, float]] = {}
+        self.semaphores: dict[str, asyncio.Semaphore] = {}
+        self.locks: dict[tuple[str, str, str], asyncio.Lock] = {}
+
+    # ------------------------------------------------------------------
+    def registry_url(self, registry: str) -> str:
+        """Base url of a registry."""
+
+        host: str = (
+            DOCKER_HUB_REGISTRY_HOST if registry == DOCKER_HUB_REGISTRY else registry
+        )
+        scheme: str | None = self.schemes.get(registry)
+
+        if scheme is None:
+            hostname: str = (
+                host.rpartition(":")[0] if host.rpartition(":")[2].isdigit() else host
+            )
+            scheme = "http" if hostname in INSECURE_REGISTRY_HOSTS else "https"
+
+        return f"{scheme}://{host}"
+
+    # ------------------------------------------------------------------
+    async def async_get_digest(
+        self, registry: str, repository: str, tag: str
+    ) -> str | None:
+        """Manifest digest of a tag, from the cache while it hasn't expired."""
+
+        key: tuple[str, str, str] = (registry, repository, tag)
+
+        if key not in self.locks:
+            self.locks[key] = asyncio.Lock()
+
+        async with self.locks[key]:
+            cached: CachedDigest | None = self.cache.get(key)
+
+            if cached is not None and self.clock() - cached.checked < self.ttl:
+                return cached.digest
+
+            if registry not in self.semaphores:
+                self.semaphores[registry] = asyncio.Semaphore(self.max_parallel)
+
+            async with self.semaphores[registry]:
+                self.cache[key] = await self.async_fetch_digest(key, cached)
+
+            return self.cache[key].digest
+
+    # ------------------------------------------------------------------
+    async def async_fetch_digest(
+        self, key: tuple[str, str, str], cached: CachedDigest | None
+    ) -> CachedDigest:
+        """Ask the registry for the digest of a tag."""
+
+        registry, repository, tag = key
+        headers: dict[str, str] = {"Accept": MANIFEST_ACCEPT}
+
+        if cached is not None and cached.etag is not None:
+            headers["If-None-Match"] = cached.etag
+
+        try:
+            status, digest, etag = await self.async_head(
+                registry,
+                repository,
+                f"{self.registry_url(registry)}/v2/{repository}/manifests/{tag}",
+                headers,
+            )
+        except (ClientError, TimeoutError) as err:
+            LOGGER.debug("Error checking %s/%s:%s: %s", registry, repository, tag, err)
+            status, digest, etag = 0, None, None
+
+        if status == 304 and cached is not None:
+            return CachedDigest(cached.digest, cached.etag, self.clock())
+
+        if status != 200:
+            if status != 0:
+                LOGGER.debug(
+                    "Registry returned %s for %s/%s:%s",
+                    status,
+                    registry,
+                    repository,
+                    tag,
+                )
+
+            # Keep the last known digest until the registry answers again
+            return CachedDigest(
+                None if cached is None else cached.digest,
+                None if cached is None else cached.etag,
+                self.clock(),
+            )
+
+        return CachedDigest(digest, etag, self.clock())
+
+    # ------------------------------------------------------------------
+    async def async_head(
+        self, registry: str, repository: str, url: str, headers: dict[str, str]
+    ) -> tuple[int, str | None, str | None]:
+        """HEAD request for a manifest, with a bearer token if the registry asks."""
+
+        scope: str = f"repository:{repository}:pull"
+        challenge: str = ""
+
+        for _ in range(2):
+            request_headers: dict[str, str] = dict(headers)
+            token: tuple[str, float] | None = self.tokens.get((registry, scope))
+
+            if token is not None and token[1] > self.clock():
+                request_headers["Authorization"] = f"Bearer {token[0]}"
+            elif challenge:
+                token_value: str | None = await self.async_fetch_token(
+                    registry, scope, challenge
+                )
+
+                if token_value is None:
+                    return (401, None, None)
+
+                request_headers["Authorization"] = f"Bearer {token_value}"
+
+            async with self.session.head(
+                url, headers=request_headers, timeout=self.timeout
+            ) as response:
+                if response.status != 401 or challenge:
+                    return (
+                        response.status,
+                        response.headers.get("Docker-Content-Digest"),
+                        response.headers.get("ETag"),
+                    )
+
+                challenge = response.headers.get("WWW-Authenticate", "")
+                self.tokens.pop((registry, scope), None)
+
+                if not challenge.lower().startswith("bearer "):
+                    return (response.status, None, None)
+
+        return (401, None, None)
+
+    # ------------------------------------------------------------------
+    async def async_fetch_token(
+        self, registry: str, scope: str, challenge: str
+    ) -> str | None:
+        """Anonymous pull token from the auth service named in the challenge."""
+
+        params: dict[str, str] = dict(CHALLENGE_PARAM.findall(challenge))
+        realm: str | None = params.pop("realm", None)
+
+        if realm is None:
+            return None
+
+        params.setdefault("scope", scope)
+
+        try:
+            async with self.session.get(
+                realm, params=params, timeout=self.timeout
+            ) as response:
+                if response.status != 200:
+                    return None
+
+                data: dict = await response.json(content_type=None)
+
+        except (ClientError, TimeoutError, ValueError) as err:
+            LOGGER.debug("Error getting registry token for %s: %s", registry, err)
+            return None
+
+        token: str | None = data.get("token") or data.get("access_token")
+
+        if token is not None:
+            # Renew a little before the token expires
+            self.tokens[(registry, scope)] = (
+                token,
+                self.clock() + max(int(data.get("expires_in", 60)) - 10, 10),
+            )
+
+        return token
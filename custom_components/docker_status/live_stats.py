@@ -0,0 +1,312 @@
+"""Live container stats pushed to websocket subscribers.
+
+The stats are read once per tick for all subscribers due, apart from the
+scheduled collection, and each subscriber only gets what changed since the
+last message it was sent, at the interval it asked for. A subscriber whose
+connection has messages piling up is skipped, and gets all the changes in
+one message once it has caught up. Reading stops when the last subscriber
+is gone.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import time
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    ATTR_ENGINES,
+    DEFAULT_LIVE_STATS_INTERVAL,
+    DOMAIN,
+    LOGGER,
+    MAX_LIVE_STATS_INTERVAL,
+    MAX_LIVE_STATS_PENDING,
+    MIN_LIVE_STATS_INTERVAL,
+)
+from .docker_import import docker_exception
+
+if TYPE_CHECKING:
+    from .component_api import ComponentApi
+
+ATTR_CONTAINERS = "containers"
+ATTR_INTERVAL = "interval"
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass
+class LiveStatsSubscriber:
+    """Subscriber of live stats and what it has been sent."""
+
+    engines: set[str]
+    containers: set[str] | None
+    interval: float
+    send: Callable[[dict[str, Any]], None]
+    pending: Callable[[], int] = lambda: 0
+    sent: dict[str, dict[str, list[float]]] = field(default_factory=dict)
+    next_send: float = 0.0
+
+    # ------------------------------------------------------------------
+    def delta(
+        self, engine_name: str, usage: dict[str, tuple[float, int]]
+    ) -> dict[str, Any] | None:
+        """Changes since the last message for an engine, None if none."""
+
+        current: dict[str, list[float]] = {
+            container_name: [round(cpu_percent, 2), memory_usage]
+            for container_name, (cpu_percent, memory_usage) in usage.items()
+            if self.containers is None or container_name in self.containers
+        }
+        current[""] = [
+            round(sum(cpu_percent for cpu_percent, _ in usage.values()), 2),
+            sum(memory_usage for _, memory_usage in usage.values()),
+        ]
+        sent: dict[str, list[float]] = self.sent.get(engine_name, {})
+        changed: dict[str, list[float]] = {
+            key: value for key, value in current.items() if sent.get(key) != value
+        }
+        removed: list[str] = [key for key in sent if key not in current]
+        self.sent[engine_name] = current
+
+        if not changed and not removed:
+            return None
+
+        delta: dict[str, Any] = {}
+
+        if "" in changed:
+            delta["total"] = changed.pop("")
+
+        if changed:
+            delta["containers"] = changed
+
+        if removed:
+            delta["removed"] = removed
+
+        return delta
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class LiveStatsHub:
+    """Fan out live stats of the engines of a config entry to subscribers."""
+
+    def __init__(self, component_api: ComponentApi) -> None:
+        """Init."""
+        self.component_api: ComponentApi = component_api
+        self.subscribers: list[LiveStatsSubscriber] = []
+        self.wakeup: asyncio.Event = asyncio.Event()
+        self.task: asyncio.Task | None = None
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_subscribe(self, subscriber: LiveStatsSubscriber) -> Callable[[], None]:
+        """Add a subscriber, collection starts with the first one."""
+
+        self.subscribers.append(subscriber)
+        self.wakeup.set()
+
+        if self.task is None:
+            self.task = self.component_api.entry.async_create_background_task(
+                self.component_api.hass, self.async_run(), f"{DOMAIN} live stats"
+            )
+
+        @callback
+        def async_unsubscribe() -> None:
+            if subscriber in self.subscribers:
+                self.subscribers.remove(subscriber)
+
+            # Collection stops when nobody is subscribed
+            if not self.subscribers and self.task is not None:
+                self.task.cancel()
+                self.task = None
+
+        return async_unsubscribe
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_stop(self) -> None:
+        """Drop all subscribers, so none keep the api of an unloaded entry."""
+
+        self.subscribers.clear()
+
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    # ------------------------------------------------------------------
+    async def async_run(self) -> None:
+        """Read and send to the subscribers due, until none are left.
+
+        An error is logged and the subscribers are tried again next tick, so
+        one bad read doesn't end live stats for all of them.
+        """
+
+        try:
+            while self.subscribers:
+                self.wakeup.clear()
+                now: float = time.monotonic()
+                due: list[LiveStatsSubscriber] = [
+                    subscriber
+                    for subscriber in self.subscribers
+                    if subscriber.next_send <= now
+                ]
+
+                if due:
+                    try:
+                        await self.component_api.async_collect_live_stats(
+                            set().union(*(subscriber.engines for subscriber in due))
+                        )
+
+                        for subscriber in due:
+                            self.send_delta(subscriber)
+
+                    except (TimeoutError, docker_exception(), OSError) as err:
+                        LOGGER.debug("Error reading live stats, %s", err)
+
+                    for subscriber in due:
+                        subscriber.next_send = time.monotonic() + subscriber.interval
+
+                if not self.subscribers:
+                    break
+
+                try:
+                    async with asyncio.timeout(
+                        max(
+                            min(subscriber.next_send for subscriber in self.subscribers)
+                            - time.monotonic(),
+                            0,
+                        )
+                    ):
+                        await self.wakeup.wait()
+                except TimeoutError:
+                    pass
+
+        finally:
+            # A new task may have been started after this one was cancelled
+            if self.task is asyncio.current_task():
+                self.task = None
+
+    # ------------------------------------------------------------------
+    def send_delta(self, subscriber: LiveStatsSubscriber) -> None:
+        """Send the changes of the engines of a subscriber, if any.
+
+        Nothing is sent while the connection is backed up. What was sent is
+        only updated when sending, so the next message has all the changes.
+        """
+
+        if subscriber.pending() > MAX_LIVE_STATS_PENDING:
+            return
+
+        engines: dict[str, Any] = {}
+
+        for engine_name in subscriber.engines:
+            delta: dict[str, Any] | None = subscriber.delta(
+                engine_name,
+                self.component_api.env_sensors[engine_name].live_usage,
+            )
+
+            if delta is not None:
+                engines[engine_name] = delta
+
+        if engines:
+            subscriber.send({"engines": engines})
+
+
+# ------------------------------------------------------------------
+@callback
+def async_setup_websocket(hass: HomeAssistant) -> None:
+    """Register the websocket commands, once for all config entries."""
+
+    websocket_api.async_register_command(hass, websocket_subscribe_stats)
+
+
+# ------------------------------------------------------------------
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe_stats",
+        vol.Optional(ATTR_ENGINES): [str],
+        vol.Optional(ATTR_CONTAINERS): [str],
+        vol.Optional(ATTR_INTERVAL, default=DEFAULT_LIVE_STATS_INTERVAL): vol.All(
+            vol.Coerce(float),
+            vol.Range(min=MIN_LIVE_STATS_INTERVAL, max=MAX_LIVE_STATS_INTERVAL),
+        ),
+    }
+)
+@callback
+def websocket_subscribe_stats(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Subscribe to live CPU % and memory usage of engines and containers.
+
+    The first message has all values, the next only what changed.
+    """
+
+    engine_names: set[str] | None = (
+        set(msg[ATTR_ENGINES]) if ATTR_ENGINES in msg else None
+    )
+    containers: set[str] | None = (
+        set(msg[ATTR_CONTAINERS]) if ATTR_CONTAINERS in msg else None
+    )
+    unsubscribes: list[Callable[[], None]] = []
+    found: set[str] = set()
+
+    @callback
+    def send(data: dict[str, Any]) -> None:
+        connection.send_message(websocket_api.event_message(msg["id"], data))
+
+    # The send queue isn't public, without it nothing counts as pending
+    handler: Any = getattr(connection.send_message, "__self__", None)
+
+    @callback
+    def pending() -> int:
+        return len(getattr(handler, "_message_queue", None) or ())
+
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        if entry.state is not ConfigEntryState.LOADED:
+            continue
+
+        component_api: ComponentApi = entry.runtime_data.component_api
+        engines: set[str] = {
+            engine_name
+            for engine_name in component_api.env_sensors
+            if engine_names is None or engine_name in engine_names
+        }
+
+        if engines:
+            found |= engines
+            unsubscribes.append(
+                component_api.live_stats.async_subscribe(
+                    LiveStatsSubscriber(
+                        engines, containers, msg[ATTR_INTERVAL], send, pending
+                    )
+                )
+            )
+
+    if engine_names is not None and engine_names - found:
+        for unsubscribe in unsubscribes:
+            unsubscribe()
+
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_NOT_FOUND,
+            f"Unknown docker environment: {', '.join(sorted(engine_names - found))}",
+        )
+        return
+
+    @callback
+    def async_unsubscribe_all() -> None:
+        for unsubscribe in unsubscribes:
+            unsubscribe()
+
+    connection.subscriptions[msg["id"]] = async_unsubscribe_all
+    connection.send_result(msg["id"])
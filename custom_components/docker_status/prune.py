@@ -0,0 +1,175 @@
+"""Prune candidates, filters and results.
+
+Candidates are kept from the last collection, so a dry run can report what
+a prune would remove without calling the engine. The label and until
+filters are evaluated the same way the Docker engine does.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+import re
+import time
+from typing import Any
+
+from .const import (
+    ATTR_LABEL,
+    ATTR_UNTIL,
+    PRUNE_BUILD_CACHE,
+    PRUNE_CONTAINERS,
+    PRUNE_IMAGES,
+    PRUNE_NETWORKS,
+    PRUNE_VOLUMES,
+)
+
+# -- Filters the engine supports for each prune type
+PRUNE_FILTERS: dict[str, list[str]] = {
+    PRUNE_IMAGES: [ATTR_LABEL, ATTR_UNTIL],
+    PRUNE_CONTAINERS: [ATTR_LABEL, ATTR_UNTIL],
+    PRUNE_VOLUMES: [ATTR_LABEL],
+    PRUNE_NETWORKS: [ATTR_LABEL, ATTR_UNTIL],
+    PRUNE_BUILD_CACHE: [ATTR_UNTIL],
+}
+
+# -- Key of the removed objects in the prune response
+PRUNE_DELETED_KEYS: dict[str, str] = {
+    PRUNE_IMAGES: "ImagesDeleted",
+    PRUNE_CONTAINERS: "ContainersDeleted",
+    PRUNE_VOLUMES: "VolumesDeleted",
+    PRUNE_NETWORKS: "NetworksDeleted",
+    PRUNE_BUILD_CACHE: "CachesDeleted",
+}
+
+DURATION = re.compile(r"(?:\d+(?:\.\d+)?(?:ms|h|m|s))+")
+DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+DURATION_SECONDS: dict[str, float] = {"h": 3600, "m": 60, "s": 1, "ms": 0.001}
+DOCKER_TIME = re.compile(r"^(.*?)(\.\d+)?(Z|[+-]\d\d:\d\d)?$")
+
+
+# ------------------------------------------------------------------
+def parse_docker_time(value: str | None) -> float:
+    """Timestamp of a time from the engine, which has up to nanoseconds."""
+
+    if not value:
+        return 0.0
+
+    match: re.Match | None = DOCKER_TIME.match(value)
+
+    if match is None:
+        return 0.0
+
+    base, fraction, zone = match.groups()
+
+    try:
+        return datetime.fromisoformat(
+            f"{base}{(fraction or '')[:7]}{'+00:00' if zone in (None, 'Z') else zone}"
+        ).timestamp()
+    except ValueError:
+        return 0.0
+
+
+# ------------------------------------------------------------------
+def parse_until(until: str, now: float | None = None) -> float:
+    """Timestamp of an until filter.
+
+    Accepts a duration like 24h or 1h30m, a unix timestamp or a date/time,
+    like the Docker engine. Raises ValueError if it can't be parsed.
+    """
+
+    until = until.strip()
+
+    if DURATION.fullmatch(until):
+        return (time.time() if now is None else now) - sum(
+            float(amount) * DURATION_SECONDS[unit]
+            for amount, unit in DURATION_PART.findall(until)
+        )
+
+    try:
+        return float(until)
+    except ValueError:
+        pass
+
+    return datetime.fromisoformat(until).timestamp()
+
+
+# ------------------------------------------------------------------
+def build_filters(prune_type: str, data: dict[str, Any]) -> dict[str, Any]:
+    """Engine filters for a prune type from the service data."""
+
+    filters: dict[str, Any] = {
+        key: data[key] for key in PRUNE_FILTERS[prune_type] if data.get(key)
+    }
+
+    # Remove all unused images, not only dangling images
+    if prune_type == PRUNE_IMAGES:
+        filters["dangling"] = False
+
+    return filters
+
+
+# ------------------------------------------------------------------
+def parse_prune_result(prune_type: str, result: dict | None) -> dict[str, Any]:
+    """Reclaimed bytes and removed ids from a prune response."""
+
+    result = result or {}
+    deleted: list = result.get(PRUNE_DELETED_KEYS[prune_type]) or []
+
+    return {
+        "reclaimed_bytes": result.get("SpaceReclaimed") or 0,
+        "removed": [item["Deleted"] for item in deleted if "Deleted" in item]
+        if prune_type == PRUNE_IMAGES
+        else list(deleted),
+    }
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass
+class PruneCandidate:
+    """Object a prune would remove, as of the last collection."""
+
+    size: int = 0
+    created: float = 0.0
+    labels: dict[str, str] = field(default_factory=dict)
+
+    # ------------------------------------------------------------------
+    def matches(self, labels: list[str] | None, until: float | None) -> bool:
+        """Does the candidate match the label and until filters."""
+
+        if until is not None and self.created >= until:
+            return False
+
+        for label in labels or []:
+            key, separator, value = label.partition("=")
+
+            if key not in self.labels or (separator and self.labels[key] != value):
+                return False
+
+        return True
+
+    # ------------------------------------------------------------------
+    def to_dict(self) -> dict[str, Any]:
+        """As a json serializable dict."""
+
+        return asdict(self)
+
+
+# ------------------------------------------------------------------
+def dry_run_result(
+    candidates: dict[str, PruneCandidate],
+    labels: list[str] | None,
+    until: float | None,
+) -> dict[str, Any]:
+    """Reclaimed bytes and removed ids a prune would give."""
+
+    matched: dict[str, PruneCandidate] = {
+        candidate_id: candidate
+        for candidate_id, candidate in candidates.items()
+        if candidate.matches(labels, until)
+    }
+
+    return {
+        "reclaimed_bytes": sum(candidate.size for candidate in matched.values()),
+        "removed": list(matched),
+    }
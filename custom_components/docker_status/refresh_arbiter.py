@@ -0,0 +1,157 @@
+"""Coalesced and debounced refresh requests.
+
+Refreshes asked for by actions and entities are collected for a short
+delay and run as one refresh per engine. Requests made while a refresh is
+running are run once it's done, so requests never run in parallel and a
+burst of requests gives at most two refreshes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class RefreshRequest:
+    """What to refresh for an engine."""
+
+    __slots__ = ("due", "endpoints")
+
+    def __init__(self) -> None:
+        """Init."""
+        self.due: bool = False
+        self.endpoints: set[str] = set()
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class RefreshArbiter:
+    """Merge refresh requests and run them one batch at a time.
+
+    A request either updates the endpoints due for an engine, or refreshes
+    given endpoints whether they're due or not. Requests for the same engine
+    are merged, and callers wait until the refresh covering theirs is done.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        refresh: Callable[[dict[str, RefreshRequest]], Awaitable[None]],
+        delay: float,
+    ) -> None:
+        """Init."""
+        self.hass: HomeAssistant = hass
+        self.refresh: Callable[[dict[str, RefreshRequest]], Awaitable[None]] = refresh
+        self.delay: float = delay
+        self.pending: dict[str, RefreshRequest] = {}
+        self.waiters: list[asyncio.Future[None]] = []
+        self.timer: asyncio.TimerHandle | None = None
+        self.task: asyncio.Task | None = None
+
+    # ------------------------------------------------------------------
+    async def async_request(
+        self, engine_names: Iterable[str], endpoints: set[str] | None = None
+    ) -> None:
+        """Request a refresh and wait for it.
+
+        Without endpoints the endpoints due are updated, like a scheduled
+        update, otherwise the endpoints given are refreshed.
+        """
+
+        for engine_name in engine_names:
+            request: RefreshRequest = self.pending.setdefault(
+                engine_name, RefreshRequest()
+            )
+
+            if endpoints is None:
+                request.due = True
+            else:
+                request.endpoints |= endpoints
+
+        if not self.pending:
+            return
+
+        waiter: asyncio.Future[None] = self.hass.loop.create_future()
+        self.waiters.append(waiter)
+        self.schedule()
+
+        await waiter
+
+    # ------------------------------------------------------------------
+    @callback
+    def schedule(self) -> None:
+        """Start the delay, unless it or a refresh is running already.
+
+        The delay starts with the first request of a burst, so a steady
+        stream of requests can't postpone the refresh forever.
+        """
+
+        if self.timer is None and self.task is None:
+            self.timer = self.hass.loop.call_later(self.delay, self.start)
+
+    # ------------------------------------------------------------------
+    @callback
+    def start(self) -> None:
+        """Run the pending requests."""
+
+        self.timer = None
+        pending, self.pending = self.pending, {}
+        waiters, self.waiters = self.waiters, []
+        self.task = self.hass.async_create_background_task(
+            self.async_run(pending, waiters), f"{DOMAIN} refresh"
+        )
+
+    # ------------------------------------------------------------------
+    async def async_run(
+        self,
+        pending: dict[str, RefreshRequest],
+        waiters: list[asyncio.Future[None]],
+    ) -> None:
+        """Refresh, then release the waiters and run what came in meanwhile.
+
+        The waiters get the error of a failed refresh, so callers see it.
+        """
+
+        try:
+            await self.refresh(pending)
+
+        except Exception as err:
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(err)
+
+        finally:
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+
+            self.task = None
+
+            if self.pending:
+                self.schedule()
+
+    # ------------------------------------------------------------------
+    @callback
+    def cancel(self) -> None:
+        """Cancel pending requests, waiters are released."""
+
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+        if self.task is not None:
+            self.task.cancel()
+
+        self.pending = {}
+
+        for waiter in self.waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+        self.waiters = []
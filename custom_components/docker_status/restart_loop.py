@@ -0,0 +1,72 @@
+"""Restart loop detection from the restart count of the container listing.
+
+The restart count only grows when the engine restarts a container by its
+restart policy, so a count growing between refreshes means the container
+keeps exiting. Only the last count and the recent restart times are kept
+per container, nothing is asked from the engine beyond the listing.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import time
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class RestartLoopDetector:
+    """Flag containers restarted at least threshold times within the window."""
+
+    __slots__ = ("clock", "table", "threshold", "window")
+
+    def __init__(
+        self,
+        threshold: int,
+        window: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Init."""
+        self.threshold: int = max(threshold, 1)
+        self.window: float = window
+        self.clock: Callable[[], float] = clock
+        self.table: dict[str, tuple[int, list[float]]] = {}
+
+    # ------------------------------------------------------------------
+    def update(self, restart_counts: dict[str, int]) -> set[str]:
+        """Update with the restart counts by container id, returns the looping.
+
+        Containers no longer listed are dropped from the table. The first time
+        a container is seen only its count is recorded.
+        """
+
+        now: float = self.clock()
+        table: dict[str, tuple[int, list[float]]] = {}
+        looping: set[str] = set()
+
+        for container_id, restart_count in restart_counts.items():
+            previous: tuple[int, list[float]] | None = self.table.get(container_id)
+            restarts: list[float] = []
+
+            if previous is not None:
+                previous_count, previous_restarts = previous
+                restarts = [
+                    restarted
+                    for restarted in previous_restarts
+                    if now - restarted < self.window
+                ]
+
+                # The count is reset when the container is started by hand
+                if restart_count > previous_count:
+                    restarts.extend(
+                        [now] * min(restart_count - previous_count, self.threshold)
+                    )
+                    del restarts[: -self.threshold]
+
+            table[container_id] = (restart_count, restarts)
+
+            if len(restarts) >= self.threshold:
+                looping.add(container_id)
+
+        self.table = table
+
+        return looping
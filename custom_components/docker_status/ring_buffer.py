@@ -0,0 +1,72 @@
+"""Fixed size ring buffer for rolling window statistics."""
+
+from __future__ import annotations
+
+from array import array
+from math import ceil, fsum
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class RingBuffer:
+    """Fixed size ring buffer of float samples.
+
+    Samples are kept in an array, so memory is bounded by the size. Appending
+    and the mean are O(1), max and percentiles are computed over the window.
+    """
+
+    __slots__ = ("count", "index", "samples", "size", "total")
+
+    def __init__(self, size: int) -> None:
+        """Init."""
+        self.size: int = max(size, 1)
+        self.samples: array = array("d", bytes(8 * self.size))
+        self.index: int = 0
+        self.count: int = 0
+        self.total: float = 0.0
+
+    # ------------------------------------------------------------------
+    def append(self, value: float) -> None:
+        """Append sample, overwriting the oldest when full."""
+
+        if self.count == self.size:
+            self.total -= self.samples[self.index]
+        else:
+            self.count += 1
+
+        self.samples[self.index] = value
+        self.total += value
+        self.index = (self.index + 1) % self.size
+
+        # Recalculate the running total once per lap to avoid float drift
+        if self.index == 0:
+            self.total = fsum(self.samples)
+
+    # ------------------------------------------------------------------
+    def window(self) -> array:
+        """Samples in the buffer, not in insertion order."""
+
+        return self.samples if self.count == self.size else self.samples[: self.count]
+
+    # ------------------------------------------------------------------
+    def mean(self) -> float:
+        """Mean of the samples."""
+
+        return self.total / self.count if self.count > 0 else 0.0
+
+    # ------------------------------------------------------------------
+    def max(self) -> float:
+        """Max of the samples."""
+
+        return max(self.window()) if self.count > 0 else 0.0
+
+    # ------------------------------------------------------------------
+    def percentile(self, percent: float) -> float:
+        """Percentile of the samples, using the nearest rank method."""
+
+        if self.count == 0:
+            return 0.0
+
+        samples: list[float] = sorted(self.window())
+
+        return samples[max(ceil(percent / 100 * self.count) - 1, 0)]
@@ -2,23 +2,28 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Hashable
+
 from homeassistant.components.sensor import (  # SensorDeviceClass,; SensorEntityDescription,
     SensorEntity,
 )
-from homeassistant.const import CONF_UNIQUE_ID
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_UNIQUE_ID, EntityCategory
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import CommonConfigEntry
-from .component_api import ComponentApi
+from .component_api import ComponentApi, sensor_types_for_engine
 from .const import (
     CONF_DOCKER_BASE_NAME,
     CONF_DOCKER_BASE_NAME_USE_IN_SENSOR_NAME,
     CONF_DOCKER_ENGINE_URL,
     CONF_DOCKER_ENV_SENSOR_NAME,
     CONF_SENSORS,
-    DOCKER_SENSORS,
+    CONTAINER_SENSORS,
+    DIAGNOSTIC_SENSORS,
     DOCKER_SENSORS_SUM,
+    GROUP_SENSORS,
     TRANSLATION_KEY,
 )
 from .entity import ComponentEntity
@@ -46,7 +51,7 @@ async def async_setup_entry(
                 sensor[CONF_DOCKER_ENGINE_URL],
                 sensor[CONF_UNIQUE_ID],
             )
-            for docker_sensor in DOCKER_SENSORS
+            for docker_sensor in sensor_types_for_engine(sensor)
         )
 
     # -- Sum sensors
@@ -63,6 +68,114 @@ async def async_setup_entry(
 
     async_add_entities(sensors)
 
+    # -- Per container sensors, added and removed as containers come and go
+    component_api: ComponentApi = entry.runtime_data.component_api
+
+    def get_container_sensor_keys() -> set[tuple[str, str, str]]:
+        return {
+            (env_name, container_name, sensor_type)
+            for env_name in component_api.env_sensors
+            for container_name in component_api.get_container_names(env_name)
+            for sensor_type in CONTAINER_SENSORS
+        }
+
+    def create_container_sensor(key: tuple[str, str, str]) -> SensorEntity:
+        env_name, container_name, sensor_type = key
+
+        return DockerContainerSensor(
+            hass,
+            entry,
+            env_name,
+            container_name,
+            sensor_type,
+            component_api.env_sensors[env_name].unique_id,
+        )
+
+    container_sensors = DynamicSensors(
+        hass, async_add_entities, get_container_sensor_keys, create_container_sensor
+    )
+    container_sensors.async_update()
+    entry.async_on_unload(
+        entry.runtime_data.coordinator.async_add_listener(
+            container_sensors.async_update
+        )
+    )
+
+    # -- Per group sensors, added and removed as groups come and go
+    def get_group_sensor_keys() -> set[tuple[str, str, str]]:
+        return {
+            (env_name, group_name, sensor_type)
+            for env_name in component_api.env_sensors
+            for group_name in component_api.get_group_names(env_name)
+            for sensor_type in GROUP_SENSORS
+        }
+
+    def create_group_sensor(key: tuple[str, str, str]) -> SensorEntity:
+        env_name, group_name, sensor_type = key
+
+        return DockerGroupSensor(
+            hass,
+            entry,
+            env_name,
+            group_name,
+            sensor_type,
+            component_api.env_sensors[env_name].unique_id,
+        )
+
+    group_sensors = DynamicSensors(
+        hass, async_add_entities, get_group_sensor_keys, create_group_sensor
+    )
+    group_sensors.async_update()
+    entry.async_on_unload(
+        entry.runtime_data.coordinator.async_add_listener(group_sensors.async_update)
+    )
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class DynamicSensors:
+    """Sensors added and removed as their keys appear and vanish."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        async_add_entities: AddEntitiesCallback,
+        get_keys: Callable[[], set[Hashable]],
+        create_sensor: Callable[[Hashable], SensorEntity],
+    ) -> None:
+        """Dynamic sensors."""
+        self.hass: HomeAssistant = hass
+        self.async_add_entities: AddEntitiesCallback = async_add_entities
+        self.get_keys: Callable[[], set[Hashable]] = get_keys
+        self.create_sensor: Callable[[Hashable], SensorEntity] = create_sensor
+        self.sensors: dict[Hashable, SensorEntity] = {}
+
+    # ------------------------------------------------------
+    @callback
+    def async_update(self) -> None:
+        """Add new sensors in one batch and remove vanished sensors."""
+
+        keys: set[Hashable] = self.get_keys()
+
+        entity_registry: er.EntityRegistry = er.async_get(self.hass)
+
+        for key in self.sensors.keys() - keys:
+            sensor: SensorEntity = self.sensors.pop(key)
+
+            if sensor.registry_entry is not None:
+                entity_registry.async_remove(sensor.entity_id)
+            else:
+                self.hass.async_create_task(sensor.async_remove())
+
+        new_sensors: list[SensorEntity] = []
+
+        for key in keys - self.sensors.keys():
+            self.sensors[key] = self.create_sensor(key)
+            new_sensors.append(self.sensors[key])
+
+        if len(new_sensors) > 0:
+            self.async_add_entities(new_sensors)
+
 
 # ------------------------------------------------------
 # ------------------------------------------------------
@@ -95,6 +208,9 @@ class DockerSensor(ComponentEntity, SensorEntity):
 
         self.translation_key = TRANSLATION_KEY
 
+        if sensor_type in DIAGNOSTIC_SENSORS:
+            self._attr_entity_category = EntityCategory.DIAGNOSTIC
+
     # ------------------------------------------------------
     @property
     def name(self) -> str:
@@ -143,12 +259,15 @@ class DockerSensor(ComponentEntity, SensorEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.last_update_success
+        return (
+            self.coordinator.last_update_success
+            and self.component_api.is_engine_available(self.env_name)
+        )
 
     # ------------------------------------------------------
     async def async_update(self) -> None:
         """Update the entity. Only used by the generic entity update service."""
-        await self.coordinator.async_request_refresh()
+        await self.component_api.async_request_refresh([self.env_name])
 
     # ------------------------------------------------------
     async def async_added_to_hass(self) -> None:
@@ -218,9 +337,7 @@ class DockerSensorSum(ComponentEntity, SensorEntity):
     @property
     def extra_state_attributes(self) -> dict:
         """Extra state attributes."""
-        attr: dict = {}
-
-        return attr
+        return self.component_api.get_sum_extra_state_attributes(self.sensor_type)
 
     # ------------------------------------------------------
     @property
@@ -238,12 +355,15 @@ class DockerSensorSum(ComponentEntity, SensorEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.last_update_success
+        return (
+            self.coordinator.last_update_success
+            and self.component_api.is_any_engine_available()
+        )
 
     # ------------------------------------------------------
     async def async_update(self) -> None:
         """Update the entity. Only used by the generic entity update service."""
-        await self.coordinator.async_request_refresh()
+        await self.component_api.async_request_refresh()
 
     # ------------------------------------------------------
     async def async_added_to_hass(self) -> None:
@@ -251,3 +371,167 @@ class DockerSensorSum(ComponentEntity, SensorEntity):
         self.async_on_remove(
             self.coordinator.async_add_listener(self.async_write_ha_state)
         )
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class DockerEngineItemSensor(ComponentEntity, SensorEntity):
+    """Sensor base class for a container or group of an engine."""
+
+    # ------------------------------------------------------
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: CommonConfigEntry,
+        sensor_env_name: str,
+        sensor_type: str,
+        sensor_unigue_id: str,
+    ) -> None:
+        """Docker engine item sensor."""
+        super().__init__(entry.runtime_data.coordinator, entry)
+
+        self.hass: HomeAssistant = hass
+        self.component_api: ComponentApi = entry.runtime_data.component_api
+        self.coordinator = entry.runtime_data.coordinator
+        self.entry: CommonConfigEntry = entry
+        self.env_name = sensor_env_name
+        self.sensor_type: str = sensor_type
+        self._unique_id = sensor_unigue_id
+
+        self.translation_key = TRANSLATION_KEY
+
+    # ------------------------------------------------------
+    @property
+    def should_poll(self) -> bool:
+        """No need to poll. Coordinator notifies entity of updates."""
+        return False
+
+    # ------------------------------------------------------
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return (
+            self.coordinator.last_update_success
+            and self.component_api.is_engine_available(self.env_name)
+        )
+
+    # ------------------------------------------------------
+    async def async_update(self) -> None:
+        """Update the entity. Only used by the generic entity update service."""
+        await self.component_api.async_request_refresh([self.env_name])
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class DockerContainerSensor(DockerEngineItemSensor):
+    """Sensor class Docker container."""
+
+    # ------------------------------------------------------
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: CommonConfigEntry,
+        sensor_env_name: str,
+        container_name: str,
+        sensor_type: str,
+        sensor_unigue_id: str,
+    ) -> None:
+        """Docker container sensor."""
+        super().__init__(hass, entry, sensor_env_name, sensor_type, sensor_unigue_id)
+
+        self.container_name = container_name
+
+    # ------------------------------------------------------
+    @property
+    def name(self) -> str:
+        """Name."""
+        return f"{self.env_name} - {self.container_name} - {self.sensor_type}"
+
+    # ------------------------------------------------------
+    @property
+    def native_value(self) -> int | float | None:
+        """Native value."""
+        return self.component_api.get_container_value(
+            self.env_name, self.container_name, self.sensor_type
+        )[0]
+
+    # ------------------------------------------------------
+    @property
+    def native_unit_of_measurement(self) -> str | None:
+        """Return the unit the value is expressed in."""
+        return self.component_api.get_container_value(
+            self.env_name, self.container_name, self.sensor_type
+        )[1]
+
+    # ------------------------------------------------------
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Extra state attributes."""
+
+        return self.component_api.get_container_extra_state_attributes(
+            self.env_name, self.container_name, self.sensor_type
+        )
+
+    # ------------------------------------------------------
+    @property
+    def unique_id(self) -> str:
+        """Unique id."""
+        return f"{self._unique_id}{self.container_name}{self.sensor_type}"
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class DockerGroupSensor(DockerEngineItemSensor):
+    """Sensor class Docker group, containers by Compose project or label."""
+
+    # ------------------------------------------------------
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: CommonConfigEntry,
+        sensor_env_name: str,
+        group_name: str,
+        sensor_type: str,
+        sensor_unigue_id: str,
+    ) -> None:
+        """Docker group sensor."""
+        super().__init__(hass, entry, sensor_env_name, sensor_type, sensor_unigue_id)
+
+        self.group_name = group_name
+
+    # ------------------------------------------------------
+    @property
+    def name(self) -> str:
+        """Name."""
+        return f"{self.env_name} - {self.group_name} - {self.sensor_type}"
+
+    # ------------------------------------------------------
+    @property
+    def native_value(self) -> int | float | None:
+        """Native value."""
+        return self.component_api.get_group_value(
+            self.env_name, self.group_name, self.sensor_type
+        )[0]
+
+    # ------------------------------------------------------
+    @property
+    def native_unit_of_measurement(self) -> str | None:
+        """Return the unit the value is expressed in."""
+        return self.component_api.get_group_value(
+            self.env_name, self.group_name, self.sensor_type
+        )[1]
+
+    # ------------------------------------------------------
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Extra state attributes."""
+
+        return self.component_api.get_group_extra_state_attributes(
+            self.env_name, self.group_name, self.sensor_type
+        )
+
+    # ------------------------------------------------------
+    @property
+    def unique_id(self) -> str:
+        """Unique id."""
+        return f"{self._unique_id}group{self.group_name}{self.sensor_type}"
@@ -0,0 +1,79 @@
+"""Import-time benchmark for the Docker status integration.
+
+Imports the integration modules Home Assistant loads at setup in a fresh
+interpreter with ``-X importtime`` and reports the cumulative import time,
+and if any of the heavy third-party modules were loaded.
+
+Run from the repository root with Home Assistant installed:
+
+    python scripts/import_time.py [--runs 5]
+"""
+
+import argparse
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+
+MODULES = [
+    "custom_components.docker_status",
+    "custom_components.docker_status.config_flow",
+    "custom_components.docker_status.sensor",
+]
+HEAVY_MODULES = ["docker", "paramiko", "jsonpickle", "aiofiles", "orjson"]
+
+
+# ------------------------------------------------------------------
+def import_time(module: str) -> tuple[float, list[str]]:
+    """Cumulative import time in ms for module and the heavy modules loaded."""
+
+    code = (
+        "import sys; import homeassistant.core; "
+        f"import {module}; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=Path(__file__).resolve().parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = [part.strip() for part in line.split("|")]
+
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1000, [
+                heavy for heavy in result.stdout.strip().split(",") if heavy
+            ]
+
+    raise RuntimeError(f"No import time found for {module}")
+
+
+# ------------------------------------------------------------------
+def main() -> None:
+    """Run benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    for module in MODULES:
+        timings: list[float] = []
+        heavy: list[str] = []
+
+        for _ in range(args.runs):
+            ms, heavy = import_time(module)
+            timings.append(ms)
+
+        print(
+            f"{module}: median {statistics.median(timings):.1f} ms, "
+            f"min {min(timings):.1f} ms, "
+            f"heavy modules loaded: {', '.join(heavy) or 'none'}"
+        )
+
+
+if __name__ == "__main__":
+    main()